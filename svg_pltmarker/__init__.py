@@ -1,24 +1,149 @@
-from .path_converter import PathConverter, get_marker_from_svg
-from .svg_module import (
-    SVGCircle,
-    SVGEllipse,
-    SVGLine,
-    SVGObject,
-    SVGPath,
-    SVGPolygon,
-    SVGPolyline,
-    SVGRect,
-)
-
-__all__ = [
-    "SVGCircle",
-    "SVGEllipse",
-    "SVGLine",
-    "SVGPath",
-    "SVGPolygon",
-    "SVGPolyline",
-    "SVGRect",
-    "SVGObject",
-    "PathConverter",
-    "get_marker_from_svg",
-]
+# The public names are imported lazily on first access, so that importing the
+# package does not import matplotlib, NumPy, or pydantic until they are needed
+import importlib
+
+TYPE_CHECKING = False  # Avoid importing typing at runtime
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .bundle import MarkerBundle, write_bundle  # noqa: F401
+    from .cache import LRUCache, estimate_nbytes  # noqa: F401
+    from .icon_library import IconLibrary, IconLocation  # noqa: F401
+    from .incremental import (  # noqa: F401
+        IncrementalConverter,
+        ReuseStats,
+        element_hash,
+    )
+    from .marker_atlas import (  # noqa: F401
+        composite_sprites,
+        marker_hash,
+        rasterize_marker,
+        scatter_sprites,
+    )
+    from .metrics import Histogram, MetricsRegistry, metrics_registry  # noqa: F401
+    from .multi_marker import (  # noqa: F401
+        group_indices,
+        load_marker,
+        scatter_by_marker,
+    )
+    from .multicolor import (  # noqa: F401
+        MultiColorMarker,
+        get_multicolor_marker_from_svg,
+        scatter_multicolor,
+        svg_color_to_rgba,
+    )
+    from .path_converter import PathConverter, get_marker_from_svg  # noqa: F401
+    from .path_writer import plt2svg  # noqa: F401
+    from .probe import ProbeReport, probe  # noqa: F401
+    from .profiler import ConversionProfiler, PhaseTiming, ProfileReport  # noqa: F401
+    from .quantize import (  # noqa: F401
+        CompactMarker,
+        dequantize_vertices,
+        quantize_vertices,
+    )
+    from .resource_limits import (  # noqa: F401
+        ResourceBudget,
+        ResourceLimitExceeded,
+        ResourceLimits,
+    )
+    from .segments import MarkerSegments  # noqa: F401
+    from .shared_store import SharedMarkerStore  # noqa: F401
+    from .streaming import chunks2plt, iter_path_blocks  # noqa: F401
+    from .svg_module import (  # noqa: F401
+        SVGCircle,
+        SVGEllipse,
+        SVGLine,
+        SVGObject,
+        SVGPath,
+        SVGPolygon,
+        SVGPolyline,
+        SVGRect,
+        SVGStyle,
+    )
+    from .watcher import MarkerWatcher, WatchChanges  # noqa: F401
+
+# Modules defining the public names, relative to this package
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "SVGCircle": ".svg_module",
+    "SVGEllipse": ".svg_module",
+    "SVGLine": ".svg_module",
+    "SVGPath": ".svg_module",
+    "SVGPolygon": ".svg_module",
+    "SVGPolyline": ".svg_module",
+    "SVGRect": ".svg_module",
+    "SVGObject": ".svg_module",
+    "SVGStyle": ".svg_module",
+    "PathConverter": ".path_converter",
+    "get_marker_from_svg": ".path_converter",
+    "Histogram": ".metrics",
+    "MetricsRegistry": ".metrics",
+    "metrics_registry": ".metrics",
+    "ConversionProfiler": ".profiler",
+    "PhaseTiming": ".profiler",
+    "ProfileReport": ".profiler",
+    "ResourceBudget": ".resource_limits",
+    "ResourceLimitExceeded": ".resource_limits",
+    "ResourceLimits": ".resource_limits",
+    "LRUCache": ".cache",
+    "estimate_nbytes": ".cache",
+    "composite_sprites": ".marker_atlas",
+    "marker_hash": ".marker_atlas",
+    "rasterize_marker": ".marker_atlas",
+    "scatter_sprites": ".marker_atlas",
+    "group_indices": ".multi_marker",
+    "load_marker": ".multi_marker",
+    "scatter_by_marker": ".multi_marker",
+    "MultiColorMarker": ".multicolor",
+    "get_multicolor_marker_from_svg": ".multicolor",
+    "scatter_multicolor": ".multicolor",
+    "svg_color_to_rgba": ".multicolor",
+    "IconLibrary": ".icon_library",
+    "IconLocation": ".icon_library",
+    "MarkerBundle": ".bundle",
+    "write_bundle": ".bundle",
+    "SharedMarkerStore": ".shared_store",
+    "IncrementalConverter": ".incremental",
+    "ReuseStats": ".incremental",
+    "element_hash": ".incremental",
+    "MarkerWatcher": ".watcher",
+    "WatchChanges": ".watcher",
+    "ProbeReport": ".probe",
+    "probe": ".probe",
+    "CompactMarker": ".quantize",
+    "dequantize_vertices": ".quantize",
+    "quantize_vertices": ".quantize",
+    "MarkerSegments": ".segments",
+    "chunks2plt": ".streaming",
+    "iter_path_blocks": ".streaming",
+    "plt2svg": ".path_writer",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> "Any":
+    """Import a public name on first access.
+
+    Args:
+        name (str): The name.
+
+    Raises:
+        AttributeError: The name is not public.
+
+    Returns:
+        Any: The attribute.
+    """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value  # Skip __getattr__ from now on
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the names of the module including the lazy ones.
+
+    Returns:
+        list[str]: The names.
+    """
+    return sorted(set(globals()) | set(__all__))
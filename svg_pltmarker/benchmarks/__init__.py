@@ -0,0 +1,6 @@
+from .corpus import CORPUS_GENERATORS, generate_svg
+
+__all__ = [
+    "CORPUS_GENERATORS",
+    "generate_svg",
+]
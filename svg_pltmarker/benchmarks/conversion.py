@@ -0,0 +1,194 @@
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import matplotlib
+import numpy as np
+
+from ..path_converter import (
+    COMMAND_PATTERN,
+    ELEMENT_SEPARATOR,
+    PathConverter,
+    get_marker_from_svg,
+)
+from ..svg_module import SVGObject
+from .corpus import CORPUS_GENERATORS, generate_svg
+
+DEFAULT_SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def _measure(function: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    """Return the best wall time in seconds and the peak traced memory in bytes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    # Measure memory separately, as tracemalloc slows down the execution
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_conversion_benchmark(
+    kinds: Sequence[str] = tuple(CORPUS_GENERATORS),
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeat: int = 3,
+    seed: int = 0,
+    log: Callable[[str], None] | None = print,
+) -> dict[str, Any]:
+    """Time the conversion pipeline over the synthetic corpus.
+
+    Each stage is measured as the best wall time of ``repeat`` runs and the peak
+    memory traced in an extra run. Stages are ``svg_object`` (``SVGObject``
+    construction), ``svg2plt`` (``PathConverter.svg2plt`` of the joined element
+    paths) and ``get_marker_from_svg`` (end to end).
+
+    Args:
+        kinds (Sequence[str], optional): The corpus kinds. Defaults to all of them.
+        sizes (Sequence[int], optional): The numbers of commands.
+            Defaults to powers of 10 from 1e2 to 1e6.
+        repeat (int, optional): The number of timed runs. Defaults to 3.
+        seed (int, optional): The random seed of the corpus. Defaults to 0.
+        log (Callable[[str], None], optional): The function to log progress.
+            Defaults to print.
+
+    Returns:
+        dict[str, Any]: The results with the environment, serializable to JSON.
+    """
+    results = []
+    for kind in kinds:
+        for size in sizes:
+            svg_str = generate_svg(kind, size, seed)
+            svg = SVGObject(svgstr=svg_str)
+            svg_path = ELEMENT_SEPARATOR.join(
+                element.path_repr() for element in svg.graphic_elements
+            )
+            num_commands = len(COMMAND_PATTERN.findall(svg_path))
+            stages: dict[str, Callable[[], Any]] = {
+                "svg_object": lambda: SVGObject(svgstr=svg_str),
+                "svg2plt": lambda: PathConverter.svg2plt(svg_path),
+                "get_marker_from_svg": lambda: get_marker_from_svg(svgstr=svg_str),
+            }
+            for stage, function in stages.items():
+                seconds, peak_bytes = _measure(function, repeat)
+                result = {
+                    "kind": kind,
+                    "size": size,
+                    "stage": stage,
+                    "bytes": len(svg_str),
+                    "commands": num_commands,
+                    "seconds": seconds,
+                    "commands_per_second": num_commands / seconds,
+                    "peak_memory_bytes": peak_bytes,
+                }
+                results.append(result)
+                if log is not None:
+                    log(
+                        f"{kind:<10} {size:>9} {stage:<20} {seconds * 1e3:>10.2f} ms "
+                        f"{num_commands / seconds:>12.0f} cmd/s "
+                        f"{peak_bytes / 2**20:>8.1f} MiB"
+                    )
+    return {
+        "environment": {
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "matplotlib": matplotlib.__version__,
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    baseline: dict[str, Any], current: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Compare two benchmark results.
+
+    Args:
+        baseline (dict[str, Any]): The baseline results.
+        current (dict[str, Any]): The current results.
+
+    Returns:
+        list[dict[str, Any]]: The ratios of the current to the baseline seconds and
+            peak memory for the cases found in both.
+    """
+
+    def key(result: dict[str, Any]) -> tuple[str, int, str]:
+        return result["kind"], result["size"], result["stage"]
+
+    baseline_results = {key(result): result for result in baseline["results"]}
+    comparison = []
+    for result in current["results"]:
+        if key(result) not in baseline_results:
+            continue
+        base = baseline_results[key(result)]
+        comparison.append(
+            {
+                "kind": result["kind"],
+                "size": result["size"],
+                "stage": result["stage"],
+                "time_ratio": result["seconds"] / base["seconds"],
+                "memory_ratio": result["peak_memory_bytes"]
+                / max(1, base["peak_memory_bytes"]),
+            }
+        )
+    return comparison
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the conversion benchmark from the command line.
+
+    Args:
+        argv (Sequence[str], optional): The arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the conversion pipeline over the synthetic corpus."
+    )
+    parser.add_argument("--kinds", nargs="+", default=list(CORPUS_GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="The JSON file to write the results.")
+    parser.add_argument("--compare", help="The JSON file of baseline results.")
+    args = parser.parse_args(argv)
+
+    results = run_conversion_benchmark(args.kinds, args.sizes, args.repeat, args.seed)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.compare is not None:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        for row in compare_results(baseline, results):
+            print(
+                f"{row['kind']:<10} {row['size']:>9} {row['stage']:<20} "
+                f"time x{row['time_ratio']:.2f} memory x{row['memory_ratio']:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+import random
+from collections.abc import Callable
+
+SVG_HEADER = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 1000 1000">'
+SVG_FOOTER = "</svg>"
+MAX_NESTING_DEPTH = 200  # Keep below the recursion limit of xml.dom.minidom
+
+
+def _num(rng: random.Random, low: float = 0.0, high: float = 1000.0) -> str:
+    return f"{rng.uniform(low, high):.2f}"
+
+
+def _point(rng: random.Random, low: float = 0.0, high: float = 1000.0) -> str:
+    return f"{_num(rng, low, high)},{_num(rng, low, high)}"
+
+
+def _shapes(rng: random.Random, num_commands: int) -> str:
+    """Many small shapes of every supported kind (about 4 commands per shape)."""
+    shapes = []
+    for idx in range(max(1, num_commands // 4)):
+        kind = idx % 5
+        if kind == 0:
+            shapes.append(
+                f'<circle cx="{_num(rng)}" cy="{_num(rng)}" r="{_num(rng, 1, 10)}"/>'
+            )
+        elif kind == 1:
+            shapes.append(
+                f'<rect x="{_num(rng)}" y="{_num(rng)}" width="{_num(rng, 1, 10)}" '
+                f'height="{_num(rng, 1, 10)}"/>'
+            )
+        elif kind == 2:
+            shapes.append(
+                f'<ellipse cx="{_num(rng)}" cy="{_num(rng)}" '
+                f'rx="{_num(rng, 1, 10)}" ry="{_num(rng, 1, 10)}"/>'
+            )
+        elif kind == 3:
+            points = " ".join(_point(rng) for _ in range(4))
+            shapes.append(f'<polygon points="{points}"/>')
+        else:
+            shapes.append(
+                f'<line x1="{_num(rng)}" y1="{_num(rng)}" '
+                f'x2="{_num(rng)}" y2="{_num(rng)}"/>'
+            )
+    return "".join(shapes)
+
+
+def _huge_path(rng: random.Random, num_commands: int) -> str:
+    """One path with absolute lines and curves."""
+    commands = [f"M {_point(rng)}"]
+    for idx in range(1, num_commands):
+        kind = idx % 3
+        if kind == 0:
+            commands.append(f"L {_point(rng)}")
+        elif kind == 1:
+            commands.append(f"C {_point(rng)} {_point(rng)} {_point(rng)}")
+        else:
+            commands.append(f"Q {_point(rng)} {_point(rng)}")
+    return f'<path d="{" ".join(commands)}"/>'
+
+
+def _arcs(rng: random.Random, num_commands: int) -> str:
+    """One path with elliptical arcs only."""
+    commands = [f"M {_point(rng)}"]
+    for idx in range(1, num_commands):
+        commands.append(
+            f"A {_num(rng, 1, 100)},{_num(rng, 1, 100)} {_num(rng, 0, 360)} "
+            f"{idx % 2},{(idx // 2) % 2} {_point(rng)}"
+        )
+    return f'<path d="{" ".join(commands)}"/>'
+
+
+def _nested(rng: random.Random, num_commands: int) -> str:
+    """Short paths in deeply nested groups."""
+    blocks = []
+    num_paths = max(1, num_commands // 3)
+    depth = min(MAX_NESTING_DEPTH, num_paths)
+    for start in range(0, num_paths, depth):
+        paths = [
+            f'<g><path d="M {_point(rng)} L {_point(rng)} Z"/>'
+            for _ in range(min(depth, num_paths - start))
+        ]
+        blocks.append("".join(paths) + "</g>" * len(paths))
+    return "".join(blocks)
+
+
+def _relative(rng: random.Random, num_commands: int) -> str:
+    """One path with relative commands only, in compact notation."""
+    commands = [f"m{_point(rng)}"]
+    for idx in range(1, num_commands):
+        kind = idx % 6
+        if kind == 0:
+            commands.append(f"l{_point(rng, -10, 10)}")
+        elif kind == 1:
+            commands.append(f"h{_num(rng, -10, 10)}")
+        elif kind == 2:
+            commands.append(f"v{_num(rng, -10, 10)}")
+        elif kind == 3:
+            commands.append(
+                f"c{_point(rng, -10, 10)} {_point(rng, -10, 10)} {_point(rng, -10, 10)}"
+            )
+        elif kind == 4:
+            commands.append(f"s{_point(rng, -10, 10)} {_point(rng, -10, 10)}")
+        else:
+            commands.append(f"t{_point(rng, -10, 10)}")
+    return f'<path d="{"".join(commands)}"/>'
+
+
+CORPUS_GENERATORS: dict[str, Callable[[random.Random, int], str]] = {
+    "shapes": _shapes,
+    "huge_path": _huge_path,
+    "arcs": _arcs,
+    "nested": _nested,
+    "relative": _relative,
+}
+
+
+def generate_svg(kind: str, num_commands: int, seed: int = 0) -> str:
+    """Generate a synthetic SVG string deterministically.
+
+    Args:
+        kind (str): The kind of the SVG. One of ``CORPUS_GENERATORS``.
+        num_commands (int): The approximate number of path commands.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Raises:
+        ValueError: Unknown kind.
+
+    Returns:
+        str: The SVG string.
+    """
+    if kind not in CORPUS_GENERATORS:
+        raise ValueError(f"Unknown corpus kind: {kind}")
+    rng = random.Random(f"{kind}-{num_commands}-{seed}")
+    return SVG_HEADER + CORPUS_GENERATORS[kind](rng, num_commands) + SVG_FOOTER
@@ -0,0 +1,265 @@
+import argparse
+import json
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import matplotlib
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.markers import MarkerStyle
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
+
+from ..marker_atlas import scatter_sprites
+from ..path_converter import get_marker_from_svg
+from .conversion import _git_commit
+from .corpus import generate_svg
+
+DEFAULT_POINTS = (1_000, 10_000, 100_000, 1_000_000)
+BUILTIN_MARKERS = ("o", "s", "*")
+
+
+def flatten_marker(path: Path, size_pixels: float) -> Path:
+    """Return the marker whose curves are approximated by line segments.
+
+    Args:
+        path (Path): The marker.
+        size_pixels (float): The rendered size of the marker in pixels, which
+            scales the tolerance of the approximation.
+
+    Returns:
+        Path: The flattened marker.
+    """
+    to_pixels = Affine2D().scale(size_pixels)
+    cleaned = path.cleaned(transform=to_pixels, curves=False)
+    # Remove STOP
+    pixels = Path(np.asarray(cleaned.vertices)[:-1], np.asarray(cleaned.codes)[:-1])
+    return to_pixels.inverted().transform_path(pixels)
+
+
+def simplify_marker(path: Path, size_pixels: float) -> Path:
+    """Return the flattened marker simplified at the given rendered size.
+
+    Args:
+        path (Path): The marker.
+        size_pixels (float): The rendered size of the marker in pixels, which
+            scales the simplification threshold of matplotlib.
+
+    Returns:
+        Path: The simplified marker.
+    """
+    to_pixels = Affine2D().scale(size_pixels)
+    cleaned = path.cleaned(transform=to_pixels, simplify=True, curves=False)
+    # Remove STOP
+    pixels = Path(np.asarray(cleaned.vertices)[:-1], np.asarray(cleaned.codes)[:-1])
+    return to_pixels.inverted().transform_path(pixels)
+
+
+def _result(
+    variant: str,
+    points: int,
+    marker_vertices: int,
+    seconds: float,
+    log: Callable[[str], None] | None,
+) -> dict[str, Any]:
+    if log is not None:
+        log(
+            f"{variant:<12} {points:>9} {seconds * 1e3:>10.2f} ms/frame "
+            f"{seconds / points * 1e9:>10.1f} ns/point"
+        )
+    return {
+        "variant": variant,
+        "points": points,
+        "marker_vertices": marker_vertices,
+        "seconds_per_frame": seconds,
+        "seconds_per_point": seconds / points,
+    }
+
+
+def render_scatter(
+    marker: str | Path,
+    x: np.ndarray,
+    y: np.ndarray,
+    marker_size: float = 36.0,
+    repeat: int = 3,
+    figsize: tuple[float, float] = (8.0, 8.0),
+    dpi: float = 100.0,
+) -> float:
+    """Render a scatter on the Agg backend to an in-memory buffer.
+
+    Args:
+        marker (str | Path): The marker.
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        marker_size (float, optional): The marker size in points^2. Defaults to 36.
+        repeat (int, optional): The number of timed frames. Defaults to 3.
+        figsize (tuple[float, float], optional): The figure size in inches.
+            Defaults to (8.0, 8.0).
+        dpi (float, optional): The resolution. Defaults to 100.
+
+    Returns:
+        float: The best wall time of drawing a frame in seconds.
+    """
+    figure = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.set_axis_off()
+    ax.scatter(x, y, s=marker_size, marker=marker, color="None", edgecolors="black")
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    canvas.draw()  # Warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        canvas.draw()
+        canvas.buffer_rgba()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def render_sprites(
+    marker: Path,
+    x: np.ndarray,
+    y: np.ndarray,
+    marker_size: float = 36.0,
+    repeat: int = 3,
+    figsize: tuple[float, float] = (8.0, 8.0),
+    dpi: float = 100.0,
+) -> float:
+    """Composite a pre-rasterized marker at the points and render it on Agg.
+
+    The marker sprite is cached after the warm-up, so the timed frames measure
+    compositing the sprites and drawing the resulting image.
+
+    Args:
+        marker (Path): The marker.
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        marker_size (float, optional): The marker size in points^2. Defaults to 36.
+        repeat (int, optional): The number of timed frames. Defaults to 3.
+        figsize (tuple[float, float], optional): The figure size in inches.
+            Defaults to (8.0, 8.0).
+        dpi (float, optional): The resolution. Defaults to 100.
+
+    Returns:
+        float: The best wall time of drawing a frame in seconds.
+    """
+    figure = Figure(figsize=figsize, dpi=dpi)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    ax.set_axis_off()
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    best = float("inf")
+    for idx in range(repeat + 1):  # The first frame warms up
+        start = time.perf_counter()
+        image = scatter_sprites(
+            ax, x, y, marker, marker_size, facecolor="none", edgecolor="black"
+        )
+        canvas.draw()
+        canvas.buffer_rgba()
+        if idx > 0:
+            best = min(best, time.perf_counter() - start)
+        image.remove()
+    return best
+
+
+def run_rendering_benchmark(
+    svg_str: str | None = None,
+    num_points: Sequence[int] = DEFAULT_POINTS,
+    marker_size: float = 36.0,
+    repeat: int = 3,
+    seed: int = 0,
+    log: Callable[[str], None] | None = print,
+) -> dict[str, Any]:
+    """Time drawing scatters of converted SVG markers against built-in markers.
+
+    The SVG marker is rendered as it is converted (``raw``), with curves
+    flattened to line segments (``flattened``), and flattened and simplified at
+    the rendered size (``simplified``). It is also composited as a pre-rasterized
+    sprite (``sprites``).
+
+    Args:
+        svg_str (str, optional): The SVG string of the marker. Defaults to a
+            synthetic one with 10 small shapes.
+        num_points (Sequence[int], optional): The numbers of points.
+            Defaults to powers of 10 from 1e3 to 1e6.
+        marker_size (float, optional): The marker size in points^2. Defaults to 36.
+        repeat (int, optional): The number of timed frames. Defaults to 3.
+        seed (int, optional): The random seed of the points. Defaults to 0.
+        log (Callable[[str], None], optional): The function to log progress.
+            Defaults to print.
+
+    Returns:
+        dict[str, Any]: The results with the environment, serializable to JSON.
+    """
+    if svg_str is None:
+        svg_str = generate_svg("shapes", 40, seed)
+    marker = get_marker_from_svg(svgstr=svg_str)
+    dpi = 100.0
+    size_pixels = np.sqrt(marker_size) * dpi / 72
+    markers: dict[str, str | Path] = {
+        "raw": marker,
+        "flattened": flatten_marker(marker, size_pixels),
+        "simplified": simplify_marker(marker, size_pixels),
+        **{f"builtin:{name}": name for name in BUILTIN_MARKERS},
+    }
+
+    rng = np.random.default_rng(seed)
+    results = []
+    for points in num_points:
+        x, y = rng.random(points), rng.random(points)
+        for variant, variant_marker in markers.items():
+            seconds = render_scatter(
+                variant_marker, x, y, marker_size=marker_size, repeat=repeat, dpi=dpi
+            )
+            marker_path = MarkerStyle(variant_marker).get_path()
+            results.append(_result(variant, points, len(marker_path), seconds, log))
+        seconds = render_sprites(
+            marker, x, y, marker_size=marker_size, repeat=repeat, dpi=dpi
+        )
+        results.append(_result("sprites", points, len(marker), seconds, log))
+    return {
+        "environment": {
+            "commit": _git_commit(),
+            "backend": "agg",
+            "matplotlib": matplotlib.__version__,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the rendering benchmark from the command line.
+
+    Args:
+        argv (Sequence[str], optional): The arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark drawing scatters of SVG markers on the Agg backend."
+    )
+    parser.add_argument("--svg", help="The SVG file of the marker.")
+    parser.add_argument("--points", nargs="+", type=int, default=list(DEFAULT_POINTS))
+    parser.add_argument("--marker-size", type=float, default=36.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="The JSON file to write the results.")
+    args = parser.parse_args(argv)
+
+    svg_str = None
+    if args.svg is not None:
+        with open(args.svg) as f:
+            svg_str = f.read()
+    results = run_rendering_benchmark(
+        svg_str, args.points, args.marker_size, args.repeat, args.seed
+    )
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from .conversion import _git_commit
+
+DEFAULT_STATEMENTS = {
+    "package": "import svg_pltmarker",
+    "svg_object": "from svg_pltmarker import SVGObject",
+    "get_marker_from_svg": "from svg_pltmarker import get_marker_from_svg",
+}
+HEAVY_MODULES = ("matplotlib", "numpy", "pydantic")
+IMPORTTIME_PATTERN = re.compile(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)")
+
+
+def parse_importtime(output: str) -> list[dict[str, Any]]:
+    """Parse the output of ``python -X importtime``.
+
+    Args:
+        output (str): The standard error of the interpreter.
+
+    Returns:
+        list[dict[str, Any]]: The imported modules in the order they finished, with
+            the self and cumulative times in microseconds and the nesting depth.
+    """
+    modules = []
+    for match in IMPORTTIME_PATTERN.finditer(output):
+        self_us, cumulative_us, indent, module = match.groups()
+        modules.append(
+            {
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2,
+            }
+        )
+    return modules
+
+
+def measure_import(statement: str) -> list[dict[str, Any]]:
+    """Run a statement in a fresh interpreter with ``-X importtime``.
+
+    Args:
+        statement (str): The statement, e.g. ``import svg_pltmarker``.
+
+    Raises:
+        subprocess.CalledProcessError: The statement failed.
+
+    Returns:
+        list[dict[str, Any]]: The imported modules parsed by ``parse_importtime``.
+    """
+    package_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        path for path in [package_dir, env.get("PYTHONPATH")] if path
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def run_startup_benchmark(
+    statements: Mapping[str, str] = DEFAULT_STATEMENTS,
+    repeat: int = 5,
+    top: int = 10,
+    log: Callable[[str], None] | None = print,
+) -> dict[str, Any]:
+    """Time importing the package in fresh interpreters.
+
+    The import time of a statement is the sum of the cumulative times of the
+    modules imported at the top level, taking the best of ``repeat`` runs.
+
+    Args:
+        statements (Mapping[str, str], optional): The statements keyed by name.
+            Defaults to importing the package, ``SVGObject``, and
+            ``get_marker_from_svg``.
+        repeat (int, optional): The number of runs. Defaults to 5.
+        top (int, optional): The number of the slowest modules to report.
+            Defaults to 10.
+        log (Callable[[str], None], optional): The function to log progress.
+            Defaults to print.
+
+    Returns:
+        dict[str, Any]: The results with the environment, serializable to JSON.
+    """
+    results = []
+    for name, statement in statements.items():
+        best_us, best_modules = None, []
+        for _ in range(repeat):
+            modules = measure_import(statement)
+            total_us = sum(
+                module["cumulative_us"] for module in modules if module["depth"] == 0
+            )
+            if best_us is None or total_us < best_us:
+                best_us, best_modules = total_us, modules
+        assert best_us is not None, "Invalid number of runs"
+        imported = {module["module"] for module in best_modules}
+        heavy_modules = [module for module in HEAVY_MODULES if module in imported]
+        slowest = sorted(best_modules, key=lambda module: -module["self_us"])[:top]
+        results.append(
+            {
+                "name": name,
+                "statement": statement,
+                "import_us": best_us,
+                "num_modules": len(best_modules),
+                "heavy_modules": heavy_modules,
+                "slowest_modules": [
+                    {"module": module["module"], "self_us": module["self_us"]}
+                    for module in slowest
+                ],
+            }
+        )
+        if log is not None:
+            log(
+                f"{name:<20} {best_us / 1e3:>10.2f} ms {len(best_modules):>6} modules "
+                f"heavy: {', '.join(heavy_modules) or '-'}"
+            )
+    return {
+        "environment": {
+            "commit": _git_commit(),
+            "python": sys.version.split()[0],
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the startup benchmark from the command line.
+
+    Args:
+        argv (Sequence[str], optional): The arguments. Defaults to sys.argv.
+    """
+    parser = argparse.ArgumentParser(
+        description="Benchmark the import time of the package with -X importtime."
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--output", help="The JSON file to write the results.")
+    args = parser.parse_args(argv)
+
+    results = run_startup_benchmark(repeat=args.repeat, top=args.top)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import mmap
+import os
+import struct
+from collections.abc import Iterator, Mapping
+from typing import BinaryIO
+
+import numpy as np
+from matplotlib.path import Path
+
+from .quantize import _vertex_dtype, dequantize_vertices, quantize_vertices
+
+BUNDLE_MAGIC = b"SVGPLTMB"
+BUNDLE_VERSION = 1
+# Magic, version, vertex item size, number of markers, and section offsets
+HEADER_FORMAT = "<8sIIQQQQQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+ALIGNMENT = 8
+TABLE_DTYPE = np.dtype(
+    [
+        ("name_offset", "<u8"),
+        ("name_length", "<u8"),
+        ("start", "<u8"),  # Index of the first vertex in the vertex and code blobs
+        ("length", "<u8"),  # Number of vertices
+    ]
+)
+# The vertex dtypes by item size, where int16 is quantized by quantize_vertices
+VERTEX_DTYPES: dict[int, np.dtype] = {
+    2: np.dtype("<i2"),
+    4: np.dtype("<f4"),
+    8: np.dtype("<f8"),
+}
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def write_bundle(
+    filepath: str | os.PathLike,
+    markers: Mapping[str, Path],
+    dtype: type[np.generic] | np.dtype | str = np.float64,
+) -> None:
+    """Write markers into a single-file bundle.
+
+    The bundle consists of a header, a table of names and vertex ranges, the UTF-8
+    names, and contiguous vertex and code blobs, so that ``MarkerBundle`` can map
+    any marker without reading the others.
+
+    Args:
+        filepath (str | os.PathLike): The path to the bundle.
+        markers (Mapping[str, Path]): The markers keyed by name.
+        dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype,
+            float64, float32, or int16 for markers normalized to [-0.5, 0.5].
+            Defaults to float64.
+
+    Raises:
+        ValueError: Unsupported vertex dtype, or int16 vertices out of
+            [-0.5, 0.5].
+    """
+    with open(filepath, "wb") as f:
+        _write_bundle(f, markers, dtype)
+
+
+def _write_bundle(
+    f: BinaryIO,
+    markers: Mapping[str, Path],
+    dtype: type[np.generic] | np.dtype | str,
+) -> None:
+    vertex_dtype = _vertex_dtype(dtype).newbyteorder("<")
+    # Quantized before writing anything, as int16 may reject the markers
+    vertex_blobs = [
+        np.ascontiguousarray(quantize_vertices(np.asarray(path.vertices), vertex_dtype))
+        for path in markers.values()
+    ]
+
+    names = [name.encode("utf-8") for name in markers]
+    table = np.zeros(len(markers), dtype=TABLE_DTYPE)
+    table["name_length"] = [len(name) for name in names]
+    table["name_offset"] = np.cumsum(table["name_length"]) - table["name_length"]
+    table["length"] = [len(path) for path in markers.values()]
+    table["start"] = np.cumsum(table["length"]) - table["length"]
+    num_vertices = int(table["length"].sum())
+
+    table_offset = HEADER_SIZE
+    names_offset = table_offset + table.nbytes
+    vertices_offset = _align(names_offset + int(table["name_length"].sum()))
+    codes_offset = vertices_offset + num_vertices * 2 * vertex_dtype.itemsize
+
+    f.write(
+        struct.pack(
+            HEADER_FORMAT,
+            BUNDLE_MAGIC,
+            BUNDLE_VERSION,
+            vertex_dtype.itemsize,
+            len(markers),
+            table_offset,
+            names_offset,
+            vertices_offset,
+            codes_offset,
+        )
+    )
+    f.write(table.tobytes())
+    f.write(b"".join(names))
+    f.write(b"\0" * (vertices_offset - names_offset - len(b"".join(names))))
+    for vertices in vertex_blobs:
+        f.write(vertices.tobytes())
+    for path in markers.values():
+        codes = path.codes
+        if codes is None:
+            codes = np.full(len(path), Path.LINETO, dtype=np.uint8)
+            codes[:1] = Path.MOVETO
+        f.write(np.ascontiguousarray(codes, dtype=np.uint8).tobytes())
+
+
+class MarkerBundle:
+    """A class to read markers from a bundle written by ``write_bundle``.
+
+    The bundle file is memory-mapped, or read from a given buffer such as shared
+    memory, and only the table and the names are read when it is opened. The arrays
+    of a marker are zero-copy views into the buffer, so that loading a marker only
+    touches its pages.
+
+    >>> with MarkerBundle("markers.bundle") as bundle:
+    ...     marker = bundle["animals/cat"]
+
+    Attributes:
+        dtype (np.dtype): The vertex dtype.
+    """
+
+    def __init__(
+        self,
+        filepath: str | os.PathLike | None = None,
+        buffer: memoryview | None = None,
+    ) -> None:
+        """Initialize the MarkerBundle class.
+
+        Args:
+            filepath (str | os.PathLike, optional): The path to the bundle.
+                Defaults to None.
+            buffer (memoryview, optional): The buffer holding the bundle, which must
+                outlive the markers. Defaults to None.
+
+        Raises:
+            ValueError: Either filepath or buffer must be specified, or invalid
+                bundle.
+        """
+        if (filepath is None) == (buffer is None):
+            raise ValueError("Either filepath or buffer must be specified")
+        self._mmap: mmap.mmap | None = None
+        if filepath is not None:
+            with open(filepath, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buffer = memoryview(self._mmap)  # Read-only
+            source = f"{filepath}"
+        else:
+            assert buffer is not None
+            self._buffer = buffer.toreadonly()
+            source = "buffer"
+        if len(self._buffer) < HEADER_SIZE:
+            raise ValueError(f"Invalid bundle: {source}")
+        (
+            magic,
+            version,
+            itemsize,
+            count,
+            table_offset,
+            names_offset,
+            self._vertices_offset,
+            self._codes_offset,
+        ) = struct.unpack_from(HEADER_FORMAT, self._buffer)
+        if magic != BUNDLE_MAGIC or itemsize not in VERTEX_DTYPES:
+            raise ValueError(f"Invalid bundle: {source}")
+        if version != BUNDLE_VERSION:
+            raise ValueError(f"Unsupported bundle version: {version}")
+        self.dtype = VERTEX_DTYPES[itemsize]
+        self._table = np.frombuffer(
+            self._buffer, dtype=TABLE_DTYPE, count=count, offset=table_offset
+        )
+        names = bytes(self._buffer[names_offset : self._vertices_offset])  # noqa: E203
+        self._index = {
+            names[offset : offset + length].decode("utf-8"): idx  # noqa: E203
+            for idx, (offset, length) in enumerate(
+                zip(
+                    self._table["name_offset"].tolist(),
+                    self._table["name_length"].tolist(),
+                )
+            )
+        }
+
+    def __len__(self) -> int:
+        """Return the number of markers.
+
+        Returns:
+            int: The number of markers.
+        """
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the marker is in the bundle.
+
+        Args:
+            name (str): The marker name.
+
+        Returns:
+            bool: Whether the marker is in the bundle.
+        """
+        return name in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the marker names in the order they were written.
+
+        Returns:
+            Iterator[str]: The marker names.
+        """
+        return iter(self._index)
+
+    def __getitem__(self, name: str) -> Path:
+        """Return a marker.
+
+        Args:
+            name (str): The marker name.
+
+        Raises:
+            KeyError: Marker not found.
+
+        Returns:
+            Path: The read-only matplotlib path. The arrays are views into the map
+                for float64 bundles, while float32 and int16 vertices are
+                dequantized to a float64 copy.
+        """
+        vertices, codes = self.get_arrays(name)
+        return Path(dequantize_vertices(vertices), codes, readonly=True)
+
+    def __enter__(self) -> "MarkerBundle":
+        """Return the bundle itself.
+
+        Returns:
+            MarkerBundle: The bundle.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the bundle."""
+        self.close()
+
+    def get_arrays(self, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return the arrays of a marker as zero-copy views into the map.
+
+        Args:
+            name (str): The marker name.
+
+        Raises:
+            KeyError: Marker not found.
+
+        Returns:
+            np.ndarray: The read-only (N, 2) vertices in the bundle dtype, see
+                ``dequantize_vertices`` for int16.
+            np.ndarray: The read-only (N,) uint8 codes.
+        """
+        if name not in self._index:
+            raise KeyError(f"Marker not found: {name}")
+        entry = self._table[self._index[name]]
+        start, length = int(entry["start"]), int(entry["length"])
+        vertices = np.frombuffer(
+            self._buffer,
+            dtype=self.dtype,
+            count=2 * length,
+            offset=self._vertices_offset + 2 * start * self.dtype.itemsize,
+        ).reshape(length, 2)
+        codes = np.frombuffer(
+            self._buffer,
+            dtype=np.uint8,
+            count=length,
+            offset=self._codes_offset + start,
+        )
+        return vertices, codes
+
+    def close(self) -> None:
+        """Release the buffer and close the map of the bundle file.
+
+        The map stays open until the markers referring to it are released.
+        """
+        self._table = self._table[:0].copy()
+        self._index = {}
+        try:
+            self._buffer.release()
+            if self._mmap is not None:
+                self._mmap.close()
+        except BufferError:
+            pass  # Released when the last view is garbage collected
@@ -0,0 +1,204 @@
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, Generic, TypeVar
+
+from .metrics import metrics_registry
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Estimate the memory held by a cached value.
+
+    Args:
+        value (Any): The value, e.g. an array, a matplotlib path, or a sequence
+            or a model of them.
+
+    Returns:
+        int: The estimated number of bytes.
+    """
+    if hasattr(value, "nbytes"):  # NumPy arrays
+        return int(value.nbytes)
+    if hasattr(value, "vertices"):  # Matplotlib paths
+        codes = getattr(value, "codes", None)
+        return int(value.vertices.nbytes) + (0 if codes is None else codes.nbytes)
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_nbytes(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return sys.getsizeof(value) + sum(
+            estimate_nbytes(item) for item in vars(value).values()
+        )
+    return sys.getsizeof(value)
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe bounded cache evicting the least recently used entries.
+
+    Concurrent lookups of the same missing key are deduplicated (single-flight):
+    the first caller computes the value while the others wait for its result, and
+    an error is raised to all of them without being cached.
+
+    Hits, misses, and deduplicated lookups are counted in the metrics registry as
+    ``cache.<name>.hits``, ``cache.<name>.misses``, and ``cache.<name>.waits``.
+
+    Attributes:
+        name (str): The name of the cache used in the metrics.
+        maxsize (int): The maximum number of entries.
+        maxbytes (int, optional): The maximum estimated memory of the entries.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 128,
+        maxbytes: int | None = None,
+        sizeof: Callable[[V], int] = estimate_nbytes,
+    ) -> None:
+        """Initialize the LRUCache class.
+
+        Args:
+            name (str): The name of the cache used in the metrics.
+            maxsize (int, optional): The maximum number of entries. Defaults to 128.
+            maxbytes (int, optional): The maximum estimated memory of the entries.
+                Values larger than it are returned but not cached. Defaults to None
+                (unbounded).
+            sizeof (Callable[[V], int], optional): The function to estimate the
+                memory of a value. Defaults to estimate_nbytes.
+
+        Raises:
+            ValueError: maxsize or maxbytes is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if maxbytes is not None and maxbytes <= 0:
+            raise ValueError("maxbytes must be positive")
+        self.name = name
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._nbytes = 0
+        self._flights: dict[K, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the estimated memory of the entries.
+
+        Returns:
+            int: The estimated number of bytes, counted only if maxbytes is set.
+        """
+        return self._nbytes
+
+    def __contains__(self, key: K) -> bool:
+        """Return whether the key is cached, without updating its recency.
+
+        Args:
+            key (K): The key.
+
+        Returns:
+            bool: Whether the key is cached.
+        """
+        return key in self._entries
+
+    def get_or_compute(self, key: K, compute: Callable[[], V]) -> V:
+        """Return the cached value, or compute and cache it.
+
+        If another thread is computing the value of the same key, wait for it
+        instead of computing it again.
+
+        Args:
+            key (K): The key.
+            compute (Callable[[], V]): The function to compute the value on a miss.
+
+        Raises:
+            Exception: The error raised by compute, in the computing thread and
+                all the waiting threads.
+
+        Returns:
+            V: The value.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                metrics_registry.increment(f"cache.{self.name}.hits")
+                return self._entries[key][0]
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = Future()
+        if not is_leader:
+            metrics_registry.increment(f"cache.{self.name}.waits")
+            return flight.result()
+
+        metrics_registry.increment(f"cache.{self.name}.misses")
+        try:
+            value = compute()
+            self.put(key, value)  # Cached before the flight lands for new callers
+        except BaseException as error:
+            flight.set_exception(error)
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    def put(self, key: K, value: V) -> None:
+        """Cache a value, evicting the least recently used entries if full.
+
+        Args:
+            key (K): The key.
+            value (V): The value.
+        """
+        nbytes = self._sizeof(value) if self.maxbytes is not None else 0
+        with self._lock:
+            self._remove(key)
+            if self.maxbytes is not None and nbytes > self.maxbytes:
+                return
+            self._entries[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while len(self._entries) > self.maxsize or (
+                self.maxbytes is not None and self._nbytes > self.maxbytes
+            ):
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+    def pop(self, key: K) -> V | None:
+        """Remove an entry.
+
+        Args:
+            key (K): The key.
+
+        Returns:
+            V | None: The removed value, or None if the key is not cached.
+        """
+        with self._lock:
+            return self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _remove(self, key: K) -> V | None:
+        """Remove an entry while holding the lock."""
+        if key not in self._entries:
+            return None
+        value, nbytes = self._entries.pop(key)
+        self._nbytes -= nbytes
+        return value
@@ -0,0 +1,270 @@
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from matplotlib.path import Path
+
+    from .resource_limits import ResourceLimits
+
+# The commands import the conversion modules when they run, so that ``--help`` and
+# argument errors do not pay for importing matplotlib
+BENCHMARKS = ("conversion", "rendering", "startup")
+CODE_NAMES = {1: "MOVETO", 2: "LINETO", 3: "CURVE3", 4: "CURVE4", 79: "CLOSEPOLY"}
+
+
+def _compile_marker(svgstr: str, limits: "ResourceLimits | None") -> "Path":
+    from .path_converter import get_marker_from_svg
+
+    return get_marker_from_svg(svgstr=svgstr, limits=limits)
+
+
+def compile_icons(
+    roots: Sequence[str | os.PathLike],
+    output: str | os.PathLike,
+    num_workers: int | None = None,
+    dtype: str = "float64",
+    index: str | os.PathLike | None = None,
+    limits: "ResourceLimits | None" = None,
+    log: Callable[[str], None] | None = print,
+) -> dict[str, str]:
+    """Convert the SVG icons in directories and zip archives into a marker bundle.
+
+    Icons are indexed as ``IconLibrary.scan`` names them, read in the current
+    process, and converted in a process pool. Icons which fail to convert are
+    left out of the bundle.
+
+    Args:
+        roots (Sequence[str | os.PathLike]): The directories and zip archives.
+        output (str | os.PathLike): The path to the bundle.
+        num_workers (int, optional): The number of worker processes. Defaults to
+            None (the number of CPUs); 1 converts in the current process.
+        dtype (str, optional): The vertex dtype, float64, float32, or int16.
+            Defaults to float64.
+        index (str | os.PathLike, optional): The path to also save the icon index
+            to. Defaults to None.
+        limits (ResourceLimits, optional): The resource limits for untrusted icons.
+            Defaults to None.
+        log (Callable[[str], None], optional): The function to log failures.
+            Defaults to print.
+
+    Raises:
+        FileNotFoundError: Root not found.
+        ValueError: Unsupported vertex dtype.
+
+    Returns:
+        dict[str, str]: The error messages of the failed icons keyed by name.
+    """
+    from .bundle import write_bundle
+    from .icon_library import IconLibrary
+
+    with IconLibrary.scan(*roots) as library:
+        names = list(library)
+        svgstrs = [library.read_svg(name) for name in names]
+        if index is not None:
+            library.save(index)
+
+    if num_workers == 1:
+        results = [_try(_compile_marker, svgstr, limits) for svgstr in svgstrs]
+    else:
+        with ProcessPoolExecutor(num_workers) as executor:
+            futures = [
+                executor.submit(_compile_marker, svgstr, limits) for svgstr in svgstrs
+            ]
+            results = [_try(future.result) for future in futures]
+
+    markers, errors = {}, {}
+    for name, (marker, error) in zip(names, results):
+        if error is None:
+            markers[name] = marker
+        else:
+            errors[name] = error
+            if log is not None:
+                log(f"{name}: {error}")
+    write_bundle(output, markers, dtype=dtype)
+    return errors
+
+
+def _try(function: Callable[..., Any], *args: Any) -> tuple[Any, str | None]:
+    try:
+        return function(*args), None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def inspect_svg(filepath: str | os.PathLike) -> dict[str, Any]:
+    """Convert an SVG file and summarize the elements, commands, and vertices.
+
+    Args:
+        filepath (str | os.PathLike): The path to the SVG file.
+
+    Raises:
+        ExpatError: Invalid SVG file.
+        FileNotFoundError: File not found.
+        IndexError: SVG element not found.
+
+    Returns:
+        dict[str, Any]: The counts of elements by tag, path commands by letter,
+            and vertices by code, the bounds of the marker, and the wall time of
+            each conversion phase in milliseconds.
+    """
+    import numpy as np
+
+    from .path_converter import COMMAND_PATTERN, PathConverter
+    from .profiler import ConversionProfiler
+    from .svg_module import SVGObject
+
+    profiler = ConversionProfiler()
+    svg = SVGObject(filepath=os.fspath(filepath), profiler=profiler)
+    marker = PathConverter.elements2plt(svg.graphic_elements, profiler=profiler)
+    tags = {cls: tag for tag, cls in SVGObject.SVG_GRPAHIC_ELEMENTS.items()}
+    commands: Counter[str] = Counter()
+    for element in svg.graphic_elements:
+        commands.update(COMMAND_PATTERN.findall(element.path_repr()))
+    codes, counts = np.unique(np.asarray(marker.codes), return_counts=True)
+    extents = marker.get_extents()
+    return {
+        "file": os.fspath(filepath),
+        "elements": dict(
+            Counter(tags[type(element)] for element in svg.graphic_elements)
+        ),
+        "commands": dict(sorted(commands.items())),
+        "vertices": len(marker),
+        "codes": {
+            CODE_NAMES.get(code, str(code)): count
+            for code, count in zip(codes.tolist(), counts.tolist())
+        },
+        "bounds": [extents.x0, extents.y0, extents.x1, extents.y1],
+        "phases_ms": {
+            name: timing.total_ms for name, timing in profiler.report().phases.items()
+        },
+    }
+
+
+def _format_inspection(summary: dict[str, Any]) -> str:
+    lines = [f"file: {summary['file']}"]
+    for title in ("elements", "commands", "codes"):
+        lines.append(f"{title}: {sum(summary[title].values())}")
+        lines.extend(
+            f"  {key:<12} {value:>10}" for key, value in summary[title].items()
+        )
+    lines.append(f"vertices: {summary['vertices']}")
+    lines.append("bounds: " + " ".join(f"{value:.4g}" for value in summary["bounds"]))
+    lines.append(f"phases: {sum(summary['phases_ms'].values()):.3f} ms")
+    lines.extend(
+        f"  {name:<12} {value:>10.3f} ms"
+        for name, value in summary["phases_ms"].items()
+    )
+    return "\n".join(lines)
+
+
+def _compile_command(args: argparse.Namespace) -> int:
+    from .resource_limits import ResourceLimits
+
+    limits = None
+    if args.max_bytes is not None or args.max_vertices is not None:
+        limits = ResourceLimits(
+            max_bytes=args.max_bytes, max_vertices=args.max_vertices
+        )
+    errors = compile_icons(
+        args.roots,
+        args.output,
+        num_workers=args.workers,
+        dtype=args.dtype,
+        index=args.index,
+        limits=limits,
+        log=lambda message: print(message, file=sys.stderr),
+    )
+    return 1 if errors and args.strict else 0
+
+
+def _inspect_command(args: argparse.Namespace) -> int:
+    summary = inspect_svg(args.file)
+    print(json.dumps(summary, indent=2) if args.json else _format_inspection(summary))
+    return 0
+
+
+def _bench_command(args: argparse.Namespace) -> int:
+    import importlib
+
+    module = importlib.import_module(f".benchmarks.{args.benchmark}", __package__)
+    module.main(args.args)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the ``svg-pltmarker`` command.
+
+    Returns:
+        argparse.ArgumentParser: The parser with the subcommands.
+    """
+    parser = argparse.ArgumentParser(
+        prog="svg-pltmarker", description="Convert SVG files to matplotlib markers."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile",
+        help="Convert directories and zip archives of SVG files into a bundle.",
+    )
+    compile_parser.add_argument("roots", nargs="+", help="Directories and zip files.")
+    compile_parser.add_argument("-o", "--output", required=True, help="The bundle.")
+    compile_parser.add_argument(
+        "-j", "--workers", type=int, help="The number of worker processes."
+    )
+    compile_parser.add_argument(
+        "--dtype",
+        choices=["float64", "float32", "int16"],
+        default="float64",
+        help="The vertex dtype, int16 quantized to 1/65534 of the marker size.",
+    )
+    compile_parser.add_argument("--index", help="The JSON file to save the index.")
+    compile_parser.add_argument("--max-bytes", type=int, help="The size limit.")
+    compile_parser.add_argument("--max-vertices", type=int, help="The vertex limit.")
+    compile_parser.add_argument(
+        "--strict", action="store_true", help="Exit with 1 if any icon fails."
+    )
+    compile_parser.set_defaults(function=_compile_command)
+
+    inspect_parser = subparsers.add_parser(
+        "inspect", help="Print the counts and phase timings of an SVG file."
+    )
+    inspect_parser.add_argument("file", help="The SVG file.")
+    inspect_parser.add_argument("--json", action="store_true", help="Print JSON.")
+    inspect_parser.set_defaults(function=_inspect_command)
+
+    bench_parser = subparsers.add_parser("bench", help="Run a built-in benchmark.")
+    bench_parser.add_argument("benchmark", choices=BENCHMARKS)
+    bench_parser.add_argument(
+        "args", nargs=argparse.REMAINDER, help="Arguments of the benchmark."
+    )
+    bench_parser.set_defaults(function=_bench_command)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the ``svg-pltmarker`` command.
+
+    Args:
+        argv (Sequence[str], optional): The arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit status.
+    """
+    from xml.parsers.expat import ExpatError
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.function(args)
+    except (AssertionError, ExpatError, IndexError, OSError, ValueError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,319 @@
+import json
+import os
+import threading
+import zipfile
+from collections.abc import Iterator
+
+import numpy as np
+from matplotlib.path import Path
+from pydantic import BaseModel, Field
+
+from .cache import LRUCache
+from .path_converter import get_marker_from_svg
+from .quantize import CompactMarker, _vertex_dtype
+from .resource_limits import ResourceLimits
+from .svg_module import SVGObject
+
+INDEX_VERSION = 1
+
+
+class IconLocation(BaseModel):
+    """A class to represent where an SVG icon is stored.
+
+    Attributes:
+        path (str): The path to the SVG file or to the zip archive.
+        member (str, optional): The name of the member in the zip archive.
+            Defaults to None (a plain file).
+    """
+
+    path: str = Field(description="The path to the SVG file or the zip archive.")
+    member: str | None = Field(
+        default=None, description="The name of the member in the zip archive."
+    )
+
+
+class IconLibrary:
+    """A class to look up SVG icons by name over directories and zip archives.
+
+    The library only holds a name to location index. Icons are read, straight from
+    the zip archives without extraction, and converted on the first lookup, and
+    the converted markers are kept in a bounded LRU cache. With a compact ``dtype``,
+    the cache holds float32 or int16 vertices, a half or a quarter of the memory,
+    and a lookup dequantizes them into a new path.
+
+    >>> library = IconLibrary.scan("icons/", "more_icons.zip")
+    >>> library.save("icons.json")  # Later: IconLibrary.load("icons.json")
+    >>> marker = library.get_marker("animals/cat")
+
+    Attributes:
+        index (dict[str, IconLocation]): The locations keyed by icon name.
+        limits (ResourceLimits, optional): The resource limits of the conversion.
+        dtype (np.dtype, optional): The vertex dtype of the cached markers.
+    """
+
+    def __init__(
+        self,
+        index: dict[str, IconLocation],
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        limits: ResourceLimits | None = None,
+        dtype: type[np.generic] | np.dtype | str | None = None,
+    ) -> None:
+        """Initialize the IconLibrary class.
+
+        Args:
+            index (dict[str, IconLocation]): The locations keyed by icon name.
+            maxsize (int, optional): The maximum number of cached markers.
+                Defaults to 1024.
+            maxbytes (int, optional): The maximum memory of cached markers.
+                Defaults to None (unbounded).
+            limits (ResourceLimits, optional): The resource limits of the
+                conversion. Defaults to None.
+            dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype of
+                the cached markers, float64, float32, or int16. Defaults to None
+                (the paths as converted).
+
+        Raises:
+            ValueError: Unsupported vertex dtype.
+        """
+        self.index = index
+        self.limits = limits
+        self.dtype = None if dtype is None else _vertex_dtype(dtype)
+        self._markers: LRUCache[str, Path | CompactMarker] = LRUCache(
+            "icon", maxsize=maxsize, maxbytes=maxbytes
+        )
+        self._archives: dict[str, zipfile.ZipFile] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def scan(
+        cls,
+        *roots: str | os.PathLike,
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        limits: ResourceLimits | None = None,
+        dtype: type[np.generic] | np.dtype | str | None = None,
+    ) -> "IconLibrary":
+        """Index the SVG files in directories and zip archives.
+
+        Icons are named by their path relative to the root without the ``.svg``
+        suffix, with ``/`` as the separator. Zip archives found in a directory are
+        indexed as subdirectories named after the archive without ``.zip``. If
+        names collide, the first one found is kept.
+
+        Args:
+            *roots (str | os.PathLike): The directories and zip archives.
+            maxsize (int, optional): The maximum number of cached markers.
+                Defaults to 1024.
+            maxbytes (int, optional): The maximum memory of cached markers.
+                Defaults to None (unbounded).
+            limits (ResourceLimits, optional): The resource limits of the
+                conversion. Defaults to None.
+            dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype of
+                the cached markers, float64, float32, or int16. Defaults to None
+                (the paths as converted).
+
+        Raises:
+            FileNotFoundError: Root not found.
+            ValueError: Unsupported vertex dtype.
+
+        Returns:
+            IconLibrary: The library.
+        """
+        index: dict[str, IconLocation] = {}
+        for root in roots:
+            root = os.path.abspath(root)
+            if zipfile.is_zipfile(root):
+                _scan_archive(index, root, "")
+            elif os.path.isdir(root):
+                for dirpath, dirnames, filenames in os.walk(root):
+                    dirnames.sort()
+                    prefix = os.path.relpath(dirpath, root).replace(os.sep, "/")
+                    prefix = "" if prefix == "." else prefix + "/"
+                    for filename in sorted(filenames):
+                        filepath = os.path.join(dirpath, filename)
+                        stem, suffix = os.path.splitext(filename)
+                        if suffix.lower() == ".svg":
+                            index.setdefault(prefix + stem, IconLocation(path=filepath))
+                        elif suffix.lower() == ".zip" and zipfile.is_zipfile(filepath):
+                            _scan_archive(index, filepath, prefix + stem + "/")
+            else:
+                raise FileNotFoundError(f"Icon root not found: {root}")
+        return cls(
+            index, maxsize=maxsize, maxbytes=maxbytes, limits=limits, dtype=dtype
+        )
+
+    @classmethod
+    def load(
+        cls,
+        filepath: str | os.PathLike,
+        maxsize: int = 1024,
+        maxbytes: int | None = None,
+        limits: ResourceLimits | None = None,
+        dtype: type[np.generic] | np.dtype | str | None = None,
+    ) -> "IconLibrary":
+        """Load a library from an index file written by ``save``.
+
+        Args:
+            filepath (str | os.PathLike): The path to the index file.
+            maxsize (int, optional): The maximum number of cached markers.
+                Defaults to 1024.
+            maxbytes (int, optional): The maximum memory of cached markers.
+                Defaults to None (unbounded).
+            limits (ResourceLimits, optional): The resource limits of the
+                conversion. Defaults to None.
+            dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype of
+                the cached markers, float64, float32, or int16. Defaults to None
+                (the paths as converted).
+
+        Raises:
+            ValueError: Unsupported index version, or unsupported vertex dtype.
+
+        Returns:
+            IconLibrary: The library.
+        """
+        with open(filepath) as f:
+            data = json.load(f)
+        if data.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported icon index version: {data.get('version')}")
+        index = {
+            name: IconLocation.model_construct(path=path, member=member)
+            for name, (path, member) in data["icons"].items()
+        }
+        return cls(
+            index, maxsize=maxsize, maxbytes=maxbytes, limits=limits, dtype=dtype
+        )
+
+    def save(self, filepath: str | os.PathLike) -> None:
+        """Save the index to a file.
+
+        Args:
+            filepath (str | os.PathLike): The path to the index file.
+        """
+        data = {
+            "version": INDEX_VERSION,
+            "icons": {
+                name: [location.path, location.member]
+                for name, location in self.index.items()
+            },
+        }
+        with open(filepath, "w") as f:
+            json.dump(data, f)
+
+    def __len__(self) -> int:
+        """Return the number of icons.
+
+        Returns:
+            int: The number of icons.
+        """
+        return len(self.index)
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the icon is in the library.
+
+        Args:
+            name (str): The icon name.
+
+        Returns:
+            bool: Whether the icon is in the library.
+        """
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the icon names.
+
+        Returns:
+            Iterator[str]: The icon names.
+        """
+        return iter(self.index)
+
+    def __enter__(self) -> "IconLibrary":
+        """Return the library itself.
+
+        Returns:
+            IconLibrary: The library.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the zip archives."""
+        self.close()
+
+    def read_svg(self, name: str) -> str:
+        """Read the SVG string of an icon.
+
+        Args:
+            name (str): The icon name.
+
+        Raises:
+            KeyError: Icon not found.
+
+        Returns:
+            str: The SVG string.
+        """
+        if name not in self.index:
+            raise KeyError(f"Icon not found: {name}")
+        location = self.index[name]
+        if location.member is None:
+            with open(location.path, "rb") as f:
+                content = f.read()
+        else:
+            content = self._archive(location.path).read(location.member)
+        return content.decode("utf-8")
+
+    def get_svg_object(self, name: str) -> SVGObject:
+        """Parse an icon into an SVG object, without caching.
+
+        Args:
+            name (str): The icon name.
+
+        Raises:
+            KeyError: Icon not found.
+
+        Returns:
+            SVGObject: The SVG object.
+        """
+        return SVGObject(svgstr=self.read_svg(name), limits=self.limits)
+
+    def get_marker(self, name: str) -> Path:
+        """Return the marker of an icon, converting it on the first lookup.
+
+        Args:
+            name (str): The icon name.
+
+        Raises:
+            KeyError: Icon not found.
+
+        Returns:
+            Path: The matplotlib marker.
+        """
+        marker = self._markers.get_or_compute(name, lambda: self._convert(name))
+        return marker.to_path() if isinstance(marker, CompactMarker) else marker
+
+    def close(self) -> None:
+        """Close the zip archives opened by lookups."""
+        with self._lock:
+            for archive in self._archives.values():
+                archive.close()
+            self._archives.clear()
+
+    def _convert(self, name: str) -> Path | CompactMarker:
+        marker = get_marker_from_svg(svgstr=self.read_svg(name), limits=self.limits)
+        if self.dtype is None:
+            return marker
+        return CompactMarker.from_path(marker, self.dtype)
+
+    def _archive(self, path: str) -> zipfile.ZipFile:
+        """Return the zip archive, opening it once to read its directory."""
+        with self._lock:
+            if path not in self._archives:
+                self._archives[path] = zipfile.ZipFile(path)
+            return self._archives[path]
+
+
+def _scan_archive(index: dict[str, IconLocation], path: str, prefix: str) -> None:
+    with zipfile.ZipFile(path) as archive:
+        for member in archive.namelist():
+            stem, suffix = os.path.splitext(member)
+            if suffix.lower() == ".svg" and not member.endswith("/"):
+                index.setdefault(prefix + stem, IconLocation(path=path, member=member))
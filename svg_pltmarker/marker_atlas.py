@@ -0,0 +1,238 @@
+import hashlib
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib.colors import to_rgba
+from matplotlib.path import Path
+from matplotlib.transforms import Affine2D
+
+from .cache import LRUCache
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.image import AxesImage
+
+POINTS_PER_INCH = 72.0
+BLIT_BATCH_PIXELS = 2**24  # Maximum number of sprite pixels blitted at once
+MAX_ALPHA = 1.0 - 1e-6  # Keep log(1 - alpha) finite
+
+ColorType = str | tuple[float, float, float] | tuple[float, float, float, float]
+
+_sprite_cache: LRUCache[tuple, np.ndarray] = LRUCache(
+    "sprite", maxsize=256, maxbytes=64 * 2**20
+)
+
+
+def marker_hash(path: Path) -> str:
+    """Return a hash of the geometry of a marker.
+
+    Args:
+        path (Path): The marker.
+
+    Returns:
+        str: The hex digest of the vertices and codes.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(path.vertices, dtype=np.float64).tobytes())
+    if path.codes is not None:
+        digest.update(np.ascontiguousarray(path.codes, dtype=np.uint8).tobytes())
+    return digest.hexdigest()
+
+
+def rasterize_marker(
+    path: Path,
+    size: float,
+    dpi: float = 100.0,
+    facecolor: ColorType = "black",
+    edgecolor: ColorType = "none",
+    linewidth: float = 1.0,
+) -> np.ndarray:
+    """Rasterize a marker into an RGBA sprite with the Agg renderer.
+
+    Sprites are cached by the marker hash, size, dpi, colors, and line width.
+    The returned sprite is read-only as it is shared through the cache.
+
+    Args:
+        path (Path): The marker, e.g. from ``get_marker_from_svg``.
+        size (float): The marker size in points^2, as ``s`` of ``scatter``.
+        dpi (float, optional): The resolution. Defaults to 100.
+        facecolor (ColorType, optional): The face color. Defaults to "black".
+        edgecolor (ColorType, optional): The edge color. Defaults to "none".
+        linewidth (float, optional): The edge width in points. Defaults to 1.
+
+    Returns:
+        np.ndarray: The sprite as an (H, W, 4) uint8 array with the first row at
+            the top, centered on the marker origin.
+    """
+    key = (
+        marker_hash(path),
+        float(size),
+        float(dpi),
+        to_rgba(facecolor),
+        to_rgba(edgecolor),
+        float(linewidth),
+    )
+    return _sprite_cache.get_or_compute(
+        key,
+        lambda: _rasterize(path, size, dpi, key[3], key[4], linewidth),
+    )
+
+
+def _rasterize(
+    path: Path,
+    size: float,
+    dpi: float,
+    facecolor: tuple[float, float, float, float],
+    edgecolor: tuple[float, float, float, float],
+    linewidth: float,
+) -> np.ndarray:
+    from matplotlib.backends.backend_agg import RendererAgg  # Heavy to import
+
+    # Scale the marker in the same way as MarkerStyle and scatter
+    rescale = np.max(np.abs(path.vertices)) if len(path) else 0.0
+    scale = math.sqrt(size) * dpi / POINTS_PER_INCH * (0.5 / rescale if rescale else 1)
+    extent = 2 * np.max(np.abs(path.vertices)) * scale if len(path) else 0.0
+    extent += linewidth * dpi / POINTS_PER_INCH + 2  # Edge width and antialiasing
+    width = height = max(1, math.ceil(extent)) | 1  # Odd to center the origin
+
+    renderer = RendererAgg(width, height, dpi)
+    gc = renderer.new_gc()
+    gc.set_antialiased(True)
+    gc.set_foreground(edgecolor, isRGBA=True)
+    gc.set_linewidth(linewidth if edgecolor[3] > 0 else 0)
+    transform = Affine2D().scale(scale).translate(width / 2, height / 2)
+    renderer.draw_path(
+        gc, path, transform, rgbFace=facecolor if facecolor[3] > 0 else None
+    )
+    gc.restore()
+    sprite = np.array(renderer.buffer_rgba())
+    sprite.flags.writeable = False
+    return sprite
+
+
+def composite_sprites(
+    image: np.ndarray,
+    sprite: np.ndarray,
+    positions: np.ndarray,
+) -> np.ndarray:
+    """Composite a sprite at all the positions into an image with NumPy blitting.
+
+    Sprites are blended in an order-independent way: the coverage is
+    ``1 - prod(1 - alpha)`` and the color is the alpha-weighted mean of the sprite
+    colors, which equals ordered "over" compositing for single-color sprites.
+
+    Args:
+        image (np.ndarray): The (H, W, 4) RGBA image, uint8 or float in [0, 1].
+            Blended in place if it is a float array.
+        sprite (np.ndarray): The (h, w, 4) uint8 RGBA sprite.
+        positions (np.ndarray): The (N, 2) pixel positions (column, row) of the
+            sprite centers, with rows counted from the top.
+
+    Returns:
+        np.ndarray: The blended image with the same dtype as the input.
+    """
+    assert image.ndim == 3 and image.shape[2] == 4, "Image must be (H, W, 4)"
+    assert sprite.ndim == 3 and sprite.shape[2] == 4, "Sprite must be (h, w, 4)"
+    is_uint8 = image.dtype == np.uint8
+    canvas = image.astype(np.float64) / 255 if is_uint8 else image
+    height, width = canvas.shape[:2]
+    sprite_height, sprite_width = sprite.shape[:2]
+
+    # Visible pixels of the sprite
+    sprite_alpha = sprite[..., 3].astype(np.float64) / 255
+    sprite_rows, sprite_cols = np.nonzero(sprite_alpha)
+    alpha = np.minimum(sprite_alpha[sprite_rows, sprite_cols], MAX_ALPHA)
+    color = sprite[sprite_rows, sprite_cols, :3].astype(np.float64) / 255
+    log_transmittance = np.log1p(-alpha)
+
+    # Top-left corners of the sprites
+    corners = np.rint(np.asarray(positions, dtype=np.float64)).astype(np.int64)
+    corners -= [sprite_width // 2, sprite_height // 2]
+
+    sum_log = np.zeros(height * width)
+    sum_alpha = np.zeros(height * width)
+    sum_color = np.zeros((height * width, 3))
+    batch = max(1, BLIT_BATCH_PIXELS // max(1, len(alpha)))
+    for start in range(0, len(corners), batch):
+        rows = corners[start : start + batch, 1, None] + sprite_rows  # noqa: E203
+        cols = corners[start : start + batch, 0, None] + sprite_cols  # noqa: E203
+        visible = (rows >= 0) & (rows < height) & (cols >= 0) & (cols < width)
+        indices = (rows * width + cols)[visible]
+        pixel_ids = np.broadcast_to(np.arange(len(alpha)), rows.shape)[visible]
+        size = height * width
+        sum_log += np.bincount(indices, log_transmittance[pixel_ids], size)
+        sum_alpha += np.bincount(indices, alpha[pixel_ids], size)
+        for channel in range(3):
+            sum_color[:, channel] += np.bincount(
+                indices, alpha[pixel_ids] * color[pixel_ids, channel], size
+            )
+
+    # Blend the sprites over the image
+    coverage = (1 - np.exp(sum_log)).reshape(height, width, 1)
+    covered = sum_alpha > 0
+    mean_color = np.zeros((height * width, 3))
+    mean_color[covered] = sum_color[covered] / sum_alpha[covered, None]
+    mean_color = mean_color.reshape(height, width, 3)
+    dst_alpha = canvas[..., 3:]
+    out_alpha = coverage + dst_alpha * (1 - coverage)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        out_color = np.where(
+            out_alpha > 0,
+            (mean_color * coverage + canvas[..., :3] * dst_alpha * (1 - coverage))
+            / out_alpha,
+            0,
+        )
+    canvas[..., :3] = out_color
+    canvas[..., 3:] = out_alpha
+    if is_uint8:
+        return np.rint(canvas * 255).astype(np.uint8)
+    return canvas
+
+
+def scatter_sprites(
+    ax: "Axes",
+    x: np.ndarray,
+    y: np.ndarray,
+    marker: Path,
+    s: float = 36.0,
+    facecolor: ColorType = "black",
+    edgecolor: ColorType = "none",
+    linewidth: float = 1.0,
+    **kwargs,
+) -> "AxesImage":
+    """Draw a marker at all the points as a single pre-rasterized image.
+
+    The marker is rasterized once into a sprite, composited at all the points in
+    the pixel grid of the axes, and placed as an ``AxesImage`` covering the current
+    view limits. The image is not re-rendered when the limits or the figure size
+    change afterwards, so set them before calling this function.
+
+    Args:
+        ax (Axes): The axes.
+        x (np.ndarray): The x coordinates of the points.
+        y (np.ndarray): The y coordinates of the points.
+        marker (Path): The marker, e.g. from ``get_marker_from_svg``.
+        s (float, optional): The marker size in points^2. Defaults to 36.
+        facecolor (ColorType, optional): The face color. Defaults to "black".
+        edgecolor (ColorType, optional): The edge color. Defaults to "none".
+        linewidth (float, optional): The edge width in points. Defaults to 1.
+        **kwargs: Keyword arguments passed to ``Axes.imshow``.
+
+    Returns:
+        AxesImage: The image.
+    """
+    dpi = ax.figure.dpi
+    sprite = rasterize_marker(marker, s, dpi, facecolor, edgecolor, linewidth)
+    bbox = ax.get_window_extent()
+    width, height = max(1, round(bbox.width)), max(1, round(bbox.height))
+    xy = np.column_stack([np.ravel(x), np.ravel(y)])
+    pixels = ax.transData.transform(xy) - [bbox.x0, bbox.y0]
+    positions = np.column_stack([pixels[:, 0], height - pixels[:, 1]])
+    image = composite_sprites(np.zeros((height, width, 4)), sprite, positions)
+    x0, x1 = ax.get_xlim()
+    y0, y1 = ax.get_ylim()
+    kwargs.setdefault("interpolation", "nearest")
+    return ax.imshow(
+        image, extent=(x0, x1, y0, y1), origin="upper", aspect="auto", **kwargs
+    )
@@ -0,0 +1,197 @@
+import bisect
+import threading
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+DEFAULT_BUCKETS: tuple[float, ...] = tuple(10.0**exponent for exponent in range(8))
+
+
+class Histogram:
+    """A class to represent a histogram of observed values with cumulative buckets.
+
+    Not thread-safe by itself; ``MetricsRegistry`` serializes the updates.
+
+    Attributes:
+        buckets (tuple[float, ...]): The sorted upper bounds of the buckets.
+        bucket_counts (list[int]): The counts of the buckets, with an extra one
+            for the values greater than the last upper bound.
+        count (int): The number of observed values.
+        total (float): The sum of observed values.
+        min (float | None): The minimum observed value.
+        max (float | None): The maximum observed value.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize the Histogram class.
+
+        Args:
+            buckets (Sequence[float], optional): The upper bounds of the buckets.
+                Defaults to powers of 10 from 1 to 1e7.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.bucket_counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        """Observe a value.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the snapshot of the histogram.
+
+        Returns:
+            dict[str, Any]: The snapshot with cumulative bucket counts keyed by
+                the upper bound (``"+Inf"`` for the last one).
+        """
+        cumulative: dict[str, int] = {}
+        num_values = 0
+        for bound, bucket_count in zip(
+            [*map(str, self.buckets), "+Inf"], self.bucket_counts
+        ):
+            num_values += bucket_count
+            cumulative[bound] = num_values
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": cumulative,
+        }
+
+
+class MetricsRegistry:
+    """A class to aggregate conversion metrics as counters and histograms.
+
+    All updates are serialized by a lock. Instrumented code counts locally and
+    updates the registry once per call, so the registry can be left enabled in
+    production. Metrics of conversions in other processes are not aggregated.
+
+    Attributes:
+        enabled (bool): Whether the updates are recorded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the MetricsRegistry class."""
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, Histogram] = {}
+        self._exporters: list[Callable[[dict[str, Any]], None]] = []
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment a counter.
+
+        Args:
+            name (str): The counter name.
+            value (int, optional): The increment. Defaults to 1.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def update(self, counts: Mapping[str, int]) -> None:
+        """Increment counters at once.
+
+        Args:
+            counts (Mapping[str, int]): The increments keyed by counter name.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            for name, value in counts.items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Observe a value of a histogram.
+
+        Args:
+            name (str): The histogram name.
+            value (float): The observed value.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(value)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the snapshot of all the metrics.
+
+        Returns:
+            dict[str, Any]: The snapshot with ``counters`` and ``histograms``.
+        """
+        with self._lock:
+            return self._snapshot()
+
+    def reset(self) -> None:
+        """Reset all the metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def add_exporter(self, exporter: Callable[[dict[str, Any]], None]) -> None:
+        """Add an exporter called with a snapshot on each ``export``.
+
+        Args:
+            exporter (Callable[[dict[str, Any]], None]): The exporter.
+        """
+        with self._lock:
+            self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter: Callable[[dict[str, Any]], None]) -> None:
+        """Remove an exporter.
+
+        Args:
+            exporter (Callable[[dict[str, Any]], None]): The exporter.
+
+        Raises:
+            ValueError: The exporter is not added.
+        """
+        with self._lock:
+            self._exporters.remove(exporter)
+
+    def export(self, reset: bool = False) -> dict[str, Any]:
+        """Pass a snapshot to all the exporters.
+
+        Args:
+            reset (bool, optional): Whether to reset the metrics after taking
+                the snapshot, to export deltas. Defaults to False.
+
+        Returns:
+            dict[str, Any]: The exported snapshot.
+        """
+        with self._lock:
+            snapshot = self._snapshot()
+            if reset:
+                self._counters.clear()
+                self._histograms.clear()
+            exporters = list(self._exporters)
+        for exporter in exporters:
+            exporter(snapshot)
+        return snapshot
+
+    def _snapshot(self) -> dict[str, Any]:
+        return {
+            "counters": dict(self._counters),
+            "histograms": {
+                name: histogram.snapshot()
+                for name, histogram in self._histograms.items()
+            },
+        }
+
+
+metrics_registry = MetricsRegistry()  # Process-wide registry
@@ -0,0 +1,142 @@
+import hashlib
+import os
+from collections.abc import Hashable, Mapping
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib.path import Path
+
+from .cache import LRUCache
+from .path_converter import get_marker_from_svg
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.collections import PathCollection
+
+MarkerSource = str | os.PathLike | Path
+
+_marker_cache: LRUCache[str, Path] = LRUCache(
+    "marker", maxsize=1024, maxbytes=256 * 2**20
+)
+
+
+def load_marker(source: MarkerSource) -> Path:
+    """Return a matplotlib marker converted from an SVG string or file.
+
+    Conversions are cached by a digest of the SVG string or by the file path. A
+    ``str`` is always read as SVG text, so a path to an SVG file must be given as
+    ``os.PathLike``, e.g. ``pathlib.Path``.
+
+    Args:
+        source (MarkerSource): The SVG string, the path to the SVG file as
+            ``os.PathLike``, or an already converted marker.
+
+    Returns:
+        Path: The matplotlib marker.
+
+    Raises:
+        ValueError: A ``str`` is not SVG text.
+    """
+    if isinstance(source, Path):
+        return source
+    if isinstance(source, os.PathLike):
+        filepath = os.fspath(source)
+        return _marker_cache.get_or_compute(
+            f"file:{filepath}", lambda: get_marker_from_svg(filepath=filepath)
+        )
+    if "<" not in source:
+        raise ValueError(
+            f"Not SVG text: {source[:80]!r}; pass a path to an SVG file as "
+            "os.PathLike, e.g. pathlib.Path"
+        )
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    return _marker_cache.get_or_compute(
+        f"svg:{digest}", lambda: get_marker_from_svg(svgstr=source)
+    )
+
+
+def group_indices(keys: np.ndarray) -> tuple[np.ndarray, list[np.ndarray]]:
+    """Group the indices of the points by their keys.
+
+    Args:
+        keys (np.ndarray): The (N,) keys of the points.
+
+    Returns:
+        tuple[np.ndarray, list[np.ndarray]]: The sorted unique keys and the indices of
+            the points for each of them, in the original order of the points.
+    """
+    unique_keys, inverse, counts = np.unique(
+        np.asarray(keys).ravel(), return_inverse=True, return_counts=True
+    )
+    order = np.argsort(inverse, kind="stable")
+    return unique_keys, np.split(order, np.cumsum(counts)[:-1])
+
+
+def scatter_by_marker(
+    ax: "Axes",
+    x: np.ndarray,
+    y: np.ndarray,
+    keys: np.ndarray,
+    markers: Mapping[Hashable, MarkerSource],
+    s: float | np.ndarray | None = None,
+    c: str | np.ndarray | None = None,
+    **kwargs,
+) -> dict[Hashable, "PathCollection"]:
+    """Draw a scatter where each point uses the marker of its key.
+
+    Each unique marker is converted once, and the points are grouped by key with a
+    single sort, so that one ``PathCollection`` is created per key.
+
+    Args:
+        ax (Axes): The axes.
+        x (np.ndarray): The (N,) x coordinates of the points.
+        y (np.ndarray): The (N,) y coordinates of the points.
+        keys (np.ndarray): The (N,) marker keys of the points.
+        markers (Mapping[Hashable, MarkerSource]): The markers of the keys, as SVG
+            strings, paths to SVG files, or converted markers.
+        s (float | np.ndarray, optional): The marker size in points^2, shared or per
+            point. Defaults to None (the default of ``scatter``).
+        c (str | np.ndarray, optional): The colors, shared or per point. Numeric
+            values are mapped with a norm shared across the keys. Defaults to None.
+        **kwargs: Keyword arguments passed to ``Axes.scatter``.
+
+    Raises:
+        KeyError: A key has no marker.
+        ValueError: The lengths of the arrays do not match.
+
+    Returns:
+        dict[Hashable, PathCollection]: The collections of the keys.
+    """
+    x, y = np.ravel(x), np.ravel(y)
+    keys = np.ravel(keys)
+    if not (len(x) == len(y) == len(keys)):
+        raise ValueError("x, y, and keys must have the same length")
+    unique_keys, groups = group_indices(keys)
+    missing = [key for key in unique_keys.tolist() if key not in markers]
+    if missing:
+        raise KeyError(f"No markers for keys: {missing}")
+
+    # The per-point sizes and colors, which are split by group
+    s_array = None
+    if s is not None and np.ndim(s) > 0:
+        s_array = np.ravel(s)
+    c_array = None
+    if c is not None and not isinstance(c, str) and np.ndim(c) > 0 and len(c) == len(x):
+        c_array = np.asarray(c)
+        if np.issubdtype(c_array.dtype, np.number) and c_array.ndim == 1:
+            # Share the color mapping across the collections
+            if kwargs.get("norm") is None:
+                kwargs.setdefault("vmin", np.min(c_array) if len(c_array) else None)
+                kwargs.setdefault("vmax", np.max(c_array) if len(c_array) else None)
+
+    collections = {}
+    for key, indices in zip(unique_keys.tolist(), groups):
+        collections[key] = ax.scatter(
+            x[indices],
+            y[indices],
+            s=s if s_array is None else s_array[indices],
+            c=c if c_array is None else c_array[indices],
+            marker=load_marker(markers[key]),
+            **kwargs,
+        )
+    return collections
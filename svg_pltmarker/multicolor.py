@@ -0,0 +1,244 @@
+import re
+from itertools import groupby
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib.colors import to_rgba
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
+from pydantic import BaseModel, ConfigDict, Field
+
+from .path_converter import PathConverter
+from .profiler import ConversionProfiler, resolve_profiler
+from .resource_limits import ResourceBudget, ResourceLimits
+from .svg_module import SVGObject, SVGStyle
+from .svg_module.svg_graphic_element_base import SVGGraphicElementBase
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.collections import PathCollection
+
+RGB_PATTERN = re.compile(r"rgba?\(([^)]*)\)")
+
+
+def svg_color_to_rgba(color: str, opacity: float = 1.0) -> tuple[float, ...]:
+    """Convert an SVG color to an RGBA tuple.
+
+    Supports named and hex colors, ``rgb()``/``rgba()`` with numbers or percents,
+    ``none`` and ``transparent`` (fully transparent), and ``currentColor`` (black).
+    Unknown colors, such as references to gradients, are treated as black.
+
+    Args:
+        color (str): The SVG color.
+        opacity (float, optional): The opacity multiplied to the alpha.
+            Defaults to 1.0.
+
+    Returns:
+        tuple[float, ...]: The RGBA values in [0, 1].
+    """
+    color = color.strip()
+    if color in ("none", "transparent"):
+        return (0.0, 0.0, 0.0, 0.0)
+    match = RGB_PATTERN.fullmatch(color)
+    if match is not None:
+        values = [value.strip() for value in match.group(1).split(",")]
+        try:
+            if len(values) not in (3, 4):
+                raise ValueError(f"Invalid color: {color}")
+            channels = [_parse_channel(value, 255) for value in values[:3]]
+            alpha = _parse_channel(values[3], 1) if len(values) > 3 else 1.0
+        except ValueError:  # Treated as an unknown color
+            channels, alpha = [0.0, 0.0, 0.0], 1.0
+        rgba = tuple(np.clip([*channels, alpha], 0.0, 1.0))
+    else:
+        try:
+            rgba = to_rgba(color)
+        except ValueError:
+            rgba = (0.0, 0.0, 0.0, 1.0)
+    return (*map(float, rgba[:3]), float(rgba[3]) * opacity)
+
+
+def _parse_channel(value: str, scale: float) -> float:
+    """Parse a channel of ``rgb()``/``rgba()`` as a number or a percent.
+
+    Args:
+        value (str): The channel value.
+        scale (float): The value of a number which is 100%.
+
+    Raises:
+        ValueError: Invalid number.
+
+    Returns:
+        float: The channel in [0, 1] before clipping.
+    """
+    if value.endswith("%"):
+        return float(value[:-1]) / 100
+    return float(value) / scale
+
+
+class MultiColorMarker(BaseModel):
+    """A class to represent a marker with a path per run of a paint style.
+
+    Attributes:
+        paths (list[Path]): The paths of the style groups in paint order, normalized
+            jointly as ``get_marker_from_svg``.
+        facecolors (np.ndarray): The (G, 4) RGBA fill colors of the groups.
+        edgecolors (np.ndarray): The (G, 4) RGBA stroke colors of the groups.
+        linewidths (np.ndarray): The (G,) stroke widths relative to the marker
+            size, i.e. in the normalized coordinates of the paths.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    paths: list[Path] = Field(description="The paths of the style groups.")
+    facecolors: np.ndarray = Field(description="The RGBA fill colors.")
+    edgecolors: np.ndarray = Field(description="The RGBA stroke colors.")
+    linewidths: np.ndarray = Field(description="The relative stroke widths.")
+
+    @classmethod
+    def from_svg_object(
+        cls,
+        svg: SVGObject,
+        limits: ResourceLimits | ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
+    ) -> "MultiColorMarker":
+        """Convert an SVG object grouping its graphic elements by paint style.
+
+        Consecutive elements of the same style are grouped, so that the groups
+        keep the paint order of the elements: a style used before and after
+        another one makes two groups, drawn under and over the other one.
+
+        Args:
+            svg (SVGObject): The SVG object.
+            limits (ResourceLimits | ResourceBudget, optional): The resource limits.
+                Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler. Defaults to None
+                (the active profiler, if any).
+
+        Returns:
+            MultiColorMarker: The marker.
+        """
+        styles: list[SVGStyle] = []
+        groups: list[list[SVGGraphicElementBase]] = []
+        for style, run in groupby(
+            zip(svg.element_styles, svg.graphic_elements), key=lambda item: item[0]
+        ):
+            styles.append(style)
+            groups.append([element for _, element in run])
+        paths, unit_scale = PathConverter.groups2plt(groups, limits, profiler)
+        return cls(
+            paths=paths,
+            facecolors=np.array(
+                [svg_color_to_rgba(style.fill, style.fill_opacity) for style in styles]
+            ).reshape(-1, 4),
+            edgecolors=np.array(
+                [
+                    svg_color_to_rgba(style.stroke, style.stroke_opacity)
+                    for style in styles
+                ]
+            ).reshape(-1, 4),
+            linewidths=np.array([style.stroke_width for style in styles]) * unit_scale,
+        )
+
+
+def get_multicolor_marker_from_svg(
+    svgstr: str | None = None,
+    filepath: str | None = None,
+    url: str | None = None,
+    limits: ResourceLimits | None = None,
+    profiler: ConversionProfiler | None = None,
+    **kwargs,
+) -> MultiColorMarker:
+    """Get a multi-color marker from an SVG style string, file, or URL.
+
+    Unlike ``get_marker_from_svg``, the fill and stroke of the graphic elements
+    are kept, and each run of consecutive elements with the same paint style is
+    converted to a path.
+
+    Args:
+        svgstr (str, optional): The SVG string. Defaults to None.
+        filepath (str, optional): The path to the SVG file. Defaults to None.
+        url (str, optional): The URL to the SVG file. Defaults to None.
+        limits (ResourceLimits, optional): The resource limits for untrusted input.
+            Defaults to None.
+        profiler (ConversionProfiler, optional): The profiler recording the wall time
+            of each phase. Defaults to None (the active profiler, if any).
+
+    Raises:
+        ExpatError: Invalid SVG file.
+        FileNotFoundError: File not found.
+        IndexError: SVG element not found.
+        ResourceLimitExceeded: A resource limit is exceeded.
+        URLError: URL not found.
+        ValueError: Either svgstr, filepath, or url must be specified.
+
+    Returns:
+        MultiColorMarker: The multi-color marker.
+    """
+    budget = ResourceBudget.of(limits)
+    profiler = resolve_profiler(profiler)
+    svg = SVGObject(
+        svgstr=svgstr,
+        filepath=filepath,
+        url=url,
+        limits=budget,
+        profiler=profiler,
+        **kwargs,
+    )
+    return MultiColorMarker.from_svg_object(svg, budget, profiler)
+
+
+def scatter_multicolor(
+    ax: "Axes",
+    x: np.ndarray,
+    y: np.ndarray,
+    marker: MultiColorMarker,
+    s: float | np.ndarray = 36.0,
+    linewidths: float | np.ndarray | None = None,
+    **kwargs,
+) -> "PathCollection":
+    """Draw a multi-color marker at all the points as a single ``PathCollection``.
+
+    The collection cycles through the G style paths and their colors while each
+    offset is repeated G times, so that every instance is drawn completely, in
+    paint order, before the next one.
+
+    Args:
+        ax (Axes): The axes.
+        x (np.ndarray): The (N,) x coordinates of the points.
+        y (np.ndarray): The (N,) y coordinates of the points.
+        marker (MultiColorMarker): The marker.
+        s (float | np.ndarray, optional): The marker size in points^2, shared or per
+            point. Defaults to 36.
+        linewidths (float | np.ndarray, optional): The stroke widths in points,
+            shared or per style group. Defaults to None (the SVG stroke widths
+            scaled with the marker size).
+        **kwargs: Keyword arguments passed to ``PathCollection``.
+
+    Returns:
+        PathCollection: The collection added to the axes.
+    """
+    from matplotlib.collections import PathCollection  # Heavy to import
+
+    offsets = np.column_stack([np.ravel(x), np.ravel(y)])
+    num_groups = len(marker.paths)
+    sizes = np.atleast_1d(np.asarray(s, dtype=np.float64))
+    if len(sizes) > 1:
+        sizes = np.repeat(sizes, num_groups)
+    if linewidths is None:
+        # The side length of a marker is sqrt(s) points
+        linewidths = np.outer(np.sqrt(np.atleast_1d(s)), marker.linewidths).ravel()
+    collection = PathCollection(
+        marker.paths,
+        sizes=sizes,
+        offsets=np.repeat(offsets, num_groups, axis=0),
+        offset_transform=ax.transData,
+        facecolors=marker.facecolors,
+        edgecolors=marker.edgecolors,
+        linewidths=linewidths,
+        **kwargs,
+    )
+    collection.set_transform(IdentityTransform())  # Sizes are in points as scatter
+    ax.add_collection(collection)
+    ax.autoscale_view()
+    return collection
@@ -1,151 +1,533 @@
 import re
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, cycle, groupby
+from typing import Any
 
 import numpy as np
 from matplotlib.path import Path
 from matplotlib.transforms import Affine2D
 
+from .metrics import metrics_registry
+from .profiler import ConversionProfiler, profile_phase, resolve_profiler
+from .resource_limits import ResourceBudget, ResourceLimits
+from .segments import MarkerSegments
 from .svg_module import SVGObject
+from .svg_module.svg_graphic_element_base import SVGGraphicElementBase
+
+# Inserted between graphic elements so that each of them starts a new subpath
+ELEMENT_SEPARATOR = "M 0.0,0.0 "
+CHUNKS_PER_WORKER = 4  # Number of chunks per worker to balance uneven chunks
+# SVG path, or the vertices, codes, and indices of the MoveTo commands of an element
+PathItem = str | tuple[np.ndarray, np.ndarray, np.ndarray]
+COMMAND_PATTERN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]")
+NUMBER_PATTERN = re.compile(r"[-+]?\d*\.?\d+|\.\d+")
+# The axes of the arguments of absolute commands translated with the path, where
+# None is not a coordinate (the radii, the rotation, and the flags of arcs)
+COMMAND_AXES: dict[str, tuple[int | None, ...]] = {
+    "M": (0, 1),
+    "L": (0, 1),
+    "H": (0,),
+    "V": (1,),
+    "C": (0, 1, 0, 1, 0, 1),
+    "S": (0, 1, 0, 1),
+    "Q": (0, 1, 0, 1),
+    "T": (0, 1),
+    "A": (None, None, None, None, None, 0, 1),
+}
+MIN_INSTANCES = 2  # Number of translated copies of a path to convert it once
 
 
 class PathConverter:
     """A class to convert SVG path to matplotlib path."""
 
     @classmethod
-    def svg2plt(cls, svg_path: str) -> Path:
+    def svg2plt(
+        cls,
+        svg_path: str,
+        limits: ResourceLimits | ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
+    ) -> Path:
         """Convert SVG path to matplotlib path.
 
         Attributes:
             svg_path (str): SVG path.
+            limits (ResourceLimits | ResourceBudget, optional): The resource limits
+                checked while tokenizing and converting the path. Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler recording the wall
+                time of each phase. Defaults to None (the active profiler, if any).
 
         Returns:
             Path: Matplotlib path.
         """
+        budget = ResourceBudget.of(limits)
+        profiler = resolve_profiler(profiler)
+        vertices, codes = cls._parse(svg_path, budget, profiler)
+        with profile_phase(profiler, "normalize"):
+            return cls._normalize(vertices, codes)
+
+    @classmethod
+    def elements2plt(
+        cls,
+        elements: Sequence[SVGGraphicElementBase],
+        num_workers: int | None = None,
+        use_processes: bool = False,
+        limits: ResourceLimits | ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
+        instancing: bool = True,
+    ) -> Path:
+        """Convert SVG graphic elements to a single matplotlib path.
+
+        The result is the same as converting the path representations of all the
+        elements joined by ``ELEMENT_SEPARATOR``. If ``num_workers`` is greater than 1,
+        the elements are partitioned into contiguous chunks balanced by their estimated
+        vertex counts, the chunks are converted in a thread or process pool, and the
+        resulting vertices and codes are stitched back in document order.
+
+        With ``instancing``, elements which are translated copies of each other, such
+        as the dots of a grid, are converted once and translated, which is the same
+        up to the rounding of the translation.
+
+        Attributes:
+            elements (Sequence[SVGGraphicElementBase]): SVG graphic elements.
+            num_workers (int, optional): Number of workers. Defaults to None (serial).
+            use_processes (bool, optional): Whether to use a process pool instead of
+                a thread pool. Defaults to False.
+            limits (ResourceLimits | ResourceBudget, optional): The resource limits
+                checked while tokenizing and converting the paths. Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler recording the wall
+                time of each phase. Defaults to None (the active profiler, if any).
+                The phases converted in a process pool are recorded as a whole
+                as ``convert``.
+            instancing (bool, optional): Whether to convert translated copies of
+                elements once. Defaults to True.
+
+        Returns:
+            Path: Matplotlib path.
+        """
+        budget = ResourceBudget.of(limits)
+        profiler = resolve_profiler(profiler)
+        vertices, codes, _, _ = cls._elements2arrays(
+            elements, num_workers, use_processes, budget, profiler, instancing
+        )
+        with profile_phase(profiler, "normalize"):
+            return cls._normalize(vertices, codes)
+
+    @classmethod
+    def elements2segments(
+        cls,
+        elements: Sequence[SVGGraphicElementBase],
+        num_workers: int | None = None,
+        use_processes: bool = False,
+        limits: ResourceLimits | ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
+        instancing: bool = True,
+    ) -> MarkerSegments:
+        """Convert SVG graphic elements to a path with its element and subpath offsets.
+
+        The path is the same as ``elements2plt``, and the elements and the subpaths
+        are returned by ``MarkerSegments`` as views into its arrays.
+
+        Attributes:
+            elements (Sequence[SVGGraphicElementBase]): SVG graphic elements.
+            num_workers (int, optional): Number of workers. Defaults to None (serial).
+            use_processes (bool, optional): Whether to use a process pool instead of
+                a thread pool. Defaults to False.
+            limits (ResourceLimits | ResourceBudget, optional): The resource limits
+                checked while tokenizing and converting the paths. Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler recording the wall
+                time of each phase. Defaults to None (the active profiler, if any).
+            instancing (bool, optional): Whether to convert translated copies of
+                elements once. Defaults to True.
+
+        Returns:
+            MarkerSegments: The path and the offsets of the elements and subpaths.
+        """
+        budget = ResourceBudget.of(limits)
+        profiler = resolve_profiler(profiler)
+        vertices, codes, element_starts, subpath_starts = cls._elements2arrays(
+            elements, num_workers, use_processes, budget, profiler, instancing
+        )
+        with profile_phase(profiler, "normalize"):
+            path = cls._normalize(vertices, codes)
+        return MarkerSegments(path, element_starts, subpath_starts)
+
+    @classmethod
+    def _elements2arrays(
+        cls,
+        elements: Sequence[SVGGraphicElementBase],
+        num_workers: int | None,
+        use_processes: bool,
+        budget: ResourceBudget | None,
+        profiler: ConversionProfiler | None,
+        instancing: bool,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Parse SVG graphic elements to vertices and codes before normalization.
+
+        Attributes:
+            elements (Sequence[SVGGraphicElementBase]): SVG graphic elements.
+            num_workers (int | None): Number of workers.
+            use_processes (bool): Whether to use a process pool.
+            budget (ResourceBudget | None): The resource budget.
+            profiler (ConversionProfiler | None): The profiler.
+            instancing (bool): Whether to convert translated copies once.
+
+        Returns:
+            np.ndarray: Vertices in the SVG coordinate system.
+            np.ndarray: Codes.
+            np.ndarray: The index of the first vertex of each element.
+            np.ndarray: The index of the first vertex of each subpath.
+        """
+        assert num_workers is None or num_workers >= 1, "Invalid number of workers"
+        with profile_phase(profiler, "path_repr"):
+            items = [_path_item(element) for element in elements]
+        if instancing:
+            items = _instance_items(items, budget, profiler)
+        if num_workers is None or num_workers == 1 or len(items) <= 1:
+            vertices, codes, element_starts, subpath_starts = _parse_chunk(
+                items, True, budget, profiler
+            )
+            if budget is not None:
+                budget.check_vertices(len(vertices))
+            return vertices, codes, element_starts, subpath_starts
+
+        # Partition the elements into chunks and convert them in parallel
+        chunks = _partition_by_vertices(items, num_workers * CHUNKS_PER_WORKER)
+        executor: Executor
+        parse_chunk: Callable[..., tuple[Any, ...]] = _parse_chunk
+        chunk_profiler = profiler
+        if use_processes:
+            executor = ProcessPoolExecutor(max_workers=num_workers)
+            parse_chunk = _parse_chunk_in_process
+            chunk_profiler = None  # Cannot be shared with other processes
+        else:
+            executor = ThreadPoolExecutor(max_workers=num_workers)
+        with executor, profile_phase(profiler if use_processes else None, "convert"):
+            results = list(
+                executor.map(
+                    parse_chunk,
+                    chunks,
+                    [idx == 0 for idx in range(len(chunks))],
+                    [budget] * len(chunks),
+                    [chunk_profiler] * len(chunks),
+                )
+            )
+
+        # Stitch the chunks in document order
+        vertices = np.concatenate([result[0] for result in results])
+        codes = np.concatenate([result[1] for result in results])
+        offsets = np.cumsum([0] + [len(result[1]) for result in results[:-1]])
+        element_starts, subpath_starts = (
+            np.concatenate(
+                [result[idx] + offset for result, offset in zip(results, offsets)]
+            )
+            for idx in (2, 3)
+        )
+        if budget is not None:
+            if use_processes:  # Counted by the workers on copies of the budget
+                budget.add_tokens(sum(result[4] for result in results))
+            budget.check_vertices(len(vertices))
+        return vertices, codes, element_starts, subpath_starts
+
+    @classmethod
+    def groups2plt(
+        cls,
+        groups: Sequence[Sequence[SVGGraphicElementBase]],
+        limits: ResourceLimits | ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
+        instancing: bool = True,
+    ) -> tuple[list[Path], float]:
+        """Convert groups of SVG graphic elements to matplotlib paths.
+
+        Each group is converted as in ``elements2plt``, but all the groups are
+        normalized with their joint bounds, so that the paths overlay exactly like
+        the single path of all the elements.
+
+        Attributes:
+            groups (Sequence[Sequence[SVGGraphicElementBase]]): Groups of SVG
+                graphic elements.
+            limits (ResourceLimits | ResourceBudget, optional): The resource limits
+                checked while tokenizing and converting the paths. Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler recording the wall
+                time of each phase. Defaults to None (the active profiler, if any).
+            instancing (bool, optional): Whether to convert translated copies of
+                elements in a group once. Defaults to True.
+
+        Returns:
+            list[Path]: Matplotlib paths of the groups.
+            float: The scale from the SVG user units to the normalized coordinates.
+        """
+        budget = ResourceBudget.of(limits)
+        profiler = resolve_profiler(profiler)
+        with profile_phase(profiler, "path_repr"):
+            items = [[_path_item(element) for element in group] for group in groups]
+        if instancing:
+            items = [_instance_items(group, budget, profiler) for group in items]
+        parsed = [_parse_chunk(group, True, budget, profiler)[:2] for group in items]
+        if budget is not None:
+            budget.check_vertices(sum(len(vertices) for vertices, _ in parsed))
+
+        with profile_phase(profiler, "normalize"):
+            all_vertices = [vertices for vertices, _ in parsed]
+            if sum(len(group) for group in groups) > 1:
+                # The joined path of all the elements passes through the origin
+                all_vertices.append(np.zeros((1, 2)))
+            stacked = np.concatenate(all_vertices)
+            bounds = (*stacked.min(axis=0), *stacked.max(axis=0))
+            paths = [
+                cls._normalize(vertices, codes, bounds) for vertices, codes in parsed
+            ]
+        size = max(bounds[2] - bounds[0], bounds[3] - bounds[1])
+        return paths, 1 / size if size else 1.0
+
+    @classmethod
+    def _parse(
+        cls,
+        svg_path: str,
+        budget: ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
+        moves: list[tuple[int, int]] | None = None,
+        count_vertices: bool = True,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Parse SVG path to vertices and codes before normalization.
+
+        Attributes:
+            svg_path (str): SVG path.
+            budget (ResourceBudget, optional): The resource budget. Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler. Defaults to None.
+            moves (list[tuple[int, int]], optional): The list to append the position
+                in ``svg_path`` and the index of the first vertex of each MoveTo
+                command to. Defaults to None.
+            count_vertices (bool, optional): Whether to add the vertices to the
+                ``vertices`` metric, which the caller counts otherwise. Defaults to
+                True.
+
+        Returns:
+            np.ndarray: Vertices in the SVG coordinate system.
+            np.ndarray: Codes.
+        """
         vertices_list: list[list[float]] = []
         codes_list: list[np.uint8] = []
 
-        # Find all command
-        command_indices = [
-            m.start() for m in re.finditer(r"[MmLlHhVvCcSsQqTtAaZz]", svg_path)
-        ]
-        assert len(command_indices) > 0, "No command found"
-        assert (
-            svg_path[command_indices[0]].upper() == "M"
-        ), "First command must be MoveTo"
-        command_indices.append(len(svg_path))  # Add the end of the path
+        # Find commands lazily, so that a resource limit aborts before scanning all
+        command_matches = COMMAND_PATTERN.finditer(svg_path)
+        first_match = next(command_matches, None)
+        assert first_match is not None, "No command found"
+        assert first_match.group().upper() == "M", "First command must be MoveTo"
+        command_ends = chain(
+            (m.start() for m in command_matches), [len(svg_path)]
+        )  # Add the end of the path
 
         # Parse each command
         start_pos: complex = 0 + 0j  # Start position
         cur_pos = start_pos  # Current position
         before_command: str = ""  # Before command
         before_points: list[float] = []  # Before points list used in before_command
-        for idx in range(len(command_indices) - 1):
+        command_start = first_match.start()
+        tokenize_ns, convert_ns, arc_ns = 0, 0, 0
+        command_counts: dict[str, int] = {}
+        num_arcs = 0
+        if profiler is not None:
+            lap_ns = time.perf_counter_ns()
+        for command_end in command_ends:
             # Parse command
-            command_str = svg_path[
-                command_indices[idx] : command_indices[idx + 1]  # noqa: E203
-            ].strip()
+            command_position, command_start = command_start, command_end
+            command_str = svg_path[command_position:command_end].strip()
             svg_command = command_str[0].upper()
             is_absolute = command_str[0].isupper()
+            command_counts[svg_command] = command_counts.get(svg_command, 0) + 1
             if before_command == "Z":
                 assert svg_command == "M", "Invalid SVG path as Z is not followed by M"
-            points_list = [
-                float(m) for m in re.findall(r"[-+]?\d*\.?\d+|\.\d+", command_str[1:])
-            ]
+            points_list = [float(m) for m in NUMBER_PATTERN.findall(command_str[1:])]
+            if budget is not None:
+                budget.add_tokens(1 + len(points_list))
+                budget.check_vertices(len(vertices_list))
+                budget.check_time()
+            if profiler is not None:
+                tokenized_ns = time.perf_counter_ns()
+                tokenize_ns += tokenized_ns - lap_ns
             # Convert to matplotlib path
-            if svg_command == "M":
-                new_vertices, new_codes, cur_pos, start_pos = cls._convert_move_to(
-                    points_list, is_absolute, cur_pos
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-                before_command = "L"
-            elif svg_command == "L":
-                new_vertices, new_codes, cur_pos = cls._convert_line_to(
-                    points_list, is_absolute, cur_pos
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-                before_command = "L"
-            elif svg_command == "H":
-                new_vertices, new_codes, cur_pos = cls._convert_horizontal_line_to(
-                    points_list, is_absolute, cur_pos
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-                before_command = "L"
-            elif svg_command == "V":
-                new_vertices, new_codes, cur_pos = cls._convert_vertical_line_to(
-                    points_list, is_absolute, cur_pos
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-                before_command = "L"
-            elif svg_command == "C":
-                (
-                    new_vertices,
-                    new_codes,
-                    cur_pos,
-                    before_command,
-                    before_points,
-                ) = cls._convert_curve4(points_list, is_absolute, cur_pos)
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-            elif svg_command == "S":
-                (
-                    new_vertices,
-                    new_codes,
-                    cur_pos,
-                    before_command,
-                    before_points,
-                ) = cls._convert_smooth_curve4(
-                    points_list, is_absolute, cur_pos, before_command, before_points
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-            elif svg_command == "Q":
-                (
-                    new_vertices,
-                    new_codes,
-                    cur_pos,
-                    before_command,
-                    before_points,
-                ) = cls._convert_curve3(points_list, is_absolute, cur_pos)
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-            elif svg_command == "T":
-                (
-                    new_vertices,
-                    new_codes,
-                    cur_pos,
-                    before_command,
-                    before_points,
-                ) = cls._convert_smooth_curve3(
-                    points_list, is_absolute, cur_pos, before_command, before_points
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
+            if svg_command == "M" and moves is not None:
+                moves.append((command_position, len(vertices_list)))
             elif svg_command == "A":
-                new_vertices, new_codes, cur_pos = cls._convert_arc(
-                    points_list, is_absolute, cur_pos
-                )
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-                before_command = "A"
-            elif svg_command == "Z":
-                new_vertices, new_codes, cur_pos = cls._convert_close(start_pos)
-                vertices_list.extend(new_vertices)
-                codes_list.extend(new_codes)
-                before_command = "Z"
-            else:
-                raise ValueError(f"Invalid SVG path command: {svg_command}")
+                num_arcs += len(points_list) // 7
+            (
+                new_vertices,
+                new_codes,
+                cur_pos,
+                start_pos,
+                before_command,
+                before_points,
+            ) = cls._convert_command(
+                svg_command,
+                points_list,
+                is_absolute,
+                cur_pos,
+                start_pos,
+                before_command,
+                before_points,
+            )
+            vertices_list.extend(new_vertices)
+            codes_list.extend(new_codes)
+            if profiler is not None:
+                lap_ns = time.perf_counter_ns()
+                if svg_command == "A":
+                    arc_ns += lap_ns - tokenized_ns
+                else:
+                    convert_ns += lap_ns - tokenized_ns
+
+        if profiler is not None:
+            profiler.add("tokenize", tokenize_ns)
+            profiler.add("convert", convert_ns)
+            profiler.add("arc", arc_ns)
+        if budget is not None:
+            budget.check_vertices(len(vertices_list))
+        counts = {f"commands.{command}": n for command, n in command_counts.items()}
+        counts["arcs"] = num_arcs
+        if count_vertices:
+            counts["vertices"] = len(vertices_list)
+        metrics_registry.update(counts)
+        vertices = np.array(vertices_list, dtype=np.float64)
+        codes = np.array(codes_list, dtype=np.uint8)
+        return vertices, codes
+
+    @classmethod
+    def _convert_command(
+        cls,
+        svg_command: str,
+        points_list: list[float],
+        is_absolute: bool,
+        cur_pos: complex,
+        start_pos: complex,
+        before_command: str,
+        before_points: list[float],
+    ) -> tuple[list[list[float]], list[np.uint8], complex, complex, str, list[float]]:
+        """Convert an SVG command to matplotlib vertices and codes.
+
+        Attributes:
+            svg_command (str): The upper case SVG command.
+            points_list (list[float]): Points list.
+            is_absolute (bool): Whether the command is absolute or relative.
+            cur_pos (complex): Current position.
+            start_pos (complex): Start position of the subpath.
+            before_command (str): Before command.
+            before_points (list[float]): Before points list used in before_command.
+
+        Raises:
+            ValueError: Invalid SVG path command.
 
-        # Convert to matplotlib path
+        Returns:
+            list[list[float]]: Vertices list.
+            list[np.uint8]: Codes list.
+            complex: Next current position.
+            complex: Next start position.
+            str: Next before command.
+            list[float]: Next before points list.
+        """
+        if svg_command == "M":
+            new_vertices, new_codes, cur_pos, start_pos = cls._convert_move_to(
+                points_list, is_absolute, cur_pos
+            )
+            before_command = "L"
+        elif svg_command == "L":
+            new_vertices, new_codes, cur_pos = cls._convert_line_to(
+                points_list, is_absolute, cur_pos
+            )
+            before_command = "L"
+        elif svg_command == "H":
+            new_vertices, new_codes, cur_pos = cls._convert_horizontal_line_to(
+                points_list, is_absolute, cur_pos
+            )
+            before_command = "L"
+        elif svg_command == "V":
+            new_vertices, new_codes, cur_pos = cls._convert_vertical_line_to(
+                points_list, is_absolute, cur_pos
+            )
+            before_command = "L"
+        elif svg_command == "C":
+            (
+                new_vertices,
+                new_codes,
+                cur_pos,
+                before_command,
+                before_points,
+            ) = cls._convert_curve4(points_list, is_absolute, cur_pos)
+        elif svg_command == "S":
+            (
+                new_vertices,
+                new_codes,
+                cur_pos,
+                before_command,
+                before_points,
+            ) = cls._convert_smooth_curve4(
+                points_list, is_absolute, cur_pos, before_command, before_points
+            )
+        elif svg_command == "Q":
+            (
+                new_vertices,
+                new_codes,
+                cur_pos,
+                before_command,
+                before_points,
+            ) = cls._convert_curve3(points_list, is_absolute, cur_pos)
+        elif svg_command == "T":
+            (
+                new_vertices,
+                new_codes,
+                cur_pos,
+                before_command,
+                before_points,
+            ) = cls._convert_smooth_curve3(
+                points_list, is_absolute, cur_pos, before_command, before_points
+            )
+        elif svg_command == "A":
+            new_vertices, new_codes, cur_pos = cls._convert_arc(
+                points_list, is_absolute, cur_pos
+            )
+            before_command = "A"
+        elif svg_command == "Z":
+            new_vertices, new_codes, cur_pos = cls._convert_close(start_pos)
+            before_command = "Z"
+        else:
+            raise ValueError(f"Invalid SVG path command: {svg_command}")
+        return (
+            new_vertices,
+            new_codes,
+            cur_pos,
+            start_pos,
+            before_command,
+            before_points,
+        )
+
+    @staticmethod
+    def _normalize(
+        vertices: np.ndarray,
+        codes: np.ndarray,
+        bounds: tuple[float, float, float, float] | None = None,
+    ) -> Path:
+        """Normalize vertices and codes in the SVG coordinate system to matplotlib path.
+
+        Attributes:
+            vertices (np.ndarray): Vertices in the SVG coordinate system.
+            codes (np.ndarray): Codes.
+            bounds (tuple[float, float, float, float], optional): The bounds
+                (min_x, min_y, max_x, max_y) to normalize. Defaults to None
+                (the bounds of the vertices).
+
+        Returns:
+            Path: Matplotlib path.
+        """
+        metrics_registry.observe("vertices_per_path", len(vertices))
         # Normalize the path to [-0.5, 0.5] x [-0.5, 0.5] while keeping the aspect ratio
         # Flip the y-axis because of below reasons:
         # Matplotlib: 'O' is the bottom-left corner, SVG: 'O' is the top-left corner
-        vertices = np.array(vertices_list)
-        codes = np.array(codes_list, dtype=np.uint8)
-        min_x, max_x = np.min(vertices[:, 0]), np.max(vertices[:, 0])
-        min_y, max_y = np.min(vertices[:, 1]), np.max(vertices[:, 1])
+        if bounds is None:
+            min_x, max_x = np.min(vertices[:, 0]), np.max(vertices[:, 0])
+            min_y, max_y = np.min(vertices[:, 1]), np.max(vertices[:, 1])
+        else:
+            min_x, min_y, max_x, max_y = bounds
         center_x, center_y = (max_x + min_x) / 2, (max_y + min_y) / 2
         size = max(max_x - min_x, max_y - min_y)
         if size == 0:
@@ -697,10 +1079,317 @@ class PathConverter:
         return vertices_list, codes_list, start_pos
 
 
+def _estimate_vertices(svg_path: str) -> int:
+    """Estimate the number of vertices converted from SVG path without parsing it.
+
+    Args:
+        svg_path (str): SVG path.
+
+    Returns:
+        int: The estimated number of vertices.
+    """
+    num_numbers = len(NUMBER_PATTERN.findall(svg_path))
+    num_arcs = svg_path.count("A") + svg_path.count("a")
+    # A point has 2 numbers, and an arc is converted to up to 4 cubic Bezier curves
+    return num_numbers // 2 + 12 * num_arcs + 1
+
+
+def _path_item(element: SVGGraphicElementBase) -> PathItem:
+    """Return the arrays of a graphic element, or its SVG path if not supported.
+
+    Args:
+        element (SVGGraphicElementBase): The graphic element.
+
+    Returns:
+        PathItem: The vertices, codes, and MoveTo indices, or the SVG path.
+    """
+    arrays = element.path_arrays()
+    if arrays is None:
+        return element.path_repr()
+    vertices, codes = arrays
+    return vertices, codes, np.flatnonzero(codes == Path.MOVETO)
+
+
+def _translation_key(svg_path: str) -> tuple[str, tuple[float, float]] | None:
+    """Return the geometry of an SVG path relative to its first point.
+
+    The absolute coordinates are translated by the first point, and the relative
+    ones are kept, so that translated copies of a path have the same key. The
+    numbers are rounded to 12 significant digits, as the translated coordinates
+    of copies may differ in the last bits.
+
+    Args:
+        svg_path (str): SVG path.
+
+    Returns:
+        str: The key.
+        tuple[float, float]: The first point.
+        Or None if the path is not valid.
+    """
+    command_matches = list(COMMAND_PATTERN.finditer(svg_path))
+    if not command_matches or command_matches[0].group() not in "Mm":
+        return None
+    command_ends = [m.start() for m in command_matches[1:]] + [len(svg_path)]
+    parts = []
+    origin = (0.0, 0.0)
+    for idx, (match, command_end) in enumerate(zip(command_matches, command_ends)):
+        command = match.group()
+        args = [
+            float(m) for m in NUMBER_PATTERN.findall(svg_path, match.end(), command_end)
+        ]
+        if idx == 0:
+            if len(args) < 2:
+                return None
+            origin = (args[0], args[1])
+            if command == "m" and len(args) == 2:  # The same as absolute
+                command = "M"
+            elif command == "m":  # Only the first point is from (0, 0)
+                args[0] = args[1] = 0.0
+        if command in COMMAND_AXES:  # Absolute
+            axes = COMMAND_AXES[command]
+            if len(args) % len(axes):
+                return None
+            args = [
+                value if axis is None else value - origin[axis]
+                for value, axis in zip(args, cycle(axes))
+            ]
+        parts.append(command + ",".join([f"{value:.12g}" for value in args]))
+    return " ".join(parts), origin
+
+
+def _instance_items(
+    items: list[PathItem],
+    budget: ResourceBudget | None,
+    profiler: ConversionProfiler | None,
+) -> list[PathItem]:
+    """Convert translated copies of SVG paths once and expand them by offsets.
+
+    The SVG paths whose commands repeat are keyed by ``_translation_key``. The
+    first path of each key repeated at least ``MIN_INSTANCES`` times is parsed, and
+    the vertices of all the copies are computed by a single broadcast add of their
+    offsets. The copies are replaced by their arrays, which ``_parse_chunk``
+    stitches in as if they were parsed, up to the rounding of the translation.
+
+    Args:
+        items (list[PathItem]): SVG paths or arrays of graphic elements in document
+            order.
+        budget (ResourceBudget | None): The resource budget.
+        profiler (ConversionProfiler | None): The profiler.
+
+    Returns:
+        list[PathItem]: The items with the copies replaced by arrays.
+    """
+    with profile_phase(profiler, "instance"):
+        # Only the paths with repeated commands are keyed, which is cheaper
+        skeletons = [
+            "".join(COMMAND_PATTERN.findall(item)) if isinstance(item, str) else None
+            for item in items
+        ]
+        skeleton_counts = Counter(skeletons)
+        instances: defaultdict[str, list[tuple[int, tuple[float, float]]]]
+        instances = defaultdict(list)
+        for idx, (item, skeleton) in enumerate(zip(items, skeletons)):
+            if skeleton is None or skeleton_counts[skeleton] < MIN_INSTANCES:
+                continue
+            key = _translation_key(item)  # type: ignore[arg-type]
+            if key is not None:
+                instances[key[0]].append((idx, key[1]))
+
+    items = list(items)
+    num_instances, num_vertices = 0, 0
+    for copies in instances.values():
+        if len(copies) < MIN_INSTANCES:
+            continue
+        first_idx, first_origin = copies[0]
+        moves: list[tuple[int, int]] = []
+        num_tokens = 0 if budget is None else budget.num_tokens
+        # The vertices are counted with the other arrays by _parse_chunk
+        vertices, codes = PathConverter._parse(
+            items[first_idx],  # type: ignore[arg-type]
+            budget,
+            profiler,
+            moves,
+            count_vertices=False,
+        )
+        move_indices = np.array([index for _, index in moves], dtype=np.int64)
+        num_vertices += len(vertices) * len(copies)
+        if budget is not None:
+            # The copies have as many tokens as the parsed path
+            num_tokens = budget.num_tokens - num_tokens
+            budget.add_tokens(num_tokens * (len(copies) - 1))
+            budget.check_vertices(num_vertices)  # Before allocating the copies
+        with profile_phase(profiler, "instance"):
+            offsets = np.array([origin for _, origin in copies[1:]]) - first_origin
+            expanded = vertices[np.newaxis] + offsets[:, np.newaxis]
+            items[first_idx] = (vertices, codes, move_indices)
+            for (idx, _), copy_vertices in zip(copies[1:], expanded):
+                items[idx] = (copy_vertices, codes, move_indices)
+        num_instances += len(copies) - 1
+    if num_instances:
+        metrics_registry.increment("instances", num_instances)
+    return items
+
+
+def _partition_by_vertices(
+    items: list[PathItem], num_chunks: int
+) -> list[list[PathItem]]:
+    """Partition graphic elements into contiguous chunks with similar vertex counts.
+
+    Args:
+        items (list[PathItem]): SVG paths or arrays of graphic elements in document
+            order.
+        num_chunks (int): The maximum number of chunks.
+
+    Returns:
+        list[list[PathItem]]: Non-empty chunks of the elements in document order.
+    """
+    cumulative = np.cumsum(
+        [
+            _estimate_vertices(item) if isinstance(item, str) else len(item[0])
+            for item in items
+        ]
+    )
+    targets = cumulative[-1] * np.arange(1, num_chunks) / num_chunks
+    boundaries = np.searchsorted(cumulative, targets, side="right")
+    chunks = []
+    start = 0
+    for end in [*boundaries.tolist(), len(items)]:
+        if end > start:
+            chunks.append(items[start:end])
+            start = end
+    return chunks
+
+
+def _parse_chunk(
+    items: list[PathItem],
+    is_first: bool,
+    budget: ResourceBudget | None,
+    profiler: ConversionProfiler | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Parse a chunk of graphic elements to vertices and codes.
+
+    The result is the same as parsing the SVG paths of the elements joined by
+    ``ELEMENT_SEPARATOR``: runs of SVG paths are joined and parsed at once, and
+    the arrays of the other elements are stitched in after a separator vertex.
+    Defined at module level so that it can be pickled for a process pool.
+
+    Args:
+        items (list[PathItem]): SVG paths or arrays of graphic elements in document
+            order.
+        is_first (bool): Whether the chunk is the first one in the document.
+        budget (ResourceBudget | None): The resource budget.
+        profiler (ConversionProfiler | None): The profiler.
+
+    Returns:
+        np.ndarray: Vertices in the SVG coordinate system.
+        np.ndarray: Codes.
+        np.ndarray: The index of the first vertex of each element after its
+            separator.
+        np.ndarray: The index of the first vertex of each MoveTo command of the
+            elements, which starts a subpath.
+    """
+    vertices_list: list[np.ndarray] = []
+    codes_list: list[np.ndarray] = []
+    element_starts: list[int] = []
+    subpath_starts: list[np.ndarray] = []
+    num_vertices = 0  # Number of vertices before the current group
+    num_array_vertices = 0  # Counted by _parse for SVG paths
+    for is_path, group in groupby(
+        enumerate(items), key=lambda item: isinstance(item[1], str)
+    ):
+        group_items = list(group)
+        if is_path:
+            svg_paths = [item for _, item in group_items if isinstance(item, str)]
+            if is_first and group_items[0][0] == 0:
+                element_starts.append(num_vertices)
+            else:
+                svg_paths.insert(0, "")  # Starts with the separator
+            # The positions of the separators in the joined SVG path
+            separators, position = set(), 0
+            for svg_path in svg_paths[:-1]:
+                position += len(svg_path)
+                separators.add(position)
+                position += len(ELEMENT_SEPARATOR)
+            moves: list[tuple[int, int]] = []
+            vertices, codes = PathConverter._parse(
+                ELEMENT_SEPARATOR.join(svg_paths), budget, profiler, moves
+            )
+            group_starts = []
+            for position, index in moves:
+                if position in separators:
+                    element_starts.append(num_vertices + index + 1)
+                else:
+                    group_starts.append(num_vertices + index)
+            subpath_starts.append(np.array(group_starts, dtype=np.int64))
+            vertices_list.append(vertices)
+            codes_list.append(codes)
+            num_vertices += len(vertices)
+            continue
+        for idx, item in group_items:
+            assert not isinstance(item, str)
+            vertices, codes, move_indices = item
+            is_separated = not (is_first and idx == 0)
+            if is_separated:
+                vertices_list.append(np.zeros((1, 2)))
+                codes_list.append(np.array([Path.MOVETO], dtype=np.uint8))
+            element_starts.append(num_vertices + is_separated)
+            subpath_starts.append(move_indices + (num_vertices + is_separated))
+            vertices_list.append(vertices)
+            codes_list.append(codes)
+            num_vertices += len(vertices) + is_separated
+            num_array_vertices += len(vertices) + is_separated
+    if num_array_vertices:
+        metrics_registry.increment("vertices", num_array_vertices)
+    starts = (
+        np.array(element_starts, dtype=np.int64),
+        np.concatenate(subpath_starts or [np.zeros(0, dtype=np.int64)]),
+    )
+    if not vertices_list:
+        return (*PathConverter._parse("", budget, profiler), *starts)  # No command
+    if len(vertices_list) == 1 and not num_array_vertices:
+        return vertices_list[0], codes_list[0], *starts
+    # Copied, as the arrays of elements are read-only and normalized in place
+    return np.concatenate(vertices_list), np.concatenate(codes_list), *starts
+
+
+def _parse_chunk_in_process(
+    items: list[PathItem],
+    is_first: bool,
+    budget: ResourceBudget | None,
+    profiler: ConversionProfiler | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int]:
+    """Parse a chunk of graphic elements in a worker process.
+
+    The budget is a copy in the worker, so the number of tokens parsed is returned
+    to be added to the budget of the conversion.
+
+    Args:
+        items (list[PathItem]): SVG paths or arrays of graphic elements in document
+            order.
+        is_first (bool): Whether the chunk is the first one in the document.
+        budget (ResourceBudget | None): The copy of the resource budget.
+        profiler (ConversionProfiler | None): The profiler.
+
+    Returns:
+        np.ndarray: The arrays of ``_parse_chunk``.
+        int: The number of tokens parsed.
+    """
+    num_tokens = 0 if budget is None else budget.num_tokens
+    results = _parse_chunk(items, is_first, budget, profiler)
+    if budget is not None:
+        num_tokens = budget.num_tokens - num_tokens
+    return (*results, num_tokens)
+
+
 def get_marker_from_svg(
     svgstr: str | None = None,
     filepath: str | None = None,
     url: str | None = None,
+    num_workers: int | None = None,
+    use_processes: bool = False,
+    limits: ResourceLimits | None = None,
+    profiler: ConversionProfiler | None = None,
+    instancing: bool = True,
     **kwargs,
 ) -> Path:
     """Get a matplotlib marker from an SVG style string, file, or URL.
@@ -711,17 +1400,43 @@ def get_marker_from_svg(
         svgstr (str, optional): The SVG string. Defaults to None.
         filepath (str, optional): The path to the SVG file. Defaults to None.
         url (str, optional): The URL to the SVG file. Defaults to None.
+        num_workers (int, optional): The number of workers to convert graphic elements
+            in parallel. Defaults to None (serial).
+        use_processes (bool, optional): Whether to use a process pool instead of a
+            thread pool for parallel conversion. Defaults to False.
+        limits (ResourceLimits, optional): The resource limits for untrusted input,
+            checked incrementally through the whole conversion. Defaults to None.
+        profiler (ConversionProfiler, optional): The profiler recording the wall time
+            of each phase. Defaults to None (the active profiler, if any).
+        instancing (bool, optional): Whether to convert translated copies of
+            elements once. Defaults to True.
 
     Raises:
         ExpatError: Invalid SVG file.
         FileNotFoundError: File not found.
         IndexError: SVG element not found.
+        ResourceLimitExceeded: A resource limit is exceeded.
         URLError: URL not found.
         ValueError: Either svgstr, filepath, or url must be specified.
 
     Returns:
         Path: The matplotlib marker.
     """
-    svg = SVGObject(svgstr=svgstr, filepath=filepath, url=url, **kwargs)
-    svg_elements_path_list = [element.path_repr() for element in svg.graphic_elements]
-    return PathConverter.svg2plt("M 0.0,0.0 ".join(svg_elements_path_list))
+    budget = ResourceBudget.of(limits)
+    profiler = resolve_profiler(profiler)
+    svg = SVGObject(
+        svgstr=svgstr,
+        filepath=filepath,
+        url=url,
+        limits=budget,
+        profiler=profiler,
+        **kwargs,
+    )
+    return PathConverter.elements2plt(
+        svg.graphic_elements,
+        num_workers=num_workers,
+        use_processes=use_processes,
+        limits=budget,
+        profiler=profiler,
+        instancing=instancing,
+    )
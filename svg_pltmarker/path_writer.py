@@ -0,0 +1,138 @@
+import numpy as np
+from matplotlib.path import Path
+
+COMMANDS = "mlhvqcz"
+# Appended to the integers, which need a space before a number starting with a
+# decimal point
+INTEGER_MARK = "#"
+
+
+def plt2svg(
+    path: Path,
+    precision: int = 4,
+    scale: float = 1.0,
+    flip_y: bool = True,
+) -> str:
+    """Convert matplotlib path to compact SVG path data.
+
+    The vertices are rounded to ``precision`` decimals on an absolute grid and
+    written as relative commands between the grid points, so that the rounding does
+    not accumulate. Repeated commands, the zeros and the separators not needed to
+    parse the numbers are omitted, and horizontal and vertical lines are written as
+    ``h`` and ``v``. A line back to the start of a subpath at its end is written as
+    ``z``, which ``PathConverter`` converts back to the same line.
+
+    >>> plt2svg(get_marker_from_svg(filepath="icon.svg"), precision=3, scale=100)
+    'm-50-12.5 50 25 50-25z'
+
+    Args:
+        path (Path): The path, e.g. a marker from ``get_marker_from_svg``.
+        precision (int, optional): The number of decimals. Defaults to 4.
+        scale (float, optional): The scale of the coordinates, e.g. 100 for a
+            ``viewBox`` of 100 units around a normalized marker. Defaults to 1.0.
+        flip_y (bool, optional): Whether to flip the y-axis, which is up in
+            matplotlib and down in SVG. Defaults to True.
+
+    Raises:
+        ValueError: Negative precision.
+
+    Returns:
+        str: The SVG path data.
+    """
+    if precision < 0:
+        raise ValueError(f"Invalid precision: {precision}")
+    vertices = np.asarray(path.vertices)
+    if path.codes is None:
+        codes = np.full(len(vertices), Path.LINETO, dtype=np.uint8)
+        codes[:1] = Path.MOVETO
+    else:
+        codes = np.asarray(path.codes)
+    (stops,) = np.nonzero(codes == Path.STOP)
+    num_vertices = stops[0] if len(stops) else len(codes)
+    codes = codes[:num_vertices]
+    factor = scale * 10**precision
+    scales = np.array([factor, -factor if flip_y else factor])
+    grid = np.rint(vertices[:num_vertices] * scales).astype(np.int64)
+    indices = np.arange(num_vertices)
+
+    # The current point before each vertex is the end of the previous segment, or
+    # the start of the subpath after a CLOSEPOLY
+    is_move = codes == Path.MOVETO
+    subpath_starts = np.maximum.accumulate(np.where(is_move, indices, 0))
+    ends = grid.copy()
+    is_close = codes == Path.CLOSEPOLY
+    ends[is_close] = grid[subpath_starts[is_close]]
+    is_run_start = np.ones(num_vertices, dtype=bool)
+    is_run_start[1:] = codes[1:] != codes[:-1]
+    run_starts = np.maximum.accumulate(np.where(is_run_start, indices, 0))
+    segment_sizes = np.select(
+        [codes == Path.CURVE4, codes == Path.CURVE3], [3, 2], default=1
+    )
+    is_segment = (indices - run_starts) % segment_sizes == 0
+    segment_starts = np.maximum.accumulate(np.where(is_segment, indices, 0))
+    previous = segment_starts - 1
+    deltas = grid - np.where(previous[:, None] >= 0, ends[previous], 0)
+
+    # The command of each segment, and the numbers written for each vertex
+    (segments,) = np.nonzero(is_segment)
+    segment_codes = codes[segments]
+    segment_deltas = deltas[segments]
+    is_line = segment_codes == Path.LINETO
+    is_last = np.append(is_move[1:], True)[segments]
+    is_closing = (
+        is_line
+        & is_last
+        & np.all(grid[segments] == grid[subpath_starts[segments]], axis=1)
+    )
+    is_horizontal = is_line & ~is_closing & (segment_deltas[:, 1] == 0)
+    is_vertical = is_line & ~is_closing & ~is_horizontal & (segment_deltas[:, 0] == 0)
+    commands = np.select(
+        [
+            segment_codes == Path.MOVETO,
+            is_closing | (segment_codes == Path.CLOSEPOLY),
+            is_horizontal,
+            is_vertical,
+            is_line,
+            segment_codes == Path.CURVE3,
+        ],
+        ["m", "z", "h", "v", "l", "q"],
+        default="c",
+    )
+    is_written = np.ones((num_vertices, 2), dtype=bool)
+    is_written[segments[is_horizontal], 1] = False
+    is_written[segments[is_vertical], 0] = False
+    is_written[segments[commands == "z"]] = False
+
+    # Format all the numbers at once, and remove the trailing and leading zeros
+    numbers = deltas[is_written]
+    divisor = 10**precision
+    is_integer = numbers % divisor == 0
+    template = "".join(
+        np.where(is_integer, f"%d{INTEGER_MARK} ", f"%.{precision}f ").tolist()
+    )
+    formatted = template % tuple((numbers / divisor).tolist())
+    for _ in range(precision - 1):
+        formatted = formatted.replace("0 ", " ")  # 1.500 -> 1.5
+    formatted = f" {formatted}".replace(" 0.", " .").replace(" -0.", " -.")
+    tokens = formatted.split()
+
+    # Prefix the commands not implied by the previous one to their first numbers
+    num_written = is_written.sum(axis=1)
+    first_tokens = (np.cumsum(num_written) - num_written)[segments]
+    implied = np.select([commands == "m", commands == "z"], ["l", ""], commands)
+    is_implied = np.zeros(len(segments), dtype=bool)
+    is_implied[1:] = commands[1:] == implied[:-1]
+    for command, token in zip(
+        commands[~is_implied].tolist(), first_tokens[~is_implied].tolist()
+    ):
+        if command == "z":
+            tokens[token - 1] += command
+        else:
+            tokens[token] = command + tokens[token]
+    # Omit the separators not needed to parse the numbers
+    svg_path = " ".join(tokens)
+    for command in COMMANDS:
+        svg_path = svg_path.replace(f" {command}", command)  # 1 l2 -> 1l2
+    svg_path = svg_path.replace(" -", "-").replace(" .", ".")  # 1 -2 .5 -> 1-2.5
+    svg_path = svg_path.replace(f"{INTEGER_MARK}.", " .")  # 1 .5
+    return svg_path.replace(INTEGER_MARK, "")
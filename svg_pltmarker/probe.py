@@ -0,0 +1,425 @@
+import cmath
+import math
+import os
+import re
+from collections.abc import Iterator
+from itertools import accumulate, chain
+from xml.parsers import expat
+
+import numpy as np
+from pydantic import BaseModel, Field, ValidationError
+
+from .svg_module import SVGObject
+
+# The same patterns as PathConverter, which is not imported to avoid matplotlib
+COMMAND_PATTERN = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]")
+NUMBER_PATTERN = re.compile(r"[-+]?\d*\.?\d+|\.\d+")
+COMMAND_ARITIES = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2}
+COMMAND_ARITIES.update({"A": 7, "Z": 0})
+# The number of vertices converted from one segment of a command, except arcs
+SEGMENT_VERTICES = {"M": 1, "L": 1, "H": 1, "V": 1, "C": 3, "S": 3, "Q": 2, "T": 2}
+SEPARATOR_PATTERN = re.compile(r"[\s,]")
+MAX_ERRORS = 10
+READ_SIZE = 1 << 16  # Bytes read from a file at a time
+BLOCK_SIZE = 1 << 16  # Characters of points parsed at a time
+
+
+class ProbeReport(BaseModel):
+    """A class to represent a summary of an SVG file computed without converting it.
+
+    Attributes:
+        num_bytes (int): The size of the SVG in bytes.
+        elements (dict[str, int]): The number of elements by tag in the svg element.
+        commands (dict[str, int]): The number of path commands by upper-case letter
+            in the path representations of the graphic elements.
+        estimated_vertices (int): The number of vertices of the converted marker.
+        bounds (tuple[float, float, float, float], optional): The (min_x, min_y,
+            max_x, max_y) bounds of the graphic elements in SVG user units. They
+            include the control points of Bezier curves and the origin between
+            elements as the normalization of the marker does, but the extremes of
+            arcs are exact, while the marker includes the control points of the
+            Bezier curves approximating them, so its bounds may be slightly larger
+            with arcs. None if there are no vertices.
+        valid (bool): Whether the SVG can be converted.
+        errors (list[str]): The first errors found.
+    """
+
+    num_bytes: int = Field(default=0, ge=0, description="The size in bytes.")
+    elements: dict[str, int] = Field(default_factory=dict, description="The tags.")
+    commands: dict[str, int] = Field(default_factory=dict, description="The commands.")
+    estimated_vertices: int = Field(default=0, ge=0, description="The vertices.")
+    bounds: tuple[float, float, float, float] | None = Field(
+        default=None, description="The bounds in SVG user units."
+    )
+    valid: bool = Field(default=True, description="Whether it can be converted.")
+    errors: list[str] = Field(default_factory=list, description="The first errors.")
+
+
+def probe(
+    svgstr: str | None = None, filepath: str | os.PathLike | None = None
+) -> ProbeReport:
+    """Summarize an SVG string or file with a streaming scan, without converting it.
+
+    The XML is scanned with expat without building a DOM, and the path data is
+    tokenized and checked command by command without building vertices or
+    converting arcs, so that the time is linear in the size and the memory is
+    bounded by the largest attribute. Invalid input is reported in the result
+    instead of raising.
+
+    >>> report = probe(filepath="upload.svg")
+    >>> report.valid, report.estimated_vertices, report.bounds
+
+    Args:
+        svgstr (str, optional): The SVG string. Defaults to None.
+        filepath (str | os.PathLike, optional): The path to the SVG file.
+            Defaults to None.
+
+    Raises:
+        FileNotFoundError: File not found.
+        ValueError: Either svgstr or filepath must be specified.
+
+    Returns:
+        ProbeReport: The summary.
+    """
+    if (svgstr is None) == (filepath is None):
+        raise ValueError("Either svgstr or filepath must be specified")
+    prober = _Prober()
+    parser = expat.ParserCreate()
+    parser.StartElementHandler = prober.start_element
+    parser.EndElementHandler = prober.end_element
+    try:
+        if svgstr is not None:
+            content = svgstr.encode("utf-8")
+            prober.report.num_bytes = len(content)
+            parser.Parse(content, True)
+        else:
+            try:
+                f = open(filepath, "rb")  # type: ignore[arg-type]
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {filepath}")
+            with f:
+                for chunk in iter(lambda: f.read(READ_SIZE), b""):
+                    prober.report.num_bytes += len(chunk)
+                    parser.Parse(chunk, False)
+                parser.Parse(b"", True)
+    except expat.ExpatError as e:
+        prober.error(f"Invalid XML: {e}")
+    return prober.finish()
+
+
+class _Prober:
+    """Collect a ProbeReport from expat events."""
+
+    def __init__(self) -> None:
+        self.report = ProbeReport()
+        self.depth = 0  # Depth in the first svg element
+        self.has_svg = False
+        self.num_graphic_elements = 0
+        self.num_vertices = 0
+        self.bounds = [math.inf, math.inf, -math.inf, -math.inf]
+
+    def error(self, message: str) -> None:
+        self.report.valid = False
+        if len(self.report.errors) < MAX_ERRORS:
+            self.report.errors.append(message)
+
+    def start_element(self, tag: str, attributes: dict[str, str]) -> None:
+        if self.depth == 0:
+            if tag == "svg" and not self.has_svg:
+                self.has_svg = True
+                self.depth = 1
+            return
+        self.depth += 1
+        elements = self.report.elements
+        elements[tag] = elements.get(tag, 0) + 1
+        if tag in SVGObject.SVG_GRPAHIC_ELEMENTS:
+            self.graphic_element(tag, attributes)
+
+    def end_element(self, tag: str) -> None:
+        if self.depth > 0:
+            self.depth -= 1
+
+    def graphic_element(self, tag: str, attributes: dict[str, str]) -> None:
+        name = f"{tag} #{self.report.elements[tag]}"
+        if self.num_graphic_elements > 0:
+            self.add_vertices(1)  # ELEMENT_SEPARATOR
+        self.num_graphic_elements += 1
+        if tag in ("polygon", "polyline"):
+            self.points(name, attributes.get("points"), tag == "polygon")
+            return
+        element_class = SVGObject.SVG_GRPAHIC_ELEMENTS[tag]
+        try:
+            element = element_class(
+                **{
+                    key: value
+                    for key, value in attributes.items()
+                    if key in element_class.model_fields
+                }
+            )
+            path_repr = element.path_repr()
+        except (AssertionError, ValidationError, ValueError) as e:
+            self.error(f"{name}: invalid attributes: {_first_line(e)}")
+            return
+        error = _PathScanner(self).scan(path_repr)
+        if error is not None:
+            self.error(f"{name}: {error}")
+
+    def points(self, name: str, points: str | None, closed: bool) -> None:
+        if points is None:
+            self.error(f"{name}: missing points")
+            return
+        num_coordinates = 0
+        carry: list[float] = []  # The x of a pair split between blocks
+        for block in _number_blocks(points):
+            num_coordinates += len(block)
+            block = carry + block
+            carry = block[-1:] if len(block) % 2 else []
+            if len(block) > 1:
+                self.add_points(block[0:-1:2], block[1::2])
+        if num_coordinates % 2 or num_coordinates < 4:
+            self.error(f"{name}: points must be 2 or more pairs of coordinates")
+            return
+        self.count_command("M")
+        self.count_command("L", num_coordinates // 2 - 1)
+        if closed:
+            self.count_command("Z")
+        self.add_vertices(num_coordinates // 2 + closed)
+
+    def count_command(self, command: str, count: int = 1) -> None:
+        commands = self.report.commands
+        commands[command] = commands.get(command, 0) + count
+
+    def add_vertices(self, count: int) -> None:
+        self.num_vertices += count
+
+    def add_points(self, xs: list[float], ys: list[float]) -> None:
+        bounds = self.bounds
+        bounds[0], bounds[2] = min(bounds[0], *xs), max(bounds[2], *xs)
+        bounds[1], bounds[3] = min(bounds[1], *ys), max(bounds[3], *ys)
+
+    def add_point(self, point: complex) -> None:
+        bounds, x, y = self.bounds, point.real, point.imag
+        if x < bounds[0]:
+            bounds[0] = x
+        if x > bounds[2]:
+            bounds[2] = x
+        if y < bounds[1]:
+            bounds[1] = y
+        if y > bounds[3]:
+            bounds[3] = y
+
+    def finish(self) -> ProbeReport:
+        if not self.has_svg and self.report.valid:
+            self.error("SVG element not found")
+        elif self.num_graphic_elements == 0 and self.report.valid:
+            self.error("No graphic element found")
+        if self.bounds[0] <= self.bounds[2]:
+            if self.num_graphic_elements > 1:
+                self.add_point(0j)  # ELEMENT_SEPARATOR
+            self.report.bounds = tuple(self.bounds)  # type: ignore[assignment]
+        self.report.commands = dict(sorted(self.report.commands.items()))
+        self.report.estimated_vertices = self.num_vertices
+        return self.report
+
+
+class _PathScanner:
+    """Check SVG path data and accumulate its counts and bounds into a prober."""
+
+    def __init__(self, prober: _Prober) -> None:
+        self.prober = prober
+        self.cur_pos = 0j
+        self.start_pos = 0j
+        self.control_pos = 0j  # The last control point for the smooth curves
+        self.before_command = ""
+
+    def scan(self, svg_path: str) -> str | None:
+        """Scan path data command by command as PathConverter parses it.
+
+        Args:
+            svg_path (str): The path data.
+
+        Returns:
+            str | None: The first error, or None if valid.
+        """
+        command_matches = COMMAND_PATTERN.finditer(svg_path)
+        first_match = next(command_matches, None)
+        if first_match is None:
+            return "no command found"
+        if first_match.group() not in "Mm":
+            return "first command must be MoveTo"
+        command_ends = chain((m.start() for m in command_matches), [len(svg_path)])
+        command_start = first_match.start()
+        prober = self.prober
+        for command_end in command_ends:
+            command = svg_path[command_start]
+            upper = command.upper()
+            args = [
+                float(m)
+                for m in NUMBER_PATTERN.findall(
+                    svg_path, command_start + 1, command_end
+                )
+            ]
+            command_start = command_end
+            prober.count_command(upper)
+            if self.before_command == "Z" and upper != "M":
+                return "Z must be followed by M"
+            if upper == "Z":  # The arguments are ignored
+                self.cur_pos = self.start_pos
+                self.before_command = "Z"
+                prober.add_vertices(1)
+                continue
+            arity = COMMAND_ARITIES[upper]
+            if len(args) % arity or not args:
+                return f"{command} needs a multiple of {arity} arguments"
+            if upper in "MLHV":
+                self.lines(command, args)
+            else:
+                for idx in range(0, len(args), arity):
+                    self.segment(command, args[idx : idx + arity])  # noqa: E203
+        return None
+
+    def lines(self, command: str, args: list[float]) -> None:
+        upper = command.upper()
+        cur_pos = self.cur_pos
+        if upper == "H":
+            xs = args if command.isupper() else _accumulate(args, cur_pos.real)
+            ys = [cur_pos.imag]
+            end = complex(xs[-1], cur_pos.imag)
+        elif upper == "V":
+            ys = args if command.isupper() else _accumulate(args, cur_pos.imag)
+            xs = [cur_pos.real]
+            end = complex(cur_pos.real, ys[-1])
+        else:
+            xs, ys = args[0::2], args[1::2]
+            if command.islower():
+                xs = _accumulate(xs, cur_pos.real)
+                ys = _accumulate(ys, cur_pos.imag)
+            end = complex(xs[-1], ys[-1])
+            if upper == "M":
+                self.start_pos = complex(xs[0], ys[0])
+        self.prober.add_points(xs, ys)
+        self.prober.add_vertices(len(args) // COMMAND_ARITIES[upper])
+        self.cur_pos = self.control_pos = end
+        self.before_command = "L"
+
+    def segment(self, command: str, args: list[float]) -> None:
+        upper = command.upper()
+        origin = 0j if command.isupper() else self.cur_pos
+        prober = self.prober
+        if upper == "A":
+            end = origin + complex(args[5], args[6])
+            self.arc(self.cur_pos, end, args)
+            self.cur_pos = end
+            self.before_command = "A"
+            return
+
+        prober.add_vertices(SEGMENT_VERTICES[upper])
+        points = [
+            origin + complex(args[idx], args[idx + 1]) for idx in range(0, len(args), 2)
+        ]
+        if upper in "ST":
+            # Reflect the last control point of a curve of the same kind
+            if self.before_command in (("C", "S") if upper == "S" else ("Q", "T")):
+                points.insert(0, 2 * self.cur_pos - self.control_pos)
+            else:
+                points.insert(0, self.cur_pos)
+        prober.add_points(
+            [point.real for point in points], [point.imag for point in points]
+        )
+        self.cur_pos = points[-1]
+        self.control_pos = points[-2]
+        self.before_command = upper
+
+    def arc(self, start: complex, end: complex, args: list[float]) -> None:
+        prober = self.prober
+        rx, ry, phi_deg, large_arc, sweep = args[0], args[1], args[2], args[3], args[4]
+        if rx == 0 or ry == 0:
+            prober.add_point(end)
+            prober.add_vertices(1)  # Regarded as LineTo
+            return
+        center, theta1, delta_theta = _endpoint_to_center(
+            start, end, complex(rx, ry), phi_deg, bool(large_arc), bool(sweep)
+        )
+        # The vertices of Path.arc between the angles in increasing order
+        eta1 = theta1 + delta_theta if delta_theta < 0 else theta1
+        eta2 = theta1 if delta_theta < 0 else theta1 + delta_theta
+        n_turns = (eta2 - eta1) / 360
+        if round(n_turns) != 0 and abs(n_turns - round(n_turns)) <= 1e-12:
+            eta2 = eta1 + 360
+        else:
+            eta2 -= 360 * math.floor(n_turns)
+        span = (math.radians(eta2) - math.radians(eta1)) / (math.pi * 0.5)
+        prober.add_vertices(3 * 2 ** math.ceil(span) + 1)
+
+        # The ends and the extremes of x and y on the rotated ellipse, as the radii
+        # are not scaled up and the arc may not end at the end point
+        phi = math.radians(phi_deg)
+        thetas = [eta1, eta2]
+        for angle in (
+            math.atan2(-ry * math.sin(phi), rx * math.cos(phi)),
+            math.atan2(ry * math.cos(phi), rx * math.sin(phi)),
+        ):
+            for theta in (math.degrees(angle), math.degrees(angle) + 180):
+                if (theta - eta1) % 360 <= eta2 - eta1:
+                    thetas.append(theta)
+        for theta in thetas:
+            unit = cmath.rect(1, math.radians(theta))
+            point = complex(rx * unit.real, ry * unit.imag)
+            prober.add_point(center + cmath.rect(1, phi) * point)
+
+
+def _number_blocks(text: str) -> Iterator[list[float]]:
+    """Yield the numbers of a text in blocks split at separators."""
+    pos = 0
+    while pos < len(text):
+        match = SEPARATOR_PATTERN.search(text, pos + BLOCK_SIZE)
+        end = len(text) if match is None else match.end()
+        yield [float(m) for m in NUMBER_PATTERN.findall(text, pos, end)]
+        pos = end
+
+
+def _accumulate(steps: list[float], start: float) -> list[float]:
+    return list(accumulate(steps, initial=start))[1:]
+
+
+def _endpoint_to_center(
+    start: complex,
+    end: complex,
+    radius: complex,
+    phi_deg: float,
+    large_arc: bool,
+    sweep: bool,
+) -> tuple[complex, float, float]:
+    """Compute the center and the angles of an arc as PathConverter does.
+
+    The angles use the arctangent of NumPy, which may differ from math.atan2 in
+    the last bit, so that the numbers of arc segments are the same.
+    """
+    # https://www.w3.org/TR/SVG/implnote.html#ArcConversionEndpointToCenter
+    phi_deg -= math.floor(phi_deg / 360) * 360
+    phi = math.radians(phi_deg)
+    z = cmath.exp(-1j * phi) * (start - end) / 2
+    denom = radius.real**2 * z.imag**2 + radius.imag**2 * z.real**2
+    num = max(0, radius.real**2 * radius.imag**2 - denom)
+    k = math.sqrt(num / denom) if denom else 0.0
+    if large_arc == sweep:
+        k = -k
+    c = k * (
+        radius.real / radius.imag * z.imag - 1j * radius.imag / radius.real * z.real
+    )
+    center = cmath.exp(1j * phi) * c + (start + end) / 2
+    p1, p2 = z - c, -z - c
+    theta1 = math.degrees(np.arctan2(p1.imag / radius.imag, p1.real / radius.real))
+    theta2 = math.degrees(np.arctan2(p2.imag / radius.imag, p2.real / radius.real))
+    delta_theta = theta2 - theta1
+    if theta1 < 0:
+        theta1 += 360
+    if sweep and delta_theta < 0:
+        delta_theta += 360
+    elif not sweep and delta_theta > 0:
+        delta_theta -= 360
+    return center, theta1, delta_theta
+
+
+def _first_line(error: Exception) -> str:
+    return str(error).splitlines()[0] if str(error) else type(error).__name__
@@ -0,0 +1,183 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+
+from pydantic import BaseModel, Field
+
+_active_profiler: ContextVar["ConversionProfiler | None"] = ContextVar(
+    "_active_profiler", default=None
+)
+_null_context = nullcontext()
+
+
+class PhaseTiming(BaseModel):
+    """A class to represent the wall time of a conversion phase.
+
+    Attributes:
+        total_ns (int): The total wall time of the phase in nanoseconds.
+        count (int): The number of times the phase was recorded.
+    """
+
+    total_ns: int = Field(default=0, ge=0, description="The total wall time in ns.")
+    count: int = Field(default=0, ge=0, description="The number of records.")
+
+    @property
+    def total_ms(self) -> float:
+        """Return the total wall time of the phase in milliseconds.
+
+        Returns:
+            float: The total wall time in milliseconds.
+        """
+        return self.total_ns / 1e6
+
+
+class ProfileReport(BaseModel):
+    """A class to represent a per-phase timing report of a conversion.
+
+    Phases are recorded in the order they first occur. Conversion phases are
+    ``fetch``, ``xml_parse``, ``model_build``, ``path_repr``, ``instance``,
+    ``tokenize``, ``convert``, ``arc`` and ``normalize``, and ``hash`` in incremental
+    conversion.
+
+    Attributes:
+        phases (dict[str, PhaseTiming]): The timings keyed by phase name.
+    """
+
+    phases: dict[str, PhaseTiming] = Field(
+        default_factory=dict, description="The timings keyed by phase name."
+    )
+
+    @property
+    def total_ns(self) -> int:
+        """Return the total wall time of all the phases in nanoseconds.
+
+        Returns:
+            int: The total wall time in nanoseconds.
+        """
+        return sum(timing.total_ns for timing in self.phases.values())
+
+    def __str__(self) -> str:
+        """Return a human readable table of the report.
+
+        Returns:
+            str: A string representing the report.
+        """
+        lines = [f"{'phase':<12} {'count':>8} {'time [ms]':>12}"]
+        for name, timing in self.phases.items():
+            lines.append(f"{name:<12} {timing.count:>8} {timing.total_ms:>12.3f}")
+        lines.append(f"{'total':<12} {'':>8} {self.total_ns / 1e6:>12.3f}")
+        return "\n".join(lines)
+
+
+class ConversionProfiler:
+    """A class to record the wall time of each phase of the conversion pipeline.
+
+    Pass a profiler to ``get_marker_from_svg``, ``SVGObject`` or ``PathConverter``,
+    or activate it for the current context with a ``with`` statement:
+
+    >>> with ConversionProfiler() as profiler:
+    ...     marker = get_marker_from_svg(filepath="icon.svg")
+    >>> print(profiler.report())
+
+    Recording is thread-safe, so the phases of threads converting in parallel are
+    summed up.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the ConversionProfiler class."""
+        self._timings: dict[str, list[int]] = {}  # name -> [total_ns, count]
+        self._lock = threading.Lock()
+        self._tokens: list[Token] = []
+
+    def __enter__(self) -> "ConversionProfiler":
+        """Activate the profiler for the current context.
+
+        Returns:
+            ConversionProfiler: The profiler itself.
+        """
+        self._tokens.append(_active_profiler.set(self))
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Deactivate the profiler."""
+        _active_profiler.reset(self._tokens.pop())
+
+    def add(self, name: str, duration_ns: int, count: int = 1) -> None:
+        """Add the wall time of a phase.
+
+        Args:
+            name (str): The phase name.
+            duration_ns (int): The wall time in nanoseconds.
+            count (int, optional): The number of records. Defaults to 1.
+        """
+        with self._lock:
+            timing = self._timings.setdefault(name, [0, 0])
+            timing[0] += duration_ns
+            timing[1] += count
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Measure the wall time of the enclosed block as a phase.
+
+        Args:
+            name (str): The phase name.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def report(self) -> ProfileReport:
+        """Return the report of the recorded phases.
+
+        Returns:
+            ProfileReport: The report.
+        """
+        with self._lock:
+            return ProfileReport(
+                phases={
+                    name: PhaseTiming(total_ns=total_ns, count=count)
+                    for name, (total_ns, count) in self._timings.items()
+                }
+            )
+
+    def reset(self) -> None:
+        """Discard the recorded phases."""
+        with self._lock:
+            self._timings.clear()
+
+
+def resolve_profiler(
+    profiler: ConversionProfiler | None = None,
+) -> ConversionProfiler | None:
+    """Return the given profiler, or the profiler active in the current context.
+
+    Args:
+        profiler (ConversionProfiler, optional): The profiler. Defaults to None.
+
+    Returns:
+        ConversionProfiler | None: The profiler, or None if profiling is disabled.
+    """
+    if profiler is not None:
+        return profiler
+    return _active_profiler.get()
+
+
+def profile_phase(
+    profiler: ConversionProfiler | None, name: str
+) -> AbstractContextManager[None]:
+    """Return a context manager measuring a phase, or doing nothing if disabled.
+
+    Args:
+        profiler (ConversionProfiler | None): The profiler.
+        name (str): The phase name.
+
+    Returns:
+        AbstractContextManager[None]: The context manager.
+    """
+    if profiler is None:
+        return _null_context
+    return profiler.phase(name)
@@ -0,0 +1,158 @@
+import numpy as np
+from matplotlib.path import Path
+
+# int16 vertices are the normalized coordinates in [-0.5, 0.5] times this scale, so
+# that the step is 1 / 65534 of the marker size
+QUANTIZED_SCALE = 65534
+VERTEX_DTYPES = (np.dtype(np.float64), np.dtype(np.float32), np.dtype(np.int16))
+
+
+def _vertex_dtype(dtype: type[np.generic] | np.dtype | str) -> np.dtype:
+    vertex_dtype = np.dtype(dtype)
+    if vertex_dtype.newbyteorder("=") not in VERTEX_DTYPES:
+        raise ValueError(f"Unsupported vertex dtype: {dtype}")
+    return vertex_dtype
+
+
+def quantize_vertices(
+    vertices: np.ndarray, dtype: type[np.generic] | np.dtype | str
+) -> np.ndarray:
+    """Convert normalized marker vertices to a compact dtype.
+
+    float32 keeps about 7 significant digits. int16 stores the coordinates in
+    [-0.5, 0.5] as integers scaled by ``QUANTIZED_SCALE``, which is far below a
+    pixel at any marker size.
+
+    Args:
+        vertices (np.ndarray): The (N, 2) vertices.
+        dtype (type[np.generic] | np.dtype | str): The dtype, float64, float32, or
+            int16, in any byte order.
+
+    Raises:
+        ValueError: Unsupported vertex dtype, or int16 vertices out of
+            [-0.5, 0.5].
+
+    Returns:
+        np.ndarray: The (N, 2) vertices in the dtype, not copied if they already are.
+    """
+    vertex_dtype = _vertex_dtype(dtype)
+    if vertex_dtype.kind == "f":
+        return np.asarray(vertices, dtype=vertex_dtype)
+    vertices = np.asarray(vertices, dtype=np.float64)
+    if not np.all(np.abs(vertices) <= 0.5 + 1e-9):  # Also rejects NaN
+        raise ValueError("int16 vertices must be normalized to [-0.5, 0.5]")
+    scaled = np.rint(vertices * QUANTIZED_SCALE)
+    np.clip(scaled, -QUANTIZED_SCALE // 2, QUANTIZED_SCALE // 2, out=scaled)
+    return scaled.astype(vertex_dtype)
+
+
+def dequantize_vertices(vertices: np.ndarray) -> np.ndarray:
+    """Convert vertices stored by ``quantize_vertices`` back to float64.
+
+    Args:
+        vertices (np.ndarray): The (N, 2) vertices in float64, float32, or int16.
+
+    Raises:
+        ValueError: Unsupported vertex dtype.
+
+    Returns:
+        np.ndarray: The (N, 2) float64 vertices, not copied if they already are.
+    """
+    vertex_dtype = _vertex_dtype(vertices.dtype)
+    if vertex_dtype.kind == "f":
+        return np.asarray(vertices, dtype=np.float64)
+    return vertices / np.float64(QUANTIZED_SCALE)
+
+
+class CompactMarker:
+    """A class to hold a marker with compact vertices until it is drawn.
+
+    Matplotlib paths always hold float64 vertices, so a marker kept as float32 or
+    int16 vertices takes a half or a quarter of the memory, and ``to_path``
+    dequantizes it into a path when it is handed to matplotlib.
+
+    >>> compact = CompactMarker.from_path(get_marker_from_svg(svgstr), "int16")
+    >>> ax.scatter(x, y, marker=compact.to_path())
+
+    Attributes:
+        vertices (np.ndarray): The read-only (N, 2) vertices in the compact dtype.
+        codes (np.ndarray): The read-only (N,) uint8 codes.
+    """
+
+    __slots__ = ("vertices", "codes")
+
+    def __init__(self, vertices: np.ndarray, codes: np.ndarray) -> None:
+        """Initialize the CompactMarker class.
+
+        Args:
+            vertices (np.ndarray): The (N, 2) vertices returned by
+                ``quantize_vertices``.
+            codes (np.ndarray): The (N,) codes.
+
+        Raises:
+            ValueError: Unsupported vertex dtype.
+        """
+        _vertex_dtype(vertices.dtype)
+        self.vertices = vertices
+        self.codes = np.asarray(codes, dtype=np.uint8)
+        for array in (self.vertices, self.codes):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_path(
+        cls, path: Path, dtype: type[np.generic] | np.dtype | str = np.float32
+    ) -> "CompactMarker":
+        """Quantize a normalized marker.
+
+        Args:
+            path (Path): The marker, e.g. from ``get_marker_from_svg``.
+            dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype,
+                float64, float32, or int16. Defaults to float32.
+
+        Raises:
+            ValueError: Unsupported vertex dtype, or int16 vertices out of
+                [-0.5, 0.5].
+
+        Returns:
+            CompactMarker: The marker with copied vertices in the dtype.
+        """
+        vertices = np.array(quantize_vertices(np.asarray(path.vertices), dtype))
+        codes = path.codes
+        if codes is None:
+            codes = np.full(len(vertices), Path.LINETO, dtype=np.uint8)
+            codes[:1] = Path.MOVETO
+        return cls(vertices, np.array(codes, dtype=np.uint8))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the vertex dtype.
+
+        Returns:
+            np.dtype: The vertex dtype.
+        """
+        return self.vertices.dtype
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the arrays.
+
+        Returns:
+            int: The number of bytes of the vertices and the codes.
+        """
+        return self.vertices.nbytes + self.codes.nbytes
+
+    def __len__(self) -> int:
+        """Return the number of vertices.
+
+        Returns:
+            int: The number of vertices.
+        """
+        return len(self.vertices)
+
+    def to_path(self) -> Path:
+        """Dequantize the marker into a matplotlib path.
+
+        Returns:
+            Path: The read-only path with float64 vertices.
+        """
+        return Path(dequantize_vertices(self.vertices), self.codes, readonly=True)
@@ -0,0 +1,222 @@
+import threading
+import time
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class ResourceLimitExceeded(RuntimeError):
+    """An exception raised when a resource limit is exceeded during conversion.
+
+    Attributes:
+        resource (str): The name of the exceeded resource.
+        limit (float): The limit of the resource.
+        value (float): The value of the resource when the limit is exceeded.
+    """
+
+    def __init__(self, resource: str, limit: float, value: float) -> None:
+        """Initialize the ResourceLimitExceeded class.
+
+        Args:
+            resource (str): The name of the exceeded resource.
+            limit (float): The limit of the resource.
+            value (float): The value of the resource when the limit is exceeded.
+        """
+        super().__init__(f"Resource limit exceeded: {resource} ({value} > {limit})")
+        self.resource = resource
+        self.limit = limit
+        self.value = value
+
+    def __reduce__(self) -> tuple[type, tuple[str, float, float]]:
+        # Raised in worker processes and pickled back to the caller
+        return type(self), (self.resource, self.limit, self.value)
+
+
+class ResourceLimits(BaseModel):
+    """A class to represent resource limits for untrusted SVG input.
+
+    Each limit is disabled if it is None.
+
+    Attributes:
+        max_bytes (int, optional): The maximum input size in bytes
+            (in characters for an SVG string). Defaults to None.
+        max_elements (int, optional): The maximum number of XML elements.
+            Defaults to None.
+        max_depth (int, optional): The maximum nesting depth of XML elements
+            under the root element, usually the svg element. Defaults to None.
+        max_tokens (int, optional): The maximum number of path commands and numbers.
+            Defaults to None.
+        max_vertices (int, optional): The maximum number of output vertices.
+            Defaults to None.
+        max_seconds (float, optional): The maximum wall-clock time in seconds.
+            Defaults to None.
+    """
+
+    max_bytes: int | None = Field(
+        default=None, gt=0, description="The maximum input size in bytes."
+    )
+    max_elements: int | None = Field(
+        default=None, gt=0, description="The maximum number of XML elements."
+    )
+    max_depth: int | None = Field(
+        default=None, gt=0, description="The maximum nesting depth of XML elements."
+    )
+    max_tokens: int | None = Field(
+        default=None,
+        gt=0,
+        description="The maximum number of path commands and numbers.",
+    )
+    max_vertices: int | None = Field(
+        default=None, gt=0, description="The maximum number of output vertices."
+    )
+    max_seconds: float | None = Field(
+        default=None, gt=0.0, description="The maximum wall-clock time in seconds."
+    )
+
+    def start(self) -> "ResourceBudget":
+        """Start a budget whose wall-clock time is measured from now.
+
+        Returns:
+            ResourceBudget: The started budget.
+        """
+        return ResourceBudget(self)
+
+
+class ResourceBudget:
+    """A class to check resource limits incrementally during conversion.
+
+    A budget is shared by all the phases of a conversion, so that the wall-clock
+    limit covers the whole conversion, and the tokens of all the parsed paths
+    are counted against one total, also by concurrent threads.
+
+    Attributes:
+        limits (ResourceLimits): The resource limits.
+        deadline (float | None): The deadline in ``time.monotonic`` seconds.
+        num_tokens (int): The number of path commands and numbers parsed so far.
+    """
+
+    def __init__(self, limits: ResourceLimits) -> None:
+        """Initialize the ResourceBudget class.
+
+        Args:
+            limits (ResourceLimits): The resource limits.
+        """
+        self.limits = limits
+        self.deadline: float | None = None
+        if limits.max_seconds is not None:
+            self.deadline = time.monotonic() + limits.max_seconds
+        self.num_tokens = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The lock cannot be pickled for a process pool
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def of(
+        limits: "ResourceLimits | ResourceBudget | None",
+    ) -> "ResourceBudget | None":
+        """Return a budget for the given limits, or the given budget as it is.
+
+        Args:
+            limits (ResourceLimits | ResourceBudget | None): The limits or budget.
+
+        Returns:
+            ResourceBudget | None: The budget, or None if no limit is given.
+        """
+        if isinstance(limits, ResourceLimits):
+            return limits.start()
+        return limits
+
+    def check_bytes(self, num_bytes: int) -> None:
+        """Check the input size.
+
+        Args:
+            num_bytes (int): The input size in bytes.
+
+        Raises:
+            ResourceLimitExceeded: The input size exceeds the limit.
+        """
+        self._check("bytes", self.limits.max_bytes, num_bytes)
+
+    def check_elements(self, num_elements: int) -> None:
+        """Check the number of XML elements.
+
+        Args:
+            num_elements (int): The number of XML elements.
+
+        Raises:
+            ResourceLimitExceeded: The number of XML elements exceeds the limit.
+        """
+        self._check("elements", self.limits.max_elements, num_elements)
+
+    def check_depth(self, depth: int) -> None:
+        """Check the nesting depth of XML elements.
+
+        Args:
+            depth (int): The nesting depth.
+
+        Raises:
+            ResourceLimitExceeded: The nesting depth exceeds the limit.
+        """
+        self._check("depth", self.limits.max_depth, depth)
+
+    def check_tokens(self, num_tokens: int) -> None:
+        """Check the number of path commands and numbers.
+
+        Args:
+            num_tokens (int): The number of path commands and numbers.
+
+        Raises:
+            ResourceLimitExceeded: The number of tokens exceeds the limit.
+        """
+        self._check("tokens", self.limits.max_tokens, num_tokens)
+
+    def add_tokens(self, num_tokens: int) -> None:
+        """Add parsed path commands and numbers to the total and check it.
+
+        Args:
+            num_tokens (int): The number of path commands and numbers parsed.
+
+        Raises:
+            ResourceLimitExceeded: The total number of tokens exceeds the limit.
+        """
+        with self._lock:
+            self.num_tokens += num_tokens
+            total = self.num_tokens
+        self.check_tokens(total)
+
+    def check_vertices(self, num_vertices: int) -> None:
+        """Check the number of output vertices.
+
+        Args:
+            num_vertices (int): The number of output vertices.
+
+        Raises:
+            ResourceLimitExceeded: The number of vertices exceeds the limit.
+        """
+        self._check("vertices", self.limits.max_vertices, num_vertices)
+
+    def check_time(self) -> None:
+        """Check the wall-clock time.
+
+        Raises:
+            ResourceLimitExceeded: The wall-clock time exceeds the limit.
+        """
+        if self.deadline is not None:
+            now = time.monotonic()
+            if now > self.deadline:
+                assert self.limits.max_seconds is not None
+                elapsed = self.limits.max_seconds + now - self.deadline
+                raise ResourceLimitExceeded("seconds", self.limits.max_seconds, elapsed)
+
+    @staticmethod
+    def _check(resource: str, limit: float | None, value: float) -> None:
+        if limit is not None and value > limit:
+            raise ResourceLimitExceeded(resource, limit, value)
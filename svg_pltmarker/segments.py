@@ -0,0 +1,117 @@
+import numpy as np
+from matplotlib.path import Path
+
+
+class MarkerSegments:
+    """A class to access the elements and the subpaths of a marker as views.
+
+    The converter records where each graphic element and each of its MoveTo
+    commands start in the vertices of the marker, so that an element or a subpath
+    is returned as a path over slices of the single vertex and code buffers without
+    copying them, unlike ``Path.to_polygons`` or ``Path.iter_segments``. The
+    separator vertices between the elements belong to neither. A subpath may hold
+    more MoveTo codes, as arcs are converted starting with one.
+
+    >>> segments = PathConverter.elements2segments(svg.graphic_elements)
+    >>> patch = PathPatch(segments.element(3), facecolor="red")
+    >>> svg.graphic_elements[segments.subpath_elements[7]]
+
+    Attributes:
+        path (Path): The marker.
+        element_starts (np.ndarray): The (N,) index of the first vertex of each
+            element.
+        element_stops (np.ndarray): The (N,) index after the last vertex of each
+            element.
+        subpath_starts (np.ndarray): The (M,) index of the first vertex of each
+            subpath.
+        subpath_stops (np.ndarray): The (M,) index after the last vertex of each
+            subpath.
+        subpath_elements (np.ndarray): The (M,) index of the element of each subpath.
+    """
+
+    def __init__(
+        self, path: Path, element_starts: np.ndarray, subpath_starts: np.ndarray
+    ) -> None:
+        """Initialize the MarkerSegments class.
+
+        Args:
+            path (Path): The marker converted from the elements.
+            element_starts (np.ndarray): The (N,) ascending index of the first vertex
+                of each element, where each element but the first one is preceded by
+                a separator vertex.
+            subpath_starts (np.ndarray): The (M,) ascending index of the first vertex
+                of each subpath.
+        """
+        self.path = path
+        self.element_starts = np.array(element_starts, dtype=np.int64)
+        self.element_stops = np.append(self.element_starts[1:] - 1, len(path))
+        self.subpath_starts = np.array(subpath_starts, dtype=np.int64)
+        self.subpath_elements = (
+            np.searchsorted(self.element_starts, self.subpath_starts, side="right") - 1
+        )
+        # Each subpath ends at the next one or at the end of its element
+        self.subpath_stops = np.minimum(
+            np.append(self.subpath_starts[1:], len(path)),
+            self.element_stops[self.subpath_elements],
+        )
+        for array in (
+            self.element_starts,
+            self.element_stops,
+            self.subpath_starts,
+            self.subpath_stops,
+            self.subpath_elements,
+        ):
+            array.flags.writeable = False
+
+    @property
+    def num_elements(self) -> int:
+        """Return the number of elements.
+
+        Returns:
+            int: The number of elements.
+        """
+        return len(self.element_starts)
+
+    @property
+    def num_subpaths(self) -> int:
+        """Return the number of subpaths.
+
+        Returns:
+            int: The number of subpaths.
+        """
+        return len(self.subpath_starts)
+
+    def element(self, index: int) -> Path:
+        """Return the path of an element.
+
+        Args:
+            index (int): The index of the element in the converted sequence.
+
+        Raises:
+            IndexError: Element index out of range.
+
+        Returns:
+            Path: The read-only path whose arrays are views into the marker.
+        """
+        return self._slice(self.element_starts[index], self.element_stops[index])
+
+    def subpath(self, index: int) -> Path:
+        """Return the path of a subpath.
+
+        Args:
+            index (int): The index of the subpath, see ``subpath_elements`` for its
+                element.
+
+        Raises:
+            IndexError: Subpath index out of range.
+
+        Returns:
+            Path: The read-only path whose arrays are views into the marker.
+        """
+        return self._slice(self.subpath_starts[index], self.subpath_stops[index])
+
+    def _slice(self, start: int, stop: int) -> Path:
+        codes = self.path.codes
+        if codes is not None:
+            codes = np.asarray(codes)[start:stop]
+        return Path(np.asarray(self.path.vertices)[start:stop], codes, readonly=True)
@@ -0,0 +1,238 @@
+import io
+import os
+import sys
+from collections.abc import Iterator, Mapping
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from matplotlib.path import Path
+
+from .bundle import MarkerBundle, _write_bundle
+
+# The resource trackers registering the blocks to unlink them, by block name
+_owner_trackers: dict[str, tuple[int, int] | None] = {}
+
+
+class _SharedMemory(shared_memory.SharedMemory):
+    def close(self) -> None:
+        try:
+            super().close()
+        except BufferError:
+            pass  # Unmapped when the last view is garbage collected
+
+
+def _tracker_id() -> tuple[int, int] | None:
+    """Return the identity of the resource tracker registering attached blocks.
+
+    Forked and spawned children inherit the pipe to the tracker of their parent, so
+    that the same pipe means the same tracker.
+
+    Returns:
+        tuple[int, int] | None: The device and inode of the pipe, or None if
+            attached blocks are not registered.
+    """
+    if sys.version_info >= (3, 13) or os.name != "posix":
+        return None
+    fd = resource_tracker.getfd()
+    assert fd is not None  # Started if not running
+    stat = os.fstat(fd)
+    return stat.st_dev, stat.st_ino
+
+
+def _attach(name: str, owner_tracker: tuple[int, int] | None) -> "SharedMarkerStore":
+    """Attach to a store unpickled in another process.
+
+    Args:
+        name (str): The name of the shared memory block.
+        owner_tracker (tuple[int, int] | None): The identity of the resource
+            tracker registering the block for the owner.
+
+    Returns:
+        SharedMarkerStore: The attached store.
+    """
+    if owner_tracker is not None:
+        _owner_trackers.setdefault(name, owner_tracker)
+    return SharedMarkerStore.attach(name)
+
+
+class SharedMarkerStore:
+    """A class to share converted markers between processes without copying.
+
+    The creating process packs the markers in the bundle format into one
+    ``multiprocessing.shared_memory`` block. Other processes attach to it by name,
+    and the markers are read-only paths whose arrays are views into the block.
+
+    The store is safe to use with both fork and spawn: forked children inherit the
+    attached block but never unlink it, and pickling a store, e.g. to pass it to
+    a spawned worker, attaches to the block by name in the worker. Only the owner
+    registers the block to the resource tracker, which unlinks it if the owner
+    exits without ``unlink``.
+
+    >>> with SharedMarkerStore.create(markers) as store:
+    ...     pool.map(plot, [store] * num_workers)  # In a worker: store["cat"]
+
+    Attributes:
+        name (str): The name of the shared memory block.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner_pid: int | None) -> None:
+        """Initialize the SharedMarkerStore class.
+
+        Use ``create`` or ``attach`` instead.
+
+        Args:
+            shm (shared_memory.SharedMemory): The shared memory block.
+            owner_pid (int, optional): The ID of the process which unlinks the block,
+                or None if attached.
+        """
+        self._shm = shm
+        self._owner_pid = owner_pid
+        self._bundle = MarkerBundle(buffer=shm.buf)
+        self.name = shm.name
+
+    @classmethod
+    def create(
+        cls,
+        markers: Mapping[str, Path],
+        dtype: type[np.generic] | np.dtype | str = np.float64,
+    ) -> "SharedMarkerStore":
+        """Pack markers into a new shared memory block.
+
+        Args:
+            markers (Mapping[str, Path]): The markers keyed by name.
+            dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype,
+                float64, float32, or int16 for markers normalized to [-0.5, 0.5].
+                Defaults to float64.
+
+        Raises:
+            ValueError: Unsupported vertex dtype, or int16 vertices out of
+                [-0.5, 0.5].
+
+        Returns:
+            SharedMarkerStore: The store owned by the current process.
+        """
+        with io.BytesIO() as f:
+            _write_bundle(f, markers, dtype)
+            content = f.getbuffer()
+            shm = _SharedMemory(create=True, size=max(1, len(content)))
+            shm.buf[: len(content)] = content
+            del content  # Release the export of the BytesIO buffer
+        _owner_trackers[shm.name] = _tracker_id()
+        return cls(shm, owner_pid=os.getpid())
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMarkerStore":
+        """Attach to a store created by another process.
+
+        Args:
+            name (str): The name of the shared memory block.
+
+        Raises:
+            FileNotFoundError: Shared memory block not found.
+
+        Returns:
+            SharedMarkerStore: The attached store.
+        """
+        if sys.version_info >= (3, 13):
+            shm = _SharedMemory(name=name, track=False)
+        else:
+            shm = _SharedMemory(name=name)
+            tracker = _tracker_id()
+            if tracker is not None and _owner_trackers.get(shm.name) != tracker:
+                # The tracker of the owner keeps the registration, but another one
+                # unlinks the block when the attached process exits (cpython 82300)
+                tracked_name = shm._name  # type: ignore[attr-defined]
+                resource_tracker.unregister(tracked_name, "shared_memory")
+        return cls(shm, owner_pid=None)
+
+    def __reduce__(self) -> tuple:
+        """Pickle the store as its name to attach to it in another process.
+
+        Returns:
+            tuple: The function and the arguments to attach to the store.
+        """
+        return _attach, (self.name, _owner_trackers.get(self.name))
+
+    @property
+    def is_owner(self) -> bool:
+        """Return whether the current process owns the shared memory block.
+
+        Returns:
+            bool: Whether the current process created the block.
+        """
+        return self._owner_pid == os.getpid()
+
+    def __len__(self) -> int:
+        """Return the number of markers.
+
+        Returns:
+            int: The number of markers.
+        """
+        return len(self._bundle)
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the marker is in the store.
+
+        Args:
+            name (str): The marker name.
+
+        Returns:
+            bool: Whether the marker is in the store.
+        """
+        return name in self._bundle
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the marker names.
+
+        Returns:
+            Iterator[str]: The marker names.
+        """
+        return iter(self._bundle)
+
+    def __getitem__(self, name: str) -> Path:
+        """Return a read-only marker over the shared memory.
+
+        Args:
+            name (str): The marker name.
+
+        Raises:
+            KeyError: Marker not found.
+
+        Returns:
+            Path: The matplotlib path.
+        """
+        return self._bundle[name]
+
+    def __enter__(self) -> "SharedMarkerStore":
+        """Return the store itself.
+
+        Returns:
+            SharedMarkerStore: The store.
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Detach from the store, and unlink it in the owner process."""
+        self.close()
+        if self.is_owner:
+            self.unlink()
+
+    def close(self) -> None:
+        """Detach the current process from the shared memory block.
+
+        The block stays mapped until the markers referring to it are released.
+        """
+        self._bundle.close()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block once all the processes detach from it.
+
+        Raises:
+            PermissionError: The current process is not the owner.
+        """
+        if not self.is_owner:
+            raise PermissionError("Only the creating process can unlink the store")
+        self._owner_pid = None
+        _owner_trackers.pop(self._shm.name, None)
+        self._shm.unlink()
@@ -0,0 +1,273 @@
+import codecs
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from matplotlib.path import Path
+
+from .metrics import metrics_registry
+from .path_converter import COMMAND_PATTERN, NUMBER_PATTERN, PathConverter
+from .profiler import ConversionProfiler, profile_phase, resolve_profiler
+from .resource_limits import ResourceBudget, ResourceLimits
+
+DEFAULT_BLOCK_SIZE = 65536  # Number of vertices per block
+# Number of arguments of each command, where the arguments of Z are ignored
+COMMAND_ARITIES = {
+    "M": 2,
+    "L": 2,
+    "H": 1,
+    "V": 1,
+    "C": 6,
+    "S": 4,
+    "Q": 4,
+    "T": 2,
+    "A": 7,
+    "Z": 0,
+}
+# The characters of a number, which may continue in the next chunk
+NUMBER_CHARS = "0123456789.+-"
+
+
+def iter_path_blocks(
+    chunks: Iterable[str | bytes],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    limits: ResourceLimits | ResourceBudget | None = None,
+    profiler: ConversionProfiler | None = None,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Parse SVG path data streamed in chunks to blocks of vertices and codes.
+
+    The result is the same as ``PathConverter.svg2plt`` of the joined chunks before
+    the normalization, but neither the path data nor its commands are held as a
+    whole: the numbers at the end of a chunk are carried over to the next one, the
+    arguments of a long command are converted as they arrive, and the vertices are
+    yielded as soon as a block is full. The memory is proportional to the chunk and
+    block sizes, not to the size of the path data.
+
+    >>> with open("contours.txt", "rb") as f:
+    ...     for vertices, codes in iter_path_blocks(iter(lambda: f.read(1 << 20), b"")):
+    ...         ...
+
+    Args:
+        chunks (Iterable[str | bytes]): The chunks of the path data, where bytes are
+            decoded as UTF-8 even if a character is split between chunks.
+        block_size (int, optional): The number of vertices per block, all but the
+            last of which are full. Defaults to ``DEFAULT_BLOCK_SIZE``.
+        limits (ResourceLimits | ResourceBudget, optional): The resource limits
+            checked while tokenizing and converting the path data. Defaults to None.
+        profiler (ConversionProfiler, optional): The profiler recording the wall
+            time of each phase. Defaults to None (the active profiler, if any).
+
+    Raises:
+        AssertionError: Invalid SVG path.
+        ResourceLimitExceeded: A resource limit is exceeded.
+        ValueError: Invalid block size.
+
+    Yields:
+        np.ndarray: The (N, 2) vertices in the SVG coordinate system.
+        np.ndarray: The (N,) codes.
+    """
+    if block_size < 1:
+        raise ValueError(f"Invalid block size: {block_size}")
+    stream = _PathStream(block_size, ResourceBudget.of(limits))
+    profiler = resolve_profiler(profiler)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        with profile_phase(profiler, "convert"):
+            stream.feed(text)
+        yield from stream.pop_blocks()
+    with profile_phase(profiler, "convert"):
+        stream.feed(decoder.decode(b"", final=True), final=True)
+    yield from stream.pop_blocks()
+
+
+def chunks2plt(
+    chunks: Iterable[str | bytes],
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    limits: ResourceLimits | ResourceBudget | None = None,
+    profiler: ConversionProfiler | None = None,
+) -> Path:
+    """Convert SVG path data streamed in chunks to matplotlib path.
+
+    The result is the same as ``PathConverter.svg2plt`` of the joined chunks, but
+    only the vertices and codes are held in memory, see ``iter_path_blocks``.
+
+    Args:
+        chunks (Iterable[str | bytes]): The chunks of the path data.
+        block_size (int, optional): The number of vertices per block.
+            Defaults to ``DEFAULT_BLOCK_SIZE``.
+        limits (ResourceLimits | ResourceBudget, optional): The resource limits
+            checked while tokenizing and converting the path data. Defaults to None.
+        profiler (ConversionProfiler, optional): The profiler recording the wall
+            time of each phase. Defaults to None (the active profiler, if any).
+
+    Raises:
+        AssertionError: Invalid SVG path.
+        ResourceLimitExceeded: A resource limit is exceeded.
+
+    Returns:
+        Path: Matplotlib path.
+    """
+    budget = ResourceBudget.of(limits)
+    profiler = resolve_profiler(profiler)
+    blocks = list(iter_path_blocks(chunks, block_size, budget, profiler))
+    with profile_phase(profiler, "normalize"):
+        vertices = np.concatenate([vertices for vertices, _ in blocks])
+        codes = np.concatenate([codes for _, codes in blocks])
+        del blocks
+        return PathConverter._normalize(vertices, codes)
+
+
+class _PathStream:
+    """A class to parse SVG path data incrementally.
+
+    The state between the chunks is the unfinished number, the current command and
+    its arguments not converted yet, and the positions and the previous command
+    used by the next commands, which are those of ``PathConverter._parse``.
+    """
+
+    def __init__(self, block_size: int, budget: ResourceBudget | None) -> None:
+        self.block_size = block_size
+        self.budget = budget
+        self.carry = ""  # The unfinished number at the end of the last chunk
+        self.command: str | None = None  # The current command as written
+        self.points_list: list[float] = []  # The arguments not converted yet
+        self.num_converted = 0  # Number of conversions of the current command
+        self.cur_pos: complex = 0 + 0j
+        self.start_pos: complex = 0 + 0j
+        self.before_command = ""
+        self.before_points: list[float] = []
+        self.vertices_list: list[list[float]] = []
+        self.codes_list: list[np.uint8] = []
+        self.blocks: list[tuple[np.ndarray, np.ndarray]] = []
+        self.num_vertices = 0  # Number of the vertices in the blocks
+        self.command_counts: dict[str, int] = {}
+        self.num_arcs = 0
+
+    def feed(self, text: str, final: bool = False) -> None:
+        """Parse a chunk of path data up to its unfinished number.
+
+        Args:
+            text (str): The chunk.
+            final (bool, optional): Whether it is the last chunk. Defaults to False.
+        """
+        text = self.carry + text
+        cut = len(text)
+        if not final:
+            # The trailing number may continue, unlike the numbers before it
+            tail_start = len(text.rstrip(NUMBER_CHARS))
+            cut = tail_start
+            for match in NUMBER_PATTERN.finditer(text, tail_start):
+                cut = match.start()
+        self.carry = text[cut:]
+
+        command_start = 0
+        for match in COMMAND_PATTERN.finditer(text, 0, cut):
+            self._add_points(text[command_start : match.start()])  # noqa: E203
+            self._start_command(match.group())
+            command_start = match.end()
+        self._add_points(text[command_start:cut])
+        if final:
+            assert self.command is not None, "No command found"
+            self._end_command()
+            self._flush(final=True)
+            counts = {
+                f"commands.{command}": n for command, n in self.command_counts.items()
+            }
+            counts["arcs"] = self.num_arcs
+            counts["vertices"] = self.num_vertices
+            metrics_registry.update(counts)
+
+    def pop_blocks(self) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Return and forget the full blocks.
+
+        Returns:
+            list[tuple[np.ndarray, np.ndarray]]: The vertices and codes of blocks.
+        """
+        blocks, self.blocks = self.blocks, []
+        return blocks
+
+    def _start_command(self, command: str) -> None:
+        svg_command = command.upper()
+        if self.command is None:
+            assert svg_command == "M", "First command must be MoveTo"
+        else:
+            self._end_command()
+        if self.before_command == "Z":
+            assert svg_command == "M", "Invalid SVG path as Z is not followed by M"
+        self.command = command
+        self.num_converted = 0
+        self.command_counts[svg_command] = self.command_counts.get(svg_command, 0) + 1
+        self._count_tokens(1)
+
+    def _add_points(self, text: str) -> None:
+        if self.command is None:
+            return  # Before the first command
+        new_points = [float(m) for m in NUMBER_PATTERN.findall(text)]
+        self._count_tokens(len(new_points))
+        arity = COMMAND_ARITIES[self.command.upper()]
+        if arity == 0:
+            return  # The arguments of Z are ignored
+        self.points_list.extend(new_points)
+        # Convert the complete arguments in batches of about a block
+        batch_size = self.block_size * arity
+        num_points = len(self.points_list) // arity * arity
+        for start in range(0, num_points, batch_size):
+            stop = min(start + batch_size, num_points)
+            self._convert(self.points_list[start:stop])
+        del self.points_list[:num_points]
+
+    def _end_command(self) -> None:
+        if self.points_list or self.num_converted == 0:
+            self._convert(self.points_list)  # Asserts the number of arguments
+        self.points_list = []
+
+    def _convert(self, points_list: list[float]) -> None:
+        assert self.command is not None
+        svg_command = self.command.upper()
+        (
+            new_vertices,
+            new_codes,
+            self.cur_pos,
+            self.start_pos,
+            self.before_command,
+            self.before_points,
+        ) = PathConverter._convert_command(
+            svg_command,
+            points_list,
+            self.command.isupper(),
+            self.cur_pos,
+            self.start_pos,
+            self.before_command,
+            self.before_points,
+        )
+        self.vertices_list.extend(new_vertices)
+        self.codes_list.extend(new_codes)
+        self.num_converted += 1
+        if svg_command == "M":  # The next arguments are considered as LineTo
+            self.command = "L" if self.command.isupper() else "l"
+        elif svg_command == "A":
+            self.num_arcs += len(points_list) // 7
+        if self.budget is not None:
+            self.budget.check_vertices(self.num_vertices + len(self.vertices_list))
+            self.budget.check_time()
+        self._flush()
+
+    def _flush(self, final: bool = False) -> None:
+        num_vertices = len(self.vertices_list)
+        if num_vertices < self.block_size and not (final and num_vertices):
+            return
+        vertices = np.array(self.vertices_list, dtype=np.float64).reshape(-1, 2)
+        codes = np.array(self.codes_list, dtype=np.uint8)
+        num_full = num_vertices
+        if not final:
+            num_full -= num_vertices % self.block_size
+        for start in range(0, num_full, self.block_size):
+            stop = min(start + self.block_size, num_full)
+            self.blocks.append((vertices[start:stop], codes[start:stop]))
+        self.num_vertices += num_full
+        self.vertices_list = vertices[num_full:].tolist()
+        self.codes_list = codes[num_full:].tolist()
+
+    def _count_tokens(self, num_tokens: int) -> None:
+        if self.budget is not None:
+            self.budget.add_tokens(num_tokens)
@@ -6,6 +6,7 @@ from .svg_path import SVGPath
 from .svg_polygon import SVGPolygon
 from .svg_polyline import SVGPolyline
 from .svg_rect import SVGRect
+from .svg_style import SVGStyle
 
 __all__ = [
     "SVGCircle",
@@ -16,4 +17,5 @@ __all__ = [
     "SVGPolyline",
     "SVGRect",
     "SVGObject",
+    "SVGStyle",
 ]
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
 from pydantic import BaseModel
 
 
@@ -15,6 +16,19 @@ class SVGGraphicElementBase(ABC, BaseModel):
         """
         pass
 
+    def path_arrays(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return the vertices and codes of the graphic element without a path string.
+
+        Elements which can build their vertices directly override this to skip
+        formatting and parsing ``path_repr``.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: The vertices and codes in the SVG
+                coordinate system, the same as parsing ``path_repr``, or None to
+                parse ``path_repr`` instead.
+        """
+        return None
+
     @abstractmethod
     def svg_repr(self) -> str:
         """Return the SVG element representation of the graphic element.
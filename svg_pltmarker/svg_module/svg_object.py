@@ -1,9 +1,14 @@
+import os
 from collections import deque
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from collections.abc import Iterator
+from typing import TextIO
 from xml.dom import minidom
+from xml.dom.expatbuilder import ExpatBuilderNS
 from xml.parsers.expat import ExpatError
 
+from ..metrics import metrics_registry
+from ..profiler import ConversionProfiler, profile_phase, resolve_profiler
+from ..resource_limits import ResourceBudget, ResourceLimits
 from .svg_circle import SVGCircle
 from .svg_ellipse import SVGEllipse
 from .svg_graphic_element_base import SVGGraphicElementBase
@@ -12,6 +17,10 @@ from .svg_path import SVGPath
 from .svg_polygon import SVGPolygon
 from .svg_polyline import SVGPolyline
 from .svg_rect import SVGRect
+from .svg_style import SVGStyle
+
+SVG_START_TAG = '<svg xmlns="http://www.w3.org/2000/svg" height="100%" width="100%">\n'
+SVG_END_TAG = "</svg>"
 
 
 class SVGObject:
@@ -22,6 +31,8 @@ class SVGObject:
 
     Attributes:
         contents (List[SVGGraphicElementBase]): The contents of the SVG object.
+        element_styles (list[SVGStyle]): The paint styles of the graphic elements,
+            inherited from their ancestors, in the same order as graphic_elements.
     """
 
     SVG_GRPAHIC_ELEMENTS: dict[str, type[SVGGraphicElementBase]] = {
@@ -39,6 +50,8 @@ class SVGObject:
         svgstr: str | None = None,
         filepath: str | None = None,
         url: str | None = None,
+        limits: ResourceLimits | ResourceBudget | None = None,
+        profiler: ConversionProfiler | None = None,
     ) -> None:
         """Initialize the SVGObject class.
 
@@ -46,11 +59,16 @@ class SVGObject:
             svgstr (str, optional): The SVG string. Defaults to None.
             filepath (str, optional): The path to the SVG file. Defaults to None.
             url (str, optional): The URL to the SVG file. Defaults to None.
+            limits (ResourceLimits | ResourceBudget, optional): The resource limits
+                checked while reading and traversing the SVG. Defaults to None.
+            profiler (ConversionProfiler, optional): The profiler recording the wall
+                time of each phase. Defaults to None (the active profiler, if any).
 
         Raises:
             ExpatError: Invalid SVG file.
             FileNotFoundError: File not found.
             IndexError: SVG element not found.
+            ResourceLimitExceeded: A resource limit is exceeded.
             URLError: URL not found.
             ValueError: Either svgstr, filepath, or url must be specified.
         """
@@ -60,60 +78,102 @@ class SVGObject:
             raise ValueError("Only one of svgstr, filepath, and url can be specified")
         elif num_contents == 0:
             raise ValueError("Either svgstr, filepath, or url must be specified")
+        budget = ResourceBudget.of(limits)
+        profiler = resolve_profiler(profiler)
 
         # Read SVG file
-        if svgstr is not None:
-            try:
-                doc = minidom.parseString(svgstr)
-            except ExpatError:
-                raise ExpatError("Invalid SVG string")
-        if filepath is not None:
-            try:
-                doc = minidom.parse(filepath)
-            except FileNotFoundError:
-                raise FileNotFoundError(f"File not found: {filepath}")
-            except ExpatError:
-                raise ExpatError(f"Invalid SVG file: {filepath}")
-        if url is not None:
-            try:
-                request = Request(
-                    url, headers={"User-Agent": "Mozilla/5.0"}
-                )  # Avoid 403 error
-                http_response = urlopen(request)
-            except URLError:
-                raise URLError(f"URL not found: {url}")
+        content: str | bytes
+        with profile_phase(profiler, "fetch"):
+            if svgstr is not None:
+                content = svgstr
+                source = "string"
+            if filepath is not None:
+                try:
+                    if budget is not None:
+                        budget.check_bytes(os.path.getsize(filepath))
+                    with open(filepath, "rb") as f:
+                        content = f.read()
+                except FileNotFoundError:
+                    raise FileNotFoundError(f"File not found: {filepath}")
+                source = f"file: {filepath}"
+            if url is not None:
+                # Deferred as urllib.request is heavy to import
+                from urllib.error import URLError
+                from urllib.request import Request, urlopen
+
+                try:
+                    request = Request(
+                        url, headers={"User-Agent": "Mozilla/5.0"}
+                    )  # Avoid 403 error
+                    http_response = urlopen(request)
+                except URLError:
+                    raise URLError(f"URL not found: {url}")
+                if budget is not None and budget.limits.max_bytes is not None:
+                    # Read one more byte than the limit to detect excess
+                    content = http_response.read(budget.limits.max_bytes + 1)
+                else:
+                    content = http_response.read()
+                source = f"file: {url}"
+            if budget is not None:
+                budget.check_bytes(len(content))
+        with profile_phase(profiler, "xml_parse"):
+            builder = _LimitedBuilder(budget)
             try:
-                doc = minidom.parseString(http_response.read())
+                builder.parseString(content)
             except ExpatError:
-                raise ExpatError(f"Invalid SVG file: {url}")
+                raise ExpatError(f"Invalid SVG {source}")
 
         # Get SVG element
-        try:
-            self.svg = doc.getElementsByTagName("svg")[0]
-            self.raw_svg = self.svg.toxml()
-        except IndexError:
+        if builder.svg is None:
             raise IndexError("SVG element not found")
+        self.svg = builder.svg
+        self.raw_svg = self.svg.toxml()
 
         # Get graphic elements
-        self.graphic_elements: list[SVGGraphicElementBase] = []
-        elements_queue = deque(self.svg.childNodes)
-        while elements_queue:  # DFS
-            cur_node = elements_queue.popleft()
-            if cur_node.nodeType == cur_node.ELEMENT_NODE:
-                elements_queue.extendleft(reversed(cur_node.childNodes))
-                if cur_node.tagName in self.SVG_GRPAHIC_ELEMENTS:
-                    attributes = {}
-                    for key, val in cur_node.attributes.items():
-                        if (
-                            key
-                            in self.SVG_GRPAHIC_ELEMENTS[
-                                cur_node.tagName
-                            ].model_fields.keys()
-                        ):
-                            attributes[key] = val
-                    self.graphic_elements.append(
-                        self.SVG_GRPAHIC_ELEMENTS[cur_node.tagName](**attributes)
+        with profile_phase(profiler, "model_build"):
+            self.graphic_elements: list[SVGGraphicElementBase] = []
+            self.element_styles: list[SVGStyle] = []
+            root_style = SVGStyle().inherit(dict(self.svg.attributes.items()))
+            elements_queue = deque(
+                (node, 1, root_style) for node in self.svg.childNodes
+            )
+            tag_counts: dict[str, int] = {}
+            while elements_queue:  # DFS
+                cur_node, depth, parent_style = elements_queue.popleft()
+                if cur_node.nodeType == cur_node.ELEMENT_NODE:
+                    tag_counts[cur_node.tagName] = (
+                        tag_counts.get(cur_node.tagName, 0) + 1
+                    )
+                    if budget is not None:
+                        budget.check_time()
+                    node_attributes = dict(cur_node.attributes.items())
+                    style = parent_style.inherit(node_attributes)
+                    elements_queue.extendleft(
+                        (node, depth + 1, style)
+                        for node in reversed(cur_node.childNodes)
                     )
+                    if cur_node.tagName in self.SVG_GRPAHIC_ELEMENTS:
+                        attributes = {}
+                        for key, val in node_attributes.items():
+                            if (
+                                key
+                                in self.SVG_GRPAHIC_ELEMENTS[
+                                    cur_node.tagName
+                                ].model_fields.keys()
+                            ):
+                                attributes[key] = val
+                        self.graphic_elements.append(
+                            self.SVG_GRPAHIC_ELEMENTS[cur_node.tagName](**attributes)
+                        )
+                        self.element_styles.append(style)
+
+        # Update metrics at once
+        counts = {f"elements.{tag}": count for tag, count in tag_counts.items()}
+        counts["documents"] = 1
+        if svgstr is None:
+            counts["bytes_fetched"] = len(content)
+        metrics_registry.update(counts)
+        metrics_registry.observe("elements_per_document", len(self.graphic_elements))
 
     def __repr__(self) -> str:
         """Return the SVG representation of the object.
@@ -121,10 +181,79 @@ class SVGObject:
         Returns:
             str: A string representing the SVG representation of the object.
         """
-        repr_str = (
-            '<svg xmlns="http://www.w3.org/2000/svg" height="100%" width="100%">\n'
-        )
+        return "".join(self.iter_svg())
+
+    def iter_svg(self) -> Iterator[str]:
+        """Generate the SVG representation of the object piece by piece.
+
+        The start tag, each graphic element on its own line, and the end tag are
+        generated one at a time, so that a large document is serialized without
+        holding the whole representation.
+
+        Yields:
+            str: The next piece of the SVG representation.
+        """
+        yield SVG_START_TAG
         for element in self.graphic_elements:
-            repr_str += element.svg_repr() + "\n"
-        repr_str += "</svg>"
-        return repr_str
+            yield element.svg_repr() + "\n"
+        yield SVG_END_TAG
+
+    def write(self, fileobj: TextIO) -> int:
+        """Write the SVG representation of the object to a text file object.
+
+        >>> with open("sanitized.svg", "w", encoding="utf-8") as f:
+        ...     svg.write(f)
+
+        Args:
+            fileobj (TextIO): The file object opened in text mode, e.g. ``io.StringIO``
+                or ``sys.stdout``.
+
+        Returns:
+            int: The number of characters written.
+        """
+        num_chars = 0
+        for piece in self.iter_svg():
+            num_chars += len(piece)
+            fileobj.write(piece)
+        return num_chars
+
+
+class _LimitedBuilder(ExpatBuilderNS):
+    """A minidom builder checking the resource limits while parsing.
+
+    The elements and the depth under the root element are counted in the expat
+    handlers, whether they are in the svg element or around it, so that a limit
+    aborts before the whole DOM is built. The first svg element is recorded without
+    searching the DOM recursively.
+
+    Attributes:
+        svg (minidom.Element | None): The first svg element.
+    """
+
+    def __init__(self, budget: ResourceBudget | None) -> None:
+        """Initialize the _LimitedBuilder class.
+
+        Args:
+            budget (ResourceBudget | None): The resource budget.
+        """
+        super().__init__()
+        self.budget = budget
+        self.svg: minidom.Element | None = None
+        self.depth = -1  # Depth under the root element, which is at 0
+        self.num_elements = 0  # Number of the elements under the root element
+
+    def start_element_handler(self, name: str, attributes: list[str]) -> None:
+        self.depth += 1
+        if self.budget is not None:
+            if self.depth > 0:
+                self.num_elements += 1
+                self.budget.check_elements(self.num_elements)
+                self.budget.check_depth(self.depth)
+            self.budget.check_time()
+        super().start_element_handler(name, attributes)
+        if self.svg is None and self.curNode.tagName == "svg":
+            self.svg = self.curNode
+
+    def end_element_handler(self, name: str) -> None:
+        self.depth -= 1
+        super().end_element_handler(name)
@@ -0,0 +1,128 @@
+import re
+from typing import Any, ClassVar
+
+import numpy as np
+from numpy.typing import ArrayLike
+from pydantic import ConfigDict, Field, PrivateAttr, field_validator
+
+from .svg_graphic_element_base import SVGGraphicElementBase
+
+NUMBER_PATTERN = re.compile(r"[-+]?\d*\.?\d+|\.\d+")
+
+
+def format_points(points: np.ndarray) -> list[str]:
+    """Format points as "x,y" strings without exponents, as SVG paths are parsed.
+
+    Args:
+        points (np.ndarray): The (N, 2) points.
+
+    Returns:
+        list[str]: The formatted points.
+    """
+    coordinates = [
+        np.format_float_positional(value, trim="-") for value in points.ravel().tolist()
+    ]
+    return [f"{x},{y}" for x, y in zip(coordinates[::2], coordinates[1::2])]
+
+
+class SVGPointsElementBase(SVGGraphicElementBase):
+    """A base class for SVG graphic elements defined by a list of points.
+
+    The points are parsed once in bulk into an (N, 2) float64 array, or taken
+    from an array-like, so that the vertices are built without formatting and
+    parsing path strings.
+
+    Attributes:
+        points (np.ndarray): The read-only (N, 2) points.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    TAG: ClassVar[str]
+    CLOSED: ClassVar[bool]
+
+    points: np.ndarray = Field(description="The (N, 2) points.")
+    _text: str | None = PrivateAttr(default=None)
+
+    def __init__(self, points: str | ArrayLike, **data: Any) -> None:
+        """Initialize the element.
+
+        Args:
+            points (str | ArrayLike): The points attribute, e.g. "0,100 50,25", or
+                the (N, 2) points.
+
+        Raises:
+            ValidationError: Odd number of coordinates, or not (N, 2) points.
+        """
+        data["points"] = points
+        super().__init__(**data)
+        if isinstance(points, str):
+            self._text = points  # Kept for svg_repr
+
+    @field_validator("points", mode="before")
+    @classmethod
+    def _parse_points(cls, value: Any) -> np.ndarray:
+        if isinstance(value, str):
+            coordinates = np.array(NUMBER_PATTERN.findall(value), dtype=np.float64)
+            if len(coordinates) % 2:
+                raise ValueError("Odd number of coordinates in points")
+            points = coordinates.reshape(-1, 2)
+        else:
+            points = np.array(value, dtype=np.float64)  # Copied to be immutable
+            if points.ndim != 2 or points.shape[1] != 2:
+                raise ValueError(f"Points must be (N, 2), got {points.shape}")
+        points.flags.writeable = False
+        return points
+
+    def __eq__(self, other: object) -> bool:
+        """Return whether the elements are of the same type with the same points.
+
+        Args:
+            other (object): The other object.
+
+        Returns:
+            bool: Whether the elements are equal.
+        """
+        if type(other) is not type(self):
+            return NotImplemented
+        return np.array_equal(self.points, other.points)  # type: ignore[attr-defined]
+
+    def path_repr(self) -> str:
+        """Return the SVG path representation of the element.
+
+        Returns:
+            str: A string representing the SVG path representation of the element.
+        """
+        assert len(self.points) >= 2, "At least 2 points are required"
+        formatted = format_points(self.points)
+        path_str = f"M {formatted[0]} L " + " L ".join(formatted[1:])
+        return path_str + " Z" if self.CLOSED else path_str
+
+    def path_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the vertices and codes of the element, same as its path_repr.
+
+        Returns:
+            np.ndarray: The (N, 2) vertices, with the first point repeated to close
+                the polygon.
+            np.ndarray: The (N,) codes.
+        """
+        from matplotlib.path import Path  # Deferred as matplotlib is heavy
+
+        assert len(self.points) >= 2, "At least 2 points are required"
+        vertices = self.points
+        if self.CLOSED:
+            vertices = np.concatenate([vertices, vertices[:1]])
+        codes = np.full(len(vertices), Path.LINETO, dtype=np.uint8)
+        codes[0] = Path.MOVETO
+        return vertices, codes
+
+    def svg_repr(self) -> str:
+        """Return the SVG element representation of the element.
+
+        Returns:
+            str: A string representing the SVG element representation of the element.
+        """
+        text = self._text
+        if text is None:
+            text = " ".join(format_points(self.points))
+        return f'<{self.TAG} points="{text}"/>'
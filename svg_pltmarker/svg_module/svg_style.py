@@ -0,0 +1,80 @@
+from typing import ClassVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SVGStyle(BaseModel):
+    """A class to represent the paint style of a SVG graphic element.
+
+    Only the inherited paint properties are kept. Instances are immutable and
+    hashable, so that elements can be grouped by style.
+
+    Attributes:
+        fill (str, optional): The fill color. Defaults to "black".
+        stroke (str, optional): The stroke color. Defaults to "none".
+        fill_opacity (float, optional): The fill opacity. Defaults to 1.0.
+        stroke_opacity (float, optional): The stroke opacity. Defaults to 1.0.
+        stroke_width (float, optional): The stroke width in user units.
+            Defaults to 1.0.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    PROPERTIES: ClassVar[dict[str, str]] = {
+        "fill": "fill",
+        "stroke": "stroke",
+        "fill-opacity": "fill_opacity",
+        "stroke-opacity": "stroke_opacity",
+        "stroke-width": "stroke_width",
+    }
+
+    fill: str = Field(default="black", description="The fill color.")
+    stroke: str = Field(default="none", description="The stroke color.")
+    fill_opacity: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="The fill opacity."
+    )
+    stroke_opacity: float = Field(
+        default=1.0, ge=0.0, le=1.0, description="The stroke opacity."
+    )
+    stroke_width: float = Field(
+        default=1.0, ge=0.0, description="The stroke width in user units."
+    )
+
+    def inherit(self, attributes: dict[str, str]) -> "SVGStyle":
+        """Return the style of a child element with the given attributes.
+
+        Presentation attributes are overridden by declarations in the ``style``
+        attribute. Unspecified, ``inherit``, and unparsable properties keep the
+        parent values.
+
+        Args:
+            attributes (dict[str, str]): The attributes of the child element.
+
+        Returns:
+            SVGStyle: The style of the child element, or self if it is unchanged.
+        """
+        declarations = {
+            key: val for key, val in attributes.items() if key in self.PROPERTIES
+        }
+        for declaration in attributes.get("style", "").split(";"):
+            key, _, val = declaration.partition(":")
+            if key.strip() in self.PROPERTIES:
+                declarations[key.strip()] = val
+        updates: dict[str, str | float] = {}
+        for key, val in declarations.items():
+            val = val.strip()
+            if not val or val == "inherit":
+                continue
+            if key in ("fill", "stroke"):
+                updates[self.PROPERTIES[key]] = val
+                continue
+            try:
+                number = float(val.removesuffix("px"))
+            except ValueError:
+                continue
+            if key != "stroke-width":
+                number = min(max(number, 0.0), 1.0)
+            updates[self.PROPERTIES[key]] = max(number, 0.0)
+        if not updates:
+            return self
+        return SVGStyle.model_validate({**self.model_dump(), **updates})
@@ -0,0 +1,434 @@
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import os
+import select
+import sys
+import tempfile
+import threading
+from collections.abc import Callable, Iterator
+from typing import NamedTuple
+
+import numpy as np
+from matplotlib.path import Path
+from pydantic import BaseModel, Field
+
+from .bundle import write_bundle
+from .metrics import metrics_registry
+from .path_converter import get_marker_from_svg
+from .quantize import _vertex_dtype
+from .resource_limits import ResourceLimits
+
+logger = logging.getLogger(__name__)
+
+# inotify(7) flags
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+BACKENDS = ("auto", "inotify", "polling")
+
+
+class FileState(NamedTuple):
+    """The state of a watched file used to detect changes.
+
+    Attributes:
+        mtime_ns (int): The modification time in nanoseconds.
+        size (int): The size in bytes.
+        digest (str): The hash of the content.
+    """
+
+    mtime_ns: int
+    size: int
+    digest: str
+
+
+class WatchChanges(BaseModel):
+    """A class to represent the markers changed by a sync.
+
+    Attributes:
+        added (list[str]): The names of the new markers.
+        updated (list[str]): The names of the re-converted markers.
+        removed (list[str]): The names of the markers whose files were removed.
+        failed (dict[str, str]): The error messages of the files which failed to
+            convert, keyed by name. Their previous markers are kept.
+    """
+
+    added: list[str] = Field(default_factory=list, description="The new markers.")
+    updated: list[str] = Field(default_factory=list, description="The re-converted.")
+    removed: list[str] = Field(default_factory=list, description="The removed.")
+    failed: dict[str, str] = Field(default_factory=dict, description="The errors.")
+
+    def __bool__(self) -> bool:
+        """Return whether anything changed.
+
+        Returns:
+            bool: Whether any marker was added, updated, removed, or failed.
+        """
+        return bool(self.added or self.updated or self.removed or self.failed)
+
+
+class MarkerWatcher:
+    """A class to keep the markers of an SVG directory in sync with the files.
+
+    A background thread waits for changes with inotify on Linux, or by polling the
+    file stats elsewhere, and syncs once the changes settle for ``debounce``
+    seconds, so that a burst of saves is converted once. A sync only reads the
+    files whose mtime or size changed, and only converts those whose content hash
+    changed. The markers are swapped in at once, and written to a bundle by an
+    atomic rename, so that readers never see a partial update.
+
+    Markers are named as ``IconLibrary.scan`` names the SVG files in a directory.
+
+    >>> with MarkerWatcher("icons/", bundle_path="icons.bundle") as watcher:
+    ...     marker = watcher["animals/cat"]  # Up to date with icons/animals/cat.svg
+
+    Attributes:
+        root (str): The watched directory.
+        bundle_path (str, optional): The bundle file kept in sync.
+        debounce (float): The quiet period in seconds before a sync.
+        interval (float): The polling interval in seconds.
+        limits (ResourceLimits, optional): The resource limits of the conversion.
+        on_change (Callable[[WatchChanges], None], optional): The function called
+            after a sync which changed anything.
+        dtype (np.dtype): The vertex dtype of the bundle.
+        last_error (Exception, optional): The last exception raised by a sync in
+            the background thread, which is logged and keeps watching.
+    """
+
+    def __init__(
+        self,
+        root: str | os.PathLike,
+        bundle_path: str | os.PathLike | None = None,
+        debounce: float = 0.2,
+        interval: float = 1.0,
+        backend: str = "auto",
+        limits: ResourceLimits | None = None,
+        on_change: Callable[[WatchChanges], None] | None = None,
+        dtype: type[np.generic] | np.dtype | str = np.float64,
+    ) -> None:
+        """Initialize the MarkerWatcher class.
+
+        Args:
+            root (str | os.PathLike): The directory of SVG files.
+            bundle_path (str | os.PathLike, optional): The bundle file to write the
+                markers to after each sync. Defaults to None (in memory only).
+            debounce (float, optional): The quiet period in seconds before a sync.
+                Defaults to 0.2.
+            interval (float, optional): The polling interval in seconds.
+                Defaults to 1.0.
+            backend (str, optional): "inotify", "polling", or "auto" to use inotify
+                if available. Defaults to "auto".
+            limits (ResourceLimits, optional): The resource limits of the
+                conversion. Defaults to None.
+            on_change (Callable[[WatchChanges], None], optional): The function
+                called after a sync which changed anything. Defaults to None.
+            dtype (type[np.generic] | np.dtype | str, optional): The vertex dtype
+                of the bundle, float64, float32, or int16. Defaults to float64.
+
+        Raises:
+            FileNotFoundError: Directory not found.
+            ValueError: Unknown backend, or unsupported vertex dtype.
+        """
+        if not os.path.isdir(root):
+            raise FileNotFoundError(f"Directory not found: {root}")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        self.root = os.path.abspath(root)
+        self.bundle_path = None if bundle_path is None else os.fspath(bundle_path)
+        self.debounce = debounce
+        self.interval = interval
+        self.limits = limits
+        self.on_change = on_change
+        self.dtype = _vertex_dtype(dtype)
+        self._backend = backend
+        self._markers: dict[str, Path] = {}
+        self._states: dict[str, FileState] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.last_error: Exception | None = None
+
+    @property
+    def markers(self) -> dict[str, Path]:
+        """Return a snapshot of the markers.
+
+        Returns:
+            dict[str, Path]: The markers keyed by name, not modified by later syncs.
+        """
+        return self._markers
+
+    def __len__(self) -> int:
+        """Return the number of markers.
+
+        Returns:
+            int: The number of markers.
+        """
+        return len(self._markers)
+
+    def __contains__(self, name: str) -> bool:
+        """Return whether the marker exists.
+
+        Args:
+            name (str): The marker name.
+
+        Returns:
+            bool: Whether the marker exists.
+        """
+        return name in self._markers
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the marker names.
+
+        Returns:
+            Iterator[str]: The marker names.
+        """
+        return iter(self._markers)
+
+    def __getitem__(self, name: str) -> Path:
+        """Return a marker.
+
+        Args:
+            name (str): The marker name.
+
+        Raises:
+            KeyError: Marker not found.
+
+        Returns:
+            Path: The matplotlib marker.
+        """
+        return self._markers[name]
+
+    def __enter__(self) -> "MarkerWatcher":
+        """Sync and start watching.
+
+        Returns:
+            MarkerWatcher: The watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop watching."""
+        self.stop()
+
+    def sync(self) -> WatchChanges:
+        """Convert the changed files and swap in the markers.
+
+        Returns:
+            WatchChanges: The changed markers.
+        """
+        with self._lock:
+            files = _scan_files(self.root)
+            markers, states = dict(self._markers), dict(self._states)
+            changes = WatchChanges()
+            for name in sorted(states.keys() - files.keys()):
+                states.pop(name)
+                if markers.pop(name, None) is not None:
+                    changes.removed.append(name)
+            for name, (filepath, stat) in files.items():
+                state = states.get(name)
+                if (
+                    state is not None
+                    and state.mtime_ns == stat.st_mtime_ns
+                    and state.size == stat.st_size
+                ):
+                    continue
+                try:
+                    with open(filepath, "rb") as f:
+                        content = f.read()
+                except OSError:
+                    continue  # Removed since the scan, and found by the next sync
+                digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+                states[name] = FileState(stat.st_mtime_ns, stat.st_size, digest)
+                if state is not None and state.digest == digest:
+                    continue  # Touched without changes
+                try:
+                    marker = get_marker_from_svg(
+                        svgstr=content.decode("utf-8"), limits=self.limits
+                    )
+                except Exception as e:
+                    changes.failed[name] = f"{type(e).__name__}: {e}"
+                    continue
+                (changes.updated if name in markers else changes.added).append(name)
+                markers[name] = marker
+
+            if changes.added or changes.updated or changes.removed:
+                if self.bundle_path is not None:
+                    _replace_bundle(self.bundle_path, markers, self.dtype)
+                self._markers = markers  # Swapped at once for readers
+            self._states = states  # Not before the bundle, to retry its write
+            metrics_registry.update(
+                {
+                    "watch.syncs": 1,
+                    "watch.converted": len(changes.added) + len(changes.updated),
+                    "watch.failed": len(changes.failed),
+                }
+            )
+        if changes and self.on_change is not None:
+            self.on_change(changes)
+        return changes
+
+    def start(self) -> None:
+        """Sync, and start watching in a background thread.
+
+        Raises:
+            OSError: inotify is requested but not available.
+            RuntimeError: Already started.
+        """
+        if self._thread is not None:
+            raise RuntimeError("The watcher is already started")
+        source = self._open_source()
+        self.sync()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(source,), name="MarkerWatcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop watching and wait for the background thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _open_source(self) -> "_InotifySource | _PollingSource":
+        if self._backend != "polling":
+            try:
+                return _InotifySource(self.root)
+            except OSError:
+                if self._backend == "inotify":
+                    raise
+        return _PollingSource(self.root, self._stop)
+
+    def _run(self, source: "_InotifySource | _PollingSource") -> None:
+        try:
+            while not self._stop.is_set():
+                if not source.wait(self.interval):
+                    continue
+                while source.wait(self.debounce) and not self._stop.is_set():
+                    pass  # Wait until the changes settle
+                if self._stop.is_set():
+                    break
+                try:
+                    self.sync()
+                except Exception as e:  # e.g. a failed bundle write, or on_change
+                    self.last_error = e
+                    logger.exception("Failed to sync %s", self.root)
+        finally:
+            source.close()
+
+
+def _scan_files(root: str) -> dict[str, tuple[str, os.stat_result]]:
+    """Return the SVG files under a directory with their stats, keyed by name."""
+    files: dict[str, tuple[str, os.stat_result]] = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        prefix = os.path.relpath(dirpath, root).replace(os.sep, "/")
+        prefix = "" if prefix == "." else prefix + "/"
+        for filename in sorted(filenames):
+            stem, suffix = os.path.splitext(filename)
+            if suffix.lower() != ".svg":
+                continue
+            filepath = os.path.join(dirpath, filename)
+            try:
+                files.setdefault(prefix + stem, (filepath, os.stat(filepath)))
+            except OSError:
+                pass  # Removed while scanning
+    return files
+
+
+def _replace_bundle(
+    bundle_path: str, markers: dict[str, Path], dtype: np.dtype
+) -> None:
+    """Write a bundle to a temporary file and rename it over the bundle."""
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(bundle_path)), suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        write_bundle(temp_path, markers, dtype=dtype)
+        os.replace(temp_path, bundle_path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class _InotifySource:
+    """Wait for changes under a directory with inotify."""
+
+    def __init__(self, root: str) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._root = root
+        self._watch_directories()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for events, and return whether any occurred."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return False
+        while True:
+            try:
+                if not os.read(self._fd, 65536):
+                    break
+            except BlockingIOError:
+                break
+        self._watch_directories()  # Watch new subdirectories
+        return True
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+    def _watch_directories(self) -> None:
+        for dirpath, _, _ in os.walk(self._root):
+            # Adding an existing watch returns the same watch descriptor
+            self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), WATCH_MASK)
+
+
+class _PollingSource:
+    """Wait for changes under a directory by comparing the file stats."""
+
+    def __init__(self, root: str, stop: threading.Event) -> None:
+        self._root = root
+        self._stop = stop
+        self._snapshot = self._stats()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep for the timeout, and return whether any file changed."""
+        if self._stop.wait(timeout):
+            return False
+        snapshot = self._stats()
+        changed = snapshot != self._snapshot
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+    def _stats(self) -> dict[str, tuple[int, int]]:
+        return {
+            name: (stat.st_mtime_ns, stat.st_size)
+            for name, (_, stat) in _scan_files(self._root).items()
+        }
@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+from svg_pltmarker.benchmarks.conversion import (
+    compare_results,
+    main,
+    run_conversion_benchmark,
+)
+
+
+class TestConversionBenchmark:
+    def test_run_conversion_benchmark(self) -> None:
+        results = run_conversion_benchmark(
+            kinds=["shapes", "arcs"], sizes=[10, 20], repeat=1, log=None
+        )
+        assert len(results["results"]) == 2 * 2 * 3
+        assert {result["stage"] for result in results["results"]} == {
+            "svg_object",
+            "svg2plt",
+            "get_marker_from_svg",
+        }
+        assert all(result["peak_memory_bytes"] > 0 for result in results["results"])
+        comparison = compare_results(results, results)
+        assert all(row["time_ratio"] == 1.0 for row in comparison)
+
+    def test_main(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.json"
+        main(
+            [
+                "--kinds",
+                "relative",
+                "--sizes",
+                "10",
+                "--repeat",
+                "1",
+                "--output",
+                str(output),
+            ]
+        )
+        results = json.loads(output.read_text())
+        assert len(results["results"]) == 3
+        assert "commit" in results["environment"]
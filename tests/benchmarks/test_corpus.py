@@ -0,0 +1,18 @@
+import pytest
+
+from svg_pltmarker import SVGObject, get_marker_from_svg
+from svg_pltmarker.benchmarks import CORPUS_GENERATORS, generate_svg
+
+
+class TestCorpus:
+    @pytest.mark.parametrize(("kind",), [(kind,) for kind in CORPUS_GENERATORS])
+    def test_generate_svg(self, kind: str) -> None:
+        svg_str = generate_svg(kind, 300)
+        assert svg_str == generate_svg(kind, 300)  # Deterministic
+        assert svg_str != generate_svg(kind, 300, seed=1)
+        assert len(SVGObject(svgstr=svg_str).graphic_elements) > 0
+        get_marker_from_svg(svgstr=svg_str)
+
+    def test_generate_svg_unknown_kind(self) -> None:
+        with pytest.raises(ValueError, match="Unknown corpus kind: "):
+            generate_svg("unknown", 100)
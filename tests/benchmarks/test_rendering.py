@@ -0,0 +1,44 @@
+import numpy as np
+from matplotlib.path import Path
+
+from svg_pltmarker import get_marker_from_svg
+from svg_pltmarker.benchmarks.rendering import (
+    BUILTIN_MARKERS,
+    flatten_marker,
+    run_rendering_benchmark,
+    simplify_marker,
+)
+
+TEST_SVG_CONTENT = """<svg xmlns="http://www.w3.org/2000/svg">
+    <circle cx="50" cy="40" r="30"/>
+    <rect x="10" y="10" width="20" height="30" rx="5"/>
+</svg>"""
+
+
+class TestRenderingBenchmark:
+    def test_flatten_marker(self) -> None:
+        marker = get_marker_from_svg(svgstr=TEST_SVG_CONTENT)
+        flattened = flatten_marker(marker, size_pixels=100.0)
+        assert Path.CURVE4 in marker.codes
+        assert set(np.unique(flattened.codes)) <= {Path.MOVETO, Path.LINETO}
+        np.testing.assert_allclose(
+            flattened.get_extents().bounds, marker.get_extents().bounds, atol=1e-3
+        )
+
+    def test_simplify_marker(self) -> None:
+        marker = get_marker_from_svg(svgstr=TEST_SVG_CONTENT)
+        simplified = simplify_marker(marker, size_pixels=8.0)
+        flattened = flatten_marker(marker, size_pixels=8.0)
+        assert len(simplified.vertices) < len(flattened.vertices)
+        assert np.all(np.abs(simplified.vertices) <= 0.5 + 1e-9)
+
+    def test_run_rendering_benchmark(self) -> None:
+        results = run_rendering_benchmark(
+            TEST_SVG_CONTENT, num_points=[10, 20], repeat=1, log=None
+        )
+        variants = {result["variant"] for result in results["results"]}
+        assert variants == {"raw", "flattened", "simplified", "sprites"} | {
+            f"builtin:{name}" for name in BUILTIN_MARKERS
+        }
+        assert len(results["results"]) == 2 * len(variants)
+        assert all(result["seconds_per_frame"] > 0 for result in results["results"])
@@ -0,0 +1,36 @@
+from svg_pltmarker.benchmarks.startup import parse_importtime, run_startup_benchmark
+
+TEST_IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:        35 |        155 |   io
+import time:       410 |        565 | svg_pltmarker
+"""
+
+
+class TestStartupBenchmark:
+    def test_parse_importtime(self) -> None:
+        modules = parse_importtime(TEST_IMPORTTIME_OUTPUT)
+        assert [module["module"] for module in modules] == [
+            "_io",
+            "io",
+            "svg_pltmarker",
+        ]
+        assert [module["depth"] for module in modules] == [2, 1, 0]
+        assert modules[-1]["self_us"] == 410
+        assert modules[-1]["cumulative_us"] == 565
+
+    def test_run_startup_benchmark(self) -> None:
+        results = run_startup_benchmark(
+            {
+                "package": "import svg_pltmarker",
+                "svg_object": "import svg_pltmarker.svg_module",
+            },
+            repeat=1,
+            top=3,
+            log=None,
+        )
+        package, svg_object = results["results"]
+        assert package["import_us"] > 0
+        assert package["heavy_modules"] == []
+        assert "pydantic" in svg_object["heavy_modules"]
+        assert len(package["slowest_modules"]) <= 3
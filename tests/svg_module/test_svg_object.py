@@ -1,3 +1,4 @@
+import io
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
 from typing import Any
@@ -197,3 +198,21 @@ class TestSVGObject:
     ) -> None:
         svg_object = SVGObject(svgstr=svg_str, filepath=svg_filepath, url=svg_url)
         assert repr(svg_object) == expected
+
+    def test_iter_svg(self) -> None:
+        svg_object = SVGObject(svgstr=TEST_SVG_CONTENT)
+        pieces = list(svg_object.iter_svg())
+        assert len(pieces) == len(svg_object.graphic_elements) + 2
+        assert "".join(pieces) == TEST_SVG_REPR
+
+    def test_write(self) -> None:
+        svg_object = SVGObject(svgstr=TEST_SVG_CONTENT)
+        fileobj = io.StringIO()
+        assert svg_object.write(fileobj) == len(TEST_SVG_REPR)
+        assert fileobj.getvalue() == TEST_SVG_REPR
+
+    def test_write_file(self, tmp_path: Path) -> None:
+        svg_object = SVGObject(svgstr=TEST_SVG_CONTENT)
+        with open(tmp_path / "out.svg", "w", encoding="utf-8") as f:
+            svg_object.write(f)
+        assert repr(SVGObject(filepath=str(tmp_path / "out.svg"))) == TEST_SVG_REPR
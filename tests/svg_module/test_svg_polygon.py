@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
+from pydantic import ValidationError
 
-from svg_pltmarker import SVGPolygon
+from svg_pltmarker import PathConverter, SVGPolygon
 
 
 class TestSVGPolygon:
@@ -10,7 +12,7 @@ class TestSVGPolygon:
             ("0,100 50,25 50,75 100,0", "M 0,100 L 50,25 L 50,75 L 100,0 Z"),
             (
                 "+50.0,-.0 +21.,-90 98.0 -35.0 +.2-35 79-90.",
-                "M +50.0,-.0 L +21,-90 L 98.0,-35.0 L +.2,-35 L 79,-90 Z",
+                "M 50,-0 L 21,-90 L 98,-35 L 0.2,-35 L 79,-90 Z",
             ),
         ],
         ids=["simple", "complex"],
@@ -24,15 +26,52 @@ class TestSVGPolygon:
         [
             ("0,100 50,25 50,75 100,",),
             ("150",),
-            ("150,0",),
             ("150,0 121,",),
+            (np.zeros((3, 3)),),
+            (np.zeros(4),),
         ],
-        ids=["odd number", "fewer than 4 (1)", "fewer than 4 (2)", "fewer than 4 (3)"],
+        ids=["odd number", "odd number (1)", "odd number (3)", "3 columns", "1-D"],
     )
-    def test_path_repr_invalid(self, points: str) -> None:
+    def test_init_invalid(self, points: str | np.ndarray) -> None:
+        with pytest.raises(ValidationError):
+            SVGPolygon(points=points)
+
+    @pytest.mark.parametrize(
+        ("points",),
+        [("150,0",), (np.zeros((1, 2)),)],
+        ids=["string", "array"],
+    )
+    def test_path_repr_invalid(self, points: str | np.ndarray) -> None:
         polygon = SVGPolygon(points=points)
         with pytest.raises(AssertionError):
             polygon.path_repr()
+        with pytest.raises(AssertionError):
+            polygon.path_arrays()
+
+    @pytest.mark.parametrize(
+        ("points",),
+        [
+            ("0,100 50,25 50,75 100,0",),
+            ("+50.0,-.0 +21.,-90 98.0 -35.0 +.2-35 79-90.",),
+            (np.random.default_rng(0).normal(size=(100, 2)) * 1e3,),
+        ],
+        ids=["simple", "complex", "random"],
+    )
+    def test_path_arrays(self, points: str | np.ndarray) -> None:
+        polygon = SVGPolygon(points=points)
+        vertices, codes = polygon.path_arrays()
+        expected_vertices, expected_codes = PathConverter._parse(polygon.path_repr())
+        np.testing.assert_array_equal(vertices, expected_vertices)
+        np.testing.assert_array_equal(codes, expected_codes)
+
+    def test_init_array(self) -> None:
+        points = np.array([[0, 100], [50, 25], [50, 75], [100, 0]])
+        polygon = SVGPolygon(points=points)
+        assert polygon.points.dtype == np.float64
+        assert not polygon.points.flags.writeable
+        assert not np.shares_memory(polygon.points, points)
+        assert polygon == SVGPolygon(points="0,100 50,25 50,75 100,0")
+        assert polygon.svg_repr() == '<polygon points="0,100 50,25 50,75 100,0"/>'
 
     @pytest.mark.parametrize(
         "points, expected",
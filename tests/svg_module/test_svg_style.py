@@ -0,0 +1,35 @@
+import pytest
+
+from svg_pltmarker import SVGStyle
+
+
+class TestSVGStyle:
+    def test_default(self) -> None:
+        style = SVGStyle()
+        assert style.fill == "black"
+        assert style.stroke == "none"
+        assert style.inherit({}) is style
+        assert style.inherit({"cx": "1"}) is style
+
+    @pytest.mark.parametrize(
+        ("attributes", "expected"),
+        [
+            ({"fill": "red"}, {"fill": "red"}),
+            ({"style": "fill: red; stroke:blue"}, {"fill": "red", "stroke": "blue"}),
+            ({"fill": "red", "style": "fill:green"}, {"fill": "green"}),
+            ({"fill": "inherit"}, {}),
+            ({"stroke-width": "2px", "fill-opacity": "1.5"}, {"stroke_width": 2.0}),
+            (
+                {"stroke-width": "thick", "stroke-opacity": "0.5"},
+                {"stroke_opacity": 0.5},
+            ),
+        ],
+        ids=["attribute", "style", "precedence", "inherit", "numbers", "invalid"],
+    )
+    def test_inherit(self, attributes: dict[str, str], expected: dict) -> None:
+        parent = SVGStyle(fill="yellow")
+        style = parent.inherit(attributes)
+        assert style == parent.model_copy(update=expected)
+
+    def test_hashable(self) -> None:
+        assert len({SVGStyle(), SVGStyle(), SVGStyle(fill="red")}) == 2
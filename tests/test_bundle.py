@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from matplotlib.path import Path as PltPath
+
+from svg_pltmarker import MarkerBundle, get_marker_from_svg, write_bundle
+
+MARKERS = {
+    "circle": get_marker_from_svg(svgstr='<svg><circle cx="5" cy="5" r="5"/></svg>'),
+    "triangle": get_marker_from_svg(
+        svgstr='<svg><path d="M 0,0 L 10,0 L 5,10 Z"/></svg>'
+    ),
+    "アイコン/line": PltPath([[0.0, 0.0], [1.0, 1.0]]),
+}
+
+
+class TestMarkerBundle:
+    @pytest.mark.parametrize(
+        "dtype",
+        [np.float64, np.float32],
+        ids=["float64", "float32"],
+    )
+    def test_roundtrip(self, tmp_path: Path, dtype: type[np.floating]) -> None:
+        filepath = tmp_path / "markers.bundle"
+        write_bundle(filepath, MARKERS, dtype=dtype)
+        with MarkerBundle(filepath) as bundle:
+            assert list(bundle) == list(MARKERS)
+            assert len(bundle) == 3 and "circle" in bundle
+            assert bundle.dtype == np.dtype(dtype)
+            for name, expected in MARKERS.items():
+                marker = bundle[name]
+                np.testing.assert_allclose(
+                    marker.vertices, expected.vertices, rtol=1e-6
+                )
+                if expected.codes is not None:
+                    np.testing.assert_array_equal(marker.codes, expected.codes)
+            np.testing.assert_array_equal(
+                bundle["アイコン/line"].codes, [PltPath.MOVETO, PltPath.LINETO]
+            )
+            with pytest.raises(KeyError):
+                bundle["missing"]
+
+    def test_int16(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "markers.bundle"
+        markers = {name: MARKERS[name] for name in ("circle", "triangle")}
+        write_bundle(filepath, markers, dtype=np.int16)
+        write_bundle(tmp_path / "float64.bundle", markers)
+        num_vertices = sum(len(marker) for marker in markers.values())
+        saved = (tmp_path / "float64.bundle").stat().st_size - filepath.stat().st_size
+        assert saved == 12 * num_vertices  # 4 of 16 bytes per vertex
+        with MarkerBundle(filepath) as bundle:
+            assert bundle.dtype == np.int16
+            vertices, _ = bundle.get_arrays("circle")
+            assert vertices.dtype == np.int16
+            for name, expected in markers.items():
+                marker = bundle[name]
+                assert marker.vertices.dtype == np.float64
+                np.testing.assert_allclose(
+                    marker.vertices, expected.vertices, rtol=0, atol=1e-4
+                )
+        # Not normalized
+        with pytest.raises(ValueError):
+            write_bundle(tmp_path / "line.bundle", MARKERS, dtype=np.int16)
+
+    def test_zero_copy(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "markers.bundle"
+        write_bundle(filepath, MARKERS)
+        bundle = MarkerBundle(filepath)
+        vertices, codes = bundle.get_arrays("triangle")
+        marker = bundle["triangle"]
+        assert not vertices.flags.writeable and not codes.flags.writeable
+        assert np.shares_memory(marker.vertices, vertices)
+        assert np.shares_memory(marker.codes, codes)
+        bundle.close()  # Views keep the map alive
+        np.testing.assert_array_equal(marker.vertices, MARKERS["triangle"].vertices)
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "invalid.bundle"
+        filepath.write_bytes(b"not a bundle" * 10)
+        with pytest.raises(ValueError):
+            MarkerBundle(filepath)
+        with pytest.raises(ValueError):
+            write_bundle(tmp_path / "int.bundle", MARKERS, dtype=np.int32)
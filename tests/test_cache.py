@@ -0,0 +1,154 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from matplotlib.path import Path as PltPath
+
+from svg_pltmarker import LRUCache, estimate_nbytes, metrics_registry
+
+
+def _counter(name: str) -> int:
+    return metrics_registry.snapshot()["counters"].get(name, 0)
+
+
+class TestLRUCache:
+    def test_eviction(self) -> None:
+        cache: LRUCache[str, int] = LRUCache("test_eviction", maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get_or_compute("a", lambda: 0) == 1  # "b" is now the oldest
+        cache.put("c", 3)
+        assert len(cache) == 2
+        assert "a" in cache and "c" in cache and "b" not in cache
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_metrics(self) -> None:
+        metrics_registry.reset()
+        cache: LRUCache[str, int] = LRUCache("test_metrics")
+        calls = []
+        for _ in range(3):
+            assert cache.get_or_compute("a", lambda: calls.append(1) or 1) == 1
+        assert len(calls) == 1
+        counters = metrics_registry.snapshot()["counters"]
+        assert counters["cache.test_metrics.hits"] == 2
+        assert counters["cache.test_metrics.misses"] == 1
+
+    def test_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError):
+            LRUCache("test_invalid", maxsize=0)
+
+    def test_maxbytes(self) -> None:
+        cache: LRUCache[str, np.ndarray] = LRUCache(
+            "test_maxbytes", maxsize=10, maxbytes=250
+        )
+        cache.put("a", np.zeros(10))  # 80 bytes
+        cache.put("b", np.zeros(10))
+        cache.put("c", np.zeros(10))
+        assert cache.nbytes == 240
+        cache.put("d", np.zeros(10))  # Evicts "a"
+        assert "a" not in cache and len(cache) == 3 and cache.nbytes == 240
+        large = np.zeros(100)
+        assert cache.get_or_compute("large", lambda: large) is large
+        assert "large" not in cache and len(cache) == 3
+        with pytest.raises(ValueError):
+            LRUCache("test_invalid", maxbytes=0)
+
+    def test_estimate_nbytes(self) -> None:
+        path = PltPath(np.zeros((4, 2)), np.ones(4, dtype=np.uint8))
+        assert estimate_nbytes(np.zeros(8)) == 64
+        assert estimate_nbytes(path) == 68
+        assert estimate_nbytes([path, path]) > 136
+
+    def test_single_flight(self) -> None:
+        cache: LRUCache[str, object] = LRUCache("test_single_flight")
+        num_threads = 8
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def compute() -> object:
+            calls.append(1)
+            started.set()
+            release.wait()
+            return object()
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [executor.submit(cache.get_or_compute, "a", compute)]
+            started.wait()
+            futures += [
+                executor.submit(cache.get_or_compute, "a", compute)
+                for _ in range(num_threads - 1)
+            ]
+            while _counter(f"cache.{cache.name}.waits") < num_threads - 1:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_error_propagation(self) -> None:
+        cache: LRUCache[str, object] = LRUCache("test_error_propagation")
+        num_threads = 8
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute() -> object:
+            started.set()
+            release.wait()
+            raise RuntimeError("conversion failed")
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            futures = [executor.submit(cache.get_or_compute, "a", compute)]
+            started.wait()
+            futures += [
+                executor.submit(cache.get_or_compute, "a", compute)
+                for _ in range(num_threads - 1)
+            ]
+            while _counter(f"cache.{cache.name}.waits") < num_threads - 1:
+                time.sleep(0.001)
+            release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError, match="conversion failed"):
+                    future.result()
+        # Errors are not cached
+        assert "a" not in cache
+        assert cache.get_or_compute("a", lambda: 1) == 1
+
+    def test_stress(self) -> None:
+        cache: LRUCache[int, int] = LRUCache("test_stress", maxsize=8)
+        lock = threading.Lock()
+        in_flight: set[int] = set()
+        overlaps = []
+
+        def compute(key: int) -> int:
+            with lock:
+                if key in in_flight:
+                    overlaps.append(key)
+                in_flight.add(key)
+            time.sleep(0.0001)
+            with lock:
+                in_flight.discard(key)
+            if key % 7 == 0:
+                raise ValueError(key)
+            return key * key
+
+        def work(seed: int) -> None:
+            rng = random.Random(seed)
+            for _ in range(500):
+                key = rng.randrange(32)
+                try:
+                    assert cache.get_or_compute(key, lambda: compute(key)) == key * key
+                except ValueError as error:
+                    assert error.args == (key,) and key % 7 == 0
+
+        with ThreadPoolExecutor(max_workers=32) as executor:
+            list(executor.map(work, range(32)))
+        assert overlaps == []
+        assert len(cache) <= 8
+        assert cache._flights == {}
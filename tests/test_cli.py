@@ -0,0 +1,109 @@
+import json
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from svg_pltmarker import MarkerBundle, get_marker_from_svg
+from svg_pltmarker.cli import compile_icons, inspect_svg, main
+
+CIRCLE = '<svg><circle cx="5" cy="5" r="5"/></svg>'
+TRIANGLE = '<svg><path d="M 0,0 L 10,0 L 5,10 Z"/><path d="m 2,2 h 1 v 1 z"/></svg>'
+
+
+@pytest.fixture
+def icon_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "icons"
+    root.mkdir()
+    (root / "circle.svg").write_text(CIRCLE)
+    (root / "broken.svg").write_text("<svg>")
+    with zipfile.ZipFile(root / "packed.zip", "w") as archive:
+        archive.writestr("triangle.svg", TRIANGLE)
+    return root
+
+
+class TestCLI:
+    @pytest.mark.parametrize("num_workers", [1, 2], ids=["serial", "processes"])
+    def test_compile_icons(
+        self, icon_dir: Path, tmp_path: Path, num_workers: int
+    ) -> None:
+        output = tmp_path / "icons.bundle"
+        errors = compile_icons(
+            [icon_dir], output, num_workers=num_workers, dtype="float32", log=None
+        )
+        assert list(errors) == ["broken"]
+        with MarkerBundle(output) as bundle:
+            assert list(bundle) == ["circle", "packed/triangle"]
+            assert bundle.dtype == np.float32
+            np.testing.assert_allclose(
+                bundle["packed/triangle"].vertices,
+                get_marker_from_svg(svgstr=TRIANGLE).vertices,
+                atol=1e-6,
+            )
+
+    def test_compile_command(
+        self, icon_dir: Path, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        output, index = tmp_path / "icons.bundle", tmp_path / "icons.json"
+        args = ["compile", str(icon_dir), "-o", str(output), "-j", "1"]
+        assert main(args + ["--index", str(index)]) == 0
+        assert "broken: ExpatError" in capsys.readouterr().err
+        assert index.exists()
+        assert main(args + ["--strict"]) == 1
+
+    def test_inspect_svg(self, tmp_path: Path) -> None:
+        filepath = tmp_path / "triangle.svg"
+        filepath.write_text(TRIANGLE)
+        summary = inspect_svg(filepath)
+        assert summary["elements"] == {"path": 2}
+        assert summary["commands"] == {
+            "L": 2,
+            "M": 1,
+            "Z": 1,
+            "h": 1,
+            "m": 1,
+            "v": 1,
+            "z": 1,
+        }
+        assert summary["vertices"] == len(get_marker_from_svg(svgstr=TRIANGLE).vertices)
+        assert sum(summary["codes"].values()) == summary["vertices"]
+        assert {"xml_parse", "convert", "normalize"} <= set(summary["phases_ms"])
+
+    def test_inspect_command(
+        self, tmp_path: Path, capsys: pytest.CaptureFixture
+    ) -> None:
+        filepath = tmp_path / "circle.svg"
+        filepath.write_text(CIRCLE)
+        assert main(["inspect", str(filepath)]) == 0
+        assert "circle" in capsys.readouterr().out
+        assert main(["inspect", "--json", str(filepath)]) == 0
+        assert json.loads(capsys.readouterr().out)["elements"] == {"circle": 1}
+
+    @pytest.mark.parametrize(
+        ("content", "message"),
+        [
+            ("<svg>", "Invalid SVG"),
+            ('<svg><path d="L 1,1"/></svg>', "First command must be MoveTo"),
+        ],
+        ids=["xml", "path"],
+    )
+    def test_inspect_invalid(
+        self,
+        tmp_path: Path,
+        capsys: pytest.CaptureFixture[str],
+        content: str,
+        message: str,
+    ) -> None:
+        filepath = tmp_path / "broken.svg"
+        filepath.write_text(content)
+        with pytest.raises(SystemExit) as exc_info:
+            main(["inspect", str(filepath)])
+        assert exc_info.value.code == 1
+        assert message in capsys.readouterr().err
+
+    def test_bench_command(self, tmp_path: Path) -> None:
+        output = tmp_path / "results.json"
+        args = ["--kinds", "shapes", "--sizes", "10", "--repeat", "1"]
+        assert main(["bench", "conversion", *args, "--output", str(output)]) == 0
+        assert json.loads(output.read_text())["results"]
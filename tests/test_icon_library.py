@@ -0,0 +1,97 @@
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from svg_pltmarker import (
+    IconLibrary,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    get_marker_from_svg,
+    metrics_registry,
+)
+
+CIRCLE = '<svg><circle cx="5" cy="5" r="5"/></svg>'
+SQUARE = '<svg><rect x="0" y="0" width="10" height="10"/></svg>'
+TRIANGLE = '<svg><path d="M 0,0 L 10,0 L 5,10 Z"/></svg>'
+
+
+@pytest.fixture
+def icon_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "icons"
+    (root / "shapes").mkdir(parents=True)
+    (root / "circle.svg").write_text(CIRCLE)
+    (root / "shapes" / "square.svg").write_text(SQUARE)
+    (root / "notes.txt").write_text("not an icon")
+    with zipfile.ZipFile(root / "packed.zip", "w") as archive:
+        archive.writestr("triangle.svg", TRIANGLE)
+        archive.writestr("nested/circle.svg", CIRCLE)
+    return root
+
+
+class TestIconLibrary:
+    def test_scan(self, icon_dir: Path) -> None:
+        library = IconLibrary.scan(icon_dir)
+        assert sorted(library) == [
+            "circle",
+            "packed/nested/circle",
+            "packed/triangle",
+            "shapes/square",
+        ]
+        assert "circle" in library and "missing" not in library
+        assert library.index["packed/triangle"].member == "triangle.svg"
+
+    def test_scan_archive(self, icon_dir: Path) -> None:
+        library = IconLibrary.scan(icon_dir / "packed.zip")
+        assert sorted(library) == ["nested/circle", "triangle"]
+        assert library.read_svg("triangle") == TRIANGLE
+
+    def test_scan_not_found(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            IconLibrary.scan(tmp_path / "missing")
+
+    def test_save_load(self, icon_dir: Path, tmp_path: Path) -> None:
+        library = IconLibrary.scan(icon_dir)
+        library.save(tmp_path / "index.json")
+        loaded = IconLibrary.load(tmp_path / "index.json")
+        assert loaded.index == library.index
+
+    def test_get_marker(self, icon_dir: Path) -> None:
+        metrics_registry.reset()
+        with IconLibrary.scan(icon_dir, maxsize=2) as library:
+            # Nothing is parsed until the first lookup
+            assert "documents" not in metrics_registry.snapshot()["counters"]
+            marker = library.get_marker("packed/triangle")
+            np.testing.assert_array_equal(
+                marker.vertices, get_marker_from_svg(svgstr=TRIANGLE).vertices
+            )
+            assert library.get_marker("packed/triangle") is marker
+            library.get_marker("circle")
+            library.get_marker("shapes/square")  # Evicts the triangle
+            assert library.get_marker("packed/triangle") is not marker
+            counters = metrics_registry.snapshot()["counters"]
+            assert counters["cache.icon.hits"] == 1
+            assert counters["cache.icon.misses"] == 4
+            assert len(library.get_svg_object("circle").graphic_elements) == 1
+            with pytest.raises(KeyError):
+                library.get_marker("missing")
+
+    def test_dtype(self, icon_dir: Path) -> None:
+        library = IconLibrary.scan(icon_dir, maxbytes=1 << 20, dtype=np.int16)
+        marker = library.get_marker("packed/triangle")
+        np.testing.assert_allclose(
+            marker.vertices,
+            get_marker_from_svg(svgstr=TRIANGLE).vertices,
+            rtol=0,
+            atol=1e-4,
+        )
+        # 4 bytes per vertex and 1 per code
+        assert library._markers.nbytes == len(marker) * 5
+        with pytest.raises(ValueError):
+            IconLibrary.scan(icon_dir, dtype=np.int32)
+
+    def test_limits(self, icon_dir: Path) -> None:
+        library = IconLibrary.scan(icon_dir, limits=ResourceLimits(max_bytes=10))
+        with pytest.raises(ResourceLimitExceeded):
+            library.get_marker("circle")
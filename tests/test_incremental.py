@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from svg_pltmarker import (
+    IncrementalConverter,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    SVGCircle,
+    SVGPath,
+    element_hash,
+    get_marker_from_svg,
+    metrics_registry,
+)
+
+TEMPLATE = """<svg xmlns="http://www.w3.org/2000/svg">
+    <circle cx="{cx}" cy="40" r="30"/>
+    <path d="m 10,10 c 5,0 5,5 10,5 s 5,5 10,5 z"/>
+    <rect x="10" y="10" width="20" height="30" rx="5"/>
+    <path d="m 10,10 c 5,0 5,5 10,5 s 5,5 10,5 z"/>
+</svg>"""
+
+
+class TestIncrementalConverter:
+    @pytest.mark.parametrize(
+        "svgstr",
+        [
+            TEMPLATE.format(cx=50),
+            '<svg><path d="m 1,2 l 3,4 z"/></svg>',
+            '<svg><path d="M 1,2 L 3,4"/><path d="m 1,1 h 2"/></svg>',
+            "<svg>"
+            + "".join(
+                f'<path d="M {0.1 * i + 0.3},{0.7 * i} l 0.1,0.2 l 0.3,-0.7 z"/>'
+                for i in range(5)
+            )
+            + "</svg>",
+        ],
+        ids=["mixed", "single", "relative", "copies"],
+    )
+    def test_same_as_get_marker_from_svg(self, svgstr: str) -> None:
+        # Translated copies are not instanced, so that the rounding is the same
+        marker = IncrementalConverter().convert(svgstr=svgstr)
+        expected = get_marker_from_svg(svgstr=svgstr, instancing=False)
+        np.testing.assert_array_equal(marker.vertices, expected.vertices)
+        np.testing.assert_array_equal(marker.codes, expected.codes)
+
+    def test_reuse(self) -> None:
+        converter = IncrementalConverter()
+        converter.convert(svgstr=TEMPLATE.format(cx=50))
+        # Identical elements are converted once
+        assert converter.last_stats.model_dump() == {"reused": 1, "recomputed": 3}
+        assert len(converter) == 3
+
+        metrics_registry.reset()
+        svgstr = TEMPLATE.format(cx=60)
+        marker = converter.convert(svgstr=svgstr)
+        assert converter.last_stats.model_dump() == {"reused": 3, "recomputed": 1}
+        assert metrics_registry.snapshot()["counters"]["incremental.reused"] == 3
+        np.testing.assert_array_equal(
+            marker.vertices,
+            get_marker_from_svg(svgstr=svgstr, instancing=False).vertices,
+        )
+
+    def test_limits(self) -> None:
+        converter = IncrementalConverter()
+        converter.convert(svgstr=TEMPLATE.format(cx=50))
+        with pytest.raises(ResourceLimitExceeded):
+            converter.convert(
+                svgstr=TEMPLATE.format(cx=50), limits=ResourceLimits(max_vertices=10)
+            )
+
+    def test_no_elements(self) -> None:
+        with pytest.raises(AssertionError):
+            IncrementalConverter().convert(svgstr="<svg></svg>")
+
+    def test_element_hash(self) -> None:
+        circle = SVGCircle(cx=1, cy=2, r=3)
+        assert element_hash(circle) == element_hash(SVGCircle(cx=1, cy=2, r=3))
+        assert element_hash(circle) != element_hash(SVGCircle(cx=1, cy=2, r=4))
+        assert element_hash(SVGPath(d="M 0,0")) != element_hash(SVGPath(d="M 0,1"))
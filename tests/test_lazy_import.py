@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+import svg_pltmarker
+
+
+def run_python(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestLazyImport:
+    def test_import_is_light(self) -> None:
+        run_python(
+            "import sys, svg_pltmarker\n"
+            "heavy = {'matplotlib', 'numpy', 'pydantic'} & set(sys.modules)\n"
+            "assert not heavy, heavy\n"
+        )
+
+    def test_attribute_imports_module(self) -> None:
+        run_python(
+            "import sys, svg_pltmarker\n"
+            "svg_pltmarker.SVGStyle\n"
+            "assert 'pydantic' in sys.modules\n"
+            "assert 'matplotlib' not in sys.modules\n"
+        )
+
+    @pytest.mark.parametrize("name", svg_pltmarker.__all__)
+    def test_public_names(self, name: str) -> None:
+        assert getattr(svg_pltmarker, name) is not None
+        assert name in dir(svg_pltmarker)
+
+    def test_unknown_name(self) -> None:
+        with pytest.raises(AttributeError):
+            svg_pltmarker.unknown_name
@@ -0,0 +1,90 @@
+import matplotlib
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+from matplotlib.image import AxesImage
+from matplotlib.path import Path
+
+from svg_pltmarker import (
+    composite_sprites,
+    get_marker_from_svg,
+    marker_hash,
+    rasterize_marker,
+    scatter_sprites,
+)
+
+matplotlib.use("Agg")
+
+TRIANGLE = '<svg><path d="M 0,0 L 10,0 L 5,10 Z"/></svg>'
+
+
+class TestMarkerHash:
+    def test_marker_hash(self) -> None:
+        marker = get_marker_from_svg(svgstr=TRIANGLE)
+        assert marker_hash(marker) == marker_hash(get_marker_from_svg(svgstr=TRIANGLE))
+        assert marker_hash(marker) != marker_hash(Path.unit_circle())
+
+
+class TestRasterizeMarker:
+    @pytest.mark.parametrize(
+        ("size", "dpi"),
+        [(36, 100), (100, 100), (36, 300)],
+        ids=["default", "large", "high_dpi"],
+    )
+    def test_shape(self, size: float, dpi: float) -> None:
+        sprite = rasterize_marker(Path.unit_circle(), size, dpi)
+        assert sprite.dtype == np.uint8
+        assert sprite.shape[0] == sprite.shape[1] and sprite.shape[0] % 2 == 1
+        assert sprite.shape[0] >= np.sqrt(size) * dpi / 72
+        center = sprite.shape[0] // 2
+        assert tuple(sprite[center, center]) == (0, 0, 0, 255)
+        assert sprite[0, 0, 3] == 0
+
+    def test_cache(self) -> None:
+        marker = get_marker_from_svg(svgstr=TRIANGLE)
+        sprite = rasterize_marker(marker, 36, facecolor="red")
+        assert rasterize_marker(marker, 36, facecolor=(1, 0, 0)) is sprite
+        assert rasterize_marker(marker, 36, facecolor="blue") is not sprite
+        assert not sprite.flags.writeable
+
+
+class TestCompositeSprites:
+    def test_single(self) -> None:
+        sprite = rasterize_marker(Path.unit_circle(), 100, facecolor="red")
+        image = np.zeros((40, 40, 4), dtype=np.uint8)
+        result = composite_sprites(image, sprite, np.array([[20, 20]]))
+        assert result.dtype == np.uint8
+        window_slice = slice(20 - sprite.shape[0] // 2, 21 + sprite.shape[0] // 2)
+        window = result[window_slice, window_slice]
+        np.testing.assert_allclose(window[..., 3], sprite[..., 3], atol=1)
+        assert tuple(result[20, 20]) == (255, 0, 0, 255)
+        assert result[0, 0, 3] == 0
+
+    def test_overlap_and_clipping(self) -> None:
+        sprite = np.zeros((3, 3, 4), dtype=np.uint8)
+        sprite[1, 1] = (0, 0, 255, 128)
+        image = np.zeros((5, 5, 4))
+        positions = np.array([[2, 2], [2, 2], [-5, -5], [4, 0]])
+        result = composite_sprites(image, sprite, positions)
+        alpha = 128 / 255
+        assert result[2, 2, 3] == pytest.approx(1 - (1 - alpha) ** 2)
+        assert result[0, 4, 3] == pytest.approx(alpha)
+        np.testing.assert_allclose(result[2, 2, :3], [0, 0, 1])
+        assert result[..., 3].sum() == pytest.approx(1 - (1 - alpha) ** 2 + alpha)
+
+
+class TestScatterSprites:
+    def test_scatter_sprites(self) -> None:
+        figure = Figure(dpi=100)
+        ax = figure.add_subplot()
+        ax.set_xlim(0, 1)
+        ax.set_ylim(0, 1)
+        rng = np.random.default_rng(0)
+        marker = get_marker_from_svg(svgstr=TRIANGLE)
+        image = scatter_sprites(ax, rng.random(1000), rng.random(1000), marker)
+        assert isinstance(image, AxesImage)
+        assert image.get_extent() == [0, 1, 0, 1]
+        array = image.get_array()
+        bbox = ax.get_window_extent()
+        assert array.shape == (round(bbox.height), round(bbox.width), 4)
+        assert 0 < array[..., 3].mean() < 1
@@ -0,0 +1,87 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from svg_pltmarker import (
+    Histogram,
+    MetricsRegistry,
+    get_marker_from_svg,
+    metrics_registry,
+)
+
+file_dir = Path(__file__).absolute().parent / "files"
+
+
+class TestHistogram:
+    def test_observe(self) -> None:
+        histogram = Histogram(buckets=[1.0, 10.0])
+        for value in [0.5, 1.0, 5.0, 100.0]:
+            histogram.observe(value)
+        assert histogram.snapshot() == {
+            "count": 4,
+            "sum": 106.5,
+            "min": 0.5,
+            "max": 100.0,
+            "buckets": {"1.0": 2, "10.0": 3, "+Inf": 4},
+        }
+
+
+class TestMetricsRegistry:
+    def test_counters(self) -> None:
+        registry = MetricsRegistry()
+        registry.increment("a")
+        registry.update({"a": 2, "b": 3})
+        assert registry.snapshot()["counters"] == {"a": 3, "b": 3}
+        registry.reset()
+        assert registry.snapshot() == {"counters": {}, "histograms": {}}
+
+    def test_disabled(self) -> None:
+        registry = MetricsRegistry()
+        registry.enabled = False
+        registry.increment("a")
+        registry.observe("b", 1.0)
+        assert registry.snapshot() == {"counters": {}, "histograms": {}}
+
+    def test_thread_safety(self) -> None:
+        registry = MetricsRegistry()
+
+        def work(_: int) -> None:
+            for _ in range(1000):
+                registry.increment("a")
+                registry.observe("b", 1.0)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(work, range(8)))
+        snapshot = registry.snapshot()
+        assert snapshot["counters"]["a"] == 8000
+        assert snapshot["histograms"]["b"]["count"] == 8000
+
+    @pytest.mark.parametrize(("reset",), [(False,), (True,)], ids=["keep", "reset"])
+    def test_export(self, reset: bool) -> None:
+        registry = MetricsRegistry()
+        exported: list[dict[str, Any]] = []
+        registry.add_exporter(exported.append)
+        registry.increment("a")
+        snapshot = registry.export(reset=reset)
+        assert exported == [snapshot]
+        assert snapshot["counters"] == {"a": 1}
+        assert bool(registry.snapshot()["counters"]) is not reset
+        registry.remove_exporter(exported.append)
+        registry.export()
+        assert len(exported) == 1
+
+    def test_conversion_metrics(self) -> None:
+        metrics_registry.reset()
+        marker = get_marker_from_svg(filepath=str(file_dir / "test.svg"))
+        snapshot = metrics_registry.snapshot()
+        counters = snapshot["counters"]
+        assert counters["elements.circle"] == 1
+        assert counters["elements.g"] == 1
+        assert counters["documents"] == 1
+        assert counters["bytes_fetched"] == (file_dir / "test.svg").stat().st_size
+        assert counters["commands.A"] == 8
+        assert counters["arcs"] == 8
+        assert counters["vertices"] == len(marker.vertices)
+        assert snapshot["histograms"]["vertices_per_path"]["count"] == 1
@@ -0,0 +1,102 @@
+from pathlib import Path
+
+import matplotlib
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from svg_pltmarker import (
+    get_marker_from_svg,
+    group_indices,
+    load_marker,
+    metrics_registry,
+    scatter_by_marker,
+)
+
+matplotlib.use("Agg")
+
+file_dir = Path(__file__).absolute().parent / "files"
+TRIANGLE = '<svg><path d="M 0,0 L 10,0 L 5,10 Z"/></svg>'
+SQUARE = '<svg><rect x="0" y="0" width="10" height="10"/></svg>'
+
+
+class TestGroupIndices:
+    @pytest.mark.parametrize(
+        ("keys", "expected_keys", "expected_groups"),
+        [
+            ([2, 0, 2, 1, 0], [0, 1, 2], [[1, 4], [3], [0, 2]]),
+            (["b", "a", "b"], ["a", "b"], [[1], [0, 2]]),
+            ([], [], [[]]),
+        ],
+        ids=["int", "str", "empty"],
+    )
+    def test_group_indices(
+        self,
+        keys: list,
+        expected_keys: list,
+        expected_groups: list[list[int]],
+    ) -> None:
+        unique_keys, groups = group_indices(np.array(keys))
+        assert unique_keys.tolist() == expected_keys
+        assert [group.tolist() for group in groups] == expected_groups
+
+
+class TestLoadMarker:
+    def test_load_marker(self) -> None:
+        metrics_registry.reset()
+        marker = load_marker(TRIANGLE)
+        assert load_marker(TRIANGLE) is marker
+        assert load_marker(marker) is marker
+        counters = metrics_registry.snapshot()["counters"]
+        assert counters["cache.marker.hits"] == 1
+
+    def test_load_marker_file(self) -> None:
+        filepath = file_dir / "test.svg"
+        marker = load_marker(filepath)
+        expected = get_marker_from_svg(filepath=str(filepath))
+        np.testing.assert_array_equal(marker.vertices, expected.vertices)
+
+    def test_load_marker_str_path(self) -> None:
+        with pytest.raises(ValueError, match="os.PathLike"):
+            load_marker(str(file_dir / "test.svg"))
+
+
+class TestScatterByMarker:
+    def test_scatter_by_marker(self) -> None:
+        ax = Figure().add_subplot()
+        rng = np.random.default_rng(0)
+        num_points = 1000
+        x, y = rng.random(num_points), rng.random(num_points)
+        keys = rng.choice(["triangle", "square"], num_points)
+        values = rng.random(num_points)
+        sizes = rng.random(num_points) * 100
+        collections = scatter_by_marker(
+            ax,
+            x,
+            y,
+            keys,
+            {"triangle": TRIANGLE, "square": SQUARE},
+            s=sizes,
+            c=values,
+        )
+        assert list(collections) == ["square", "triangle"]
+        assert len(ax.collections) == 2
+        for key, collection in collections.items():
+            mask = keys == key
+            np.testing.assert_array_equal(
+                collection.get_offsets(), np.column_stack([x[mask], y[mask]])
+            )
+            np.testing.assert_array_equal(collection.get_sizes(), sizes[mask])
+            np.testing.assert_array_equal(collection.get_array(), values[mask])
+            assert collection.norm.vmin == values.min()
+            assert collection.norm.vmax == values.max()
+
+    def test_missing_marker(self) -> None:
+        ax = Figure().add_subplot()
+        with pytest.raises(KeyError):
+            scatter_by_marker(ax, [0, 1], [0, 1], ["a", "b"], {"a": TRIANGLE})
+
+    def test_length_mismatch(self) -> None:
+        ax = Figure().add_subplot()
+        with pytest.raises(ValueError):
+            scatter_by_marker(ax, [0, 1], [0], ["a", "a"], {"a": TRIANGLE})
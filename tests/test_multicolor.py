@@ -0,0 +1,126 @@
+import matplotlib
+import numpy as np
+import pytest
+from matplotlib.collections import PathCollection
+from matplotlib.figure import Figure
+
+from svg_pltmarker import (
+    SVGObject,
+    get_marker_from_svg,
+    get_multicolor_marker_from_svg,
+    scatter_multicolor,
+    svg_color_to_rgba,
+)
+
+matplotlib.use("Agg")
+
+FACE_SVG_CONTENT = """<svg viewBox="0 0 100 100">
+    <circle cx="50" cy="50" r="50" fill="gold"/>
+    <g fill="rgb(0,0,0)">
+        <circle cx="35" cy="40" r="8"/>
+        <circle cx="65" cy="40" r="8"/>
+    </g>
+    <path d="M 25,65 Q 50,90 75,65" fill="none" stroke="#c00" stroke-width="5"/>
+</svg>"""
+
+
+class TestSVGColorToRGBA:
+    @pytest.mark.parametrize(
+        ("color", "opacity", "expected"),
+        [
+            ("red", 1.0, (1.0, 0.0, 0.0, 1.0)),
+            ("#00f", 0.5, (0.0, 0.0, 1.0, 0.5)),
+            ("rgb(255, 0, 0)", 1.0, (1.0, 0.0, 0.0, 1.0)),
+            ("rgb(100%,50%,0%)", 1.0, (1.0, 0.5, 0.0, 1.0)),
+            ("rgba(0,0,255,0.5)", 1.0, (0.0, 0.0, 1.0, 0.5)),
+            ("rgba(0,0,0,50%)", 0.5, (0.0, 0.0, 0.0, 0.25)),
+            ("none", 1.0, (0.0, 0.0, 0.0, 0.0)),
+            ("url(#gradient)", 1.0, (0.0, 0.0, 0.0, 1.0)),
+            ("rgb(0,x,0)", 1.0, (0.0, 0.0, 0.0, 1.0)),
+        ],
+        ids=[
+            "named",
+            "hex",
+            "rgb",
+            "percent",
+            "rgba",
+            "percent alpha",
+            "none",
+            "unknown",
+            "invalid rgb",
+        ],
+    )
+    def test_svg_color_to_rgba(
+        self, color: str, opacity: float, expected: tuple[float, ...]
+    ) -> None:
+        assert svg_color_to_rgba(color, opacity) == pytest.approx(expected)
+
+
+class TestMultiColorMarker:
+    def test_element_styles(self) -> None:
+        svg = SVGObject(svgstr=FACE_SVG_CONTENT)
+        assert [style.fill for style in svg.element_styles] == [
+            "gold",
+            "rgb(0,0,0)",
+            "rgb(0,0,0)",
+            "none",
+        ]
+        assert svg.element_styles[3].stroke == "#c00"
+
+    def test_get_multicolor_marker_from_svg(self) -> None:
+        marker = get_multicolor_marker_from_svg(svgstr=FACE_SVG_CONTENT)
+        assert len(marker.paths) == 3
+        np.testing.assert_allclose(
+            marker.facecolors[:, 3], [1.0, 1.0, 0.0]
+        )  # The smile is not filled
+        np.testing.assert_allclose(marker.edgecolors[2], [0.8, 0.0, 0.0, 1.0])
+        np.testing.assert_allclose(marker.linewidths[2], 5 / 100, rtol=0.05)
+
+        # The groups overlay the monochrome marker
+        mono = get_marker_from_svg(svgstr=FACE_SVG_CONTENT)
+        vertices = np.concatenate([path.vertices for path in marker.paths])
+        np.testing.assert_allclose(vertices.min(axis=0), mono.vertices.min(axis=0))
+        np.testing.assert_allclose(vertices.max(axis=0), mono.vertices.max(axis=0))
+        num_face_vertices = len(marker.paths[0].vertices)
+        np.testing.assert_allclose(
+            marker.paths[0].vertices, mono.vertices[:num_face_vertices]
+        )
+
+    def test_interleaved_styles(self) -> None:
+        svg_str = """<svg viewBox="0 0 30 10">
+            <rect x="0" y="0" width="10" height="10" fill="red"/>
+            <rect x="5" y="0" width="10" height="10" fill="blue"/>
+            <rect x="10" y="0" width="10" height="10" fill="red"/>
+            <rect x="15" y="0" width="10" height="10" fill="red"/>
+        </svg>"""
+        marker = get_multicolor_marker_from_svg(svgstr=svg_str)
+        # The last red rectangles are drawn over the blue one
+        np.testing.assert_allclose(
+            marker.facecolors,
+            [[1.0, 0.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0], [1.0, 0.0, 0.0, 1.0]],
+        )
+        assert [len(path.to_polygons()) for path in marker.paths] == [1, 1, 2]
+
+
+class TestScatterMulticolor:
+    @pytest.mark.parametrize(
+        "sizes",
+        [100.0, np.arange(1, 6) * 100.0],
+        ids=["shared", "per_point"],
+    )
+    def test_scatter_multicolor(self, sizes: float | np.ndarray) -> None:
+        ax = Figure().add_subplot()
+        marker = get_multicolor_marker_from_svg(svgstr=FACE_SVG_CONTENT)
+        x, y = np.arange(5.0), np.arange(5.0)
+        collection = scatter_multicolor(ax, x, y, marker, s=sizes)
+        assert isinstance(collection, PathCollection)
+        assert list(ax.collections) == [collection]
+        assert len(collection.get_paths()) == 3
+        offsets = collection.get_offsets()
+        assert len(offsets) == 15
+        np.testing.assert_array_equal(offsets[:3], [[0, 0]] * 3)
+        np.testing.assert_allclose(collection.get_facecolors(), marker.facecolors)
+        assert len(collection.get_sizes()) == np.size(sizes) * (
+            3 if np.ndim(sizes) else 1
+        )
+        assert ax.get_xlim()[0] < 0 and ax.get_xlim()[1] > 4
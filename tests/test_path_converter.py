@@ -0,0 +1,161 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from svg_pltmarker import (
+    PathConverter,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    SVGCircle,
+    SVGObject,
+    SVGPath,
+    SVGPolygon,
+    SVGPolyline,
+    get_marker_from_svg,
+    metrics_registry,
+)
+from svg_pltmarker.path_converter import _translation_key
+
+file_dir = Path(__file__).absolute().parent / "files"
+
+MANY_ELEMENTS_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    + "".join(
+        f'<path d="M {i},{i} l 1,2 a 3,3 0 0 1 4,4 z"/><circle cx="{i}" r="{i + 1}"/>'
+        for i in range(50)
+    )
+    + "</svg>"
+)
+
+DOT_GRID_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    + "".join(
+        f'<circle cx="{x * 2.5}" cy="{y * 2.5}" r="1"/>'
+        for x in range(10)
+        for y in range(10)
+    )
+    + '<rect x="1" y="2" width="3" height="4" rx="1"/>'
+    + "</svg>"
+)
+
+
+class TestPathConverter:
+    @pytest.mark.parametrize(
+        ("svg_str",),
+        [
+            ((file_dir / "test.svg").read_text(),),
+            (MANY_ELEMENTS_SVG,),
+        ],
+        ids=["test.svg", "many elements"],
+    )
+    @pytest.mark.parametrize(
+        ("num_workers", "use_processes"),
+        [(2, False), (3, False), (2, True)],
+        ids=["2 threads", "3 threads", "2 processes"],
+    )
+    def test_elements2plt_parallel(
+        self, svg_str: str, num_workers: int, use_processes: bool
+    ) -> None:
+        svg = SVGObject(svgstr=svg_str)
+        expected = PathConverter.svg2plt(
+            "M 0.0,0.0 ".join(element.path_repr() for element in svg.graphic_elements)
+        )
+        path = PathConverter.elements2plt(
+            svg.graphic_elements,
+            num_workers=num_workers,
+            use_processes=use_processes,
+            instancing=False,
+        )
+        np.testing.assert_array_equal(path.vertices, expected.vertices)
+        np.testing.assert_array_equal(path.codes, expected.codes)
+
+    @pytest.mark.parametrize(
+        ("num_workers",), [(None,), (3,)], ids=["serial", "3 threads"]
+    )
+    def test_elements2plt_arrays(self, num_workers: int | None) -> None:
+        rng = np.random.default_rng(0)
+        elements = [
+            SVGPolyline(points=rng.normal(size=(5, 2))),
+            SVGPolygon(points=rng.normal(size=(4, 2))),
+            SVGCircle(cx=1, cy=2, r=3),
+            SVGPolygon(points=rng.normal(size=(3, 2))),
+            SVGCircle(cx=3, cy=2, r=1),
+        ]
+        expected = PathConverter.svg2plt(
+            "M 0.0,0.0 ".join(element.path_repr() for element in elements)
+        )
+        path = PathConverter.elements2plt(elements, num_workers=num_workers)
+        np.testing.assert_allclose(path.vertices, expected.vertices, atol=1e-12)
+        np.testing.assert_array_equal(path.codes, expected.codes)
+
+        paths, _ = PathConverter.groups2plt([elements[:2], elements[2:]])
+        np.testing.assert_allclose(
+            np.concatenate([path.vertices for path in paths]),
+            np.delete(expected.vertices, 11, axis=0),  # Separator between groups
+            atol=1e-12,
+        )
+
+    def test_get_marker_from_svg_parallel(self) -> None:
+        expected = get_marker_from_svg(svgstr=MANY_ELEMENTS_SVG)
+        marker = get_marker_from_svg(svgstr=MANY_ELEMENTS_SVG, num_workers=4)
+        np.testing.assert_array_equal(marker.vertices, expected.vertices)
+        np.testing.assert_array_equal(marker.codes, expected.codes)
+
+    def test_elements2plt_invalid_num_workers(self) -> None:
+        svg = SVGObject(svgstr=MANY_ELEMENTS_SVG)
+        with pytest.raises(AssertionError, match="Invalid number of workers"):
+            PathConverter.elements2plt(svg.graphic_elements, num_workers=0)
+
+
+class TestInstancing:
+    @pytest.mark.parametrize(
+        ("svg_paths", "same"),
+        [
+            (["M 1,2 L 3,4 Z", "M 11,12 L 13,14 Z"], True),
+            (["M 1,2 l 2,2 z", "m 11,12 l 2,2 z"], True),
+            (["M 1,2 L 3,4", "M 1,2 L 3,5"], False),
+            (["M 1,2 H 3 V 4", "M 2,3 H 4 V 5"], True),
+            (["M 0,0 A 1,2 30 0 1 3,4", "M 5,5 A 1,2 30 0 1 8,9"], True),
+            (["M 0,0 A 1,2 30 0 1 3,4", "M 5,5 A 1,2 31 0 1 8,9"], False),
+            (["M 0,0 C 1,1 2,2 3,3", "M 1,1 c 1,1 2,2 3,3"], False),
+        ],
+        ids=["absolute", "relative", "shape", "axes", "arc", "arc_angle", "mixed"],
+    )
+    def test_translation_key(self, svg_paths: list[str], same: bool) -> None:
+        keys = [_translation_key(svg_path) for svg_path in svg_paths]
+        assert all(key is not None for key in keys)
+        assert (keys[0][0] == keys[1][0]) == same  # type: ignore[index]
+
+    def test_translation_key_invalid(self) -> None:
+        assert _translation_key("L 1,2") is None
+        assert _translation_key("M 1,2 L 3") is None
+
+    @pytest.mark.parametrize(
+        ("num_workers",), [(None,), (3,)], ids=["serial", "3 threads"]
+    )
+    def test_dot_grid(self, num_workers: int | None) -> None:
+        svg = SVGObject(svgstr=DOT_GRID_SVG)
+        expected = PathConverter.elements2plt(svg.graphic_elements, instancing=False)
+        metrics_registry.reset()
+        path = PathConverter.elements2plt(svg.graphic_elements, num_workers=num_workers)
+        np.testing.assert_allclose(path.vertices, expected.vertices, atol=1e-12)
+        np.testing.assert_array_equal(path.codes, expected.codes)
+        counters = metrics_registry.snapshot()["counters"]
+        assert counters["instances"] == 99
+        assert counters["vertices"] == len(expected.vertices)
+        assert counters["commands.A"] == 1 * 4 + 4  # One circle and the rect
+
+    def test_groups(self) -> None:
+        groups = [[SVGPath(d=f"M {i},0 l 1,1 z") for i in range(3)]] * 2
+        paths, _ = PathConverter.groups2plt(groups)
+        expected, _ = PathConverter.groups2plt(groups, instancing=False)
+        for path, expected_path in zip(paths, expected):
+            np.testing.assert_allclose(path.vertices, expected_path.vertices)
+
+    def test_limits(self) -> None:
+        svg = SVGObject(svgstr=DOT_GRID_SVG)
+        with pytest.raises(ResourceLimitExceeded, match="vertices"):
+            PathConverter.elements2plt(
+                svg.graphic_elements, limits=ResourceLimits(max_vertices=1000)
+            )
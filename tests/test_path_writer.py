@@ -0,0 +1,92 @@
+import pathlib
+
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from svg_pltmarker import PathConverter, get_marker_from_svg, plt2svg
+
+file_dir = pathlib.Path(__file__).absolute().parent / "files"
+
+SVG_STRINGS = [
+    '<svg><path d="M 0,0 L 10,5 L 20,0 Z"/></svg>',
+    '<svg><path d="M 1,2 C 3,4 5,6 7,8 S 9,9 1,0 Q 2,2 3,1 T 5,5 Z"/></svg>',
+    '<svg><path d="M 0,0 A 10 20 30 1 0 50,50 Z m 10,10 h 5 v 5 h -5 z"/></svg>',
+    '<svg><circle cx="5" cy="5" r="4"/><rect x="0" y="0" width="3" height="2"/></svg>',
+]
+
+
+def assert_round_trip(path: Path, svg_path: str, precision: int) -> None:
+    vertices, codes = PathConverter._parse(svg_path)
+    np.testing.assert_allclose(
+        vertices * [1, -1], path.vertices, rtol=0, atol=0.5 * 10**-precision + 1e-12
+    )
+    np.testing.assert_array_equal(codes, path.codes)
+
+
+class TestPathWriter:
+    @pytest.mark.parametrize(
+        "svgstr", SVG_STRINGS, ids=["polygon", "curves", "arc", "shapes"]
+    )
+    @pytest.mark.parametrize("precision", [0, 2, 4, 6])
+    def test_round_trip(self, svgstr: str, precision: int) -> None:
+        marker = get_marker_from_svg(svgstr=svgstr)
+        assert_round_trip(marker, plt2svg(marker, precision), precision)
+
+    def test_round_trip_file(self) -> None:
+        marker = get_marker_from_svg(filepath=str(file_dir / "test.svg"))
+        assert_round_trip(marker, plt2svg(marker), 4)
+
+    def test_no_drift(self) -> None:
+        # The sum of the rounded relative moves would drift from the vertices
+        vertices = np.column_stack([np.arange(1000) * 0.00049, np.zeros(1000)])
+        path = Path(vertices, [Path.MOVETO] + [Path.LINETO] * 999)
+        svg_path = plt2svg(path, precision=3)
+        assert_round_trip(path, svg_path, 3)
+
+    def test_compact(self) -> None:
+        marker = get_marker_from_svg(svgstr=SVG_STRINGS[0])
+        assert plt2svg(marker, precision=3, scale=100) == "m-50-12.5 50 25 50-25z"
+
+    @pytest.mark.parametrize(
+        ("vertices", "codes", "precision", "expected"),
+        [
+            ([[0, 0], [1, 0], [1, 1], [0, 0]], [1, 2, 2, 79], 0, "m0 0h1v-1z"),
+            ([[0, 0], [1, 0], [1, 1], [0, 0]], [1, 2, 2, 2], 0, "m0 0h1v-1z"),
+            ([[0, 0], [1, 0], [1, 1], [0, 1]], [1, 2, 2, 2], 0, "m0 0h1v-1h-1"),
+            ([[0, 0], [0.5, -0.5], [1, -1]], [1, 2, 2], 1, "m0 0 .5.5.5.5"),
+            ([[0, 0], [1, 0.5], [2, 0]], [1, 2, 2], 1, "m0 0 1-.5 1 .5"),
+            ([[0, 0], [1, 1], [2, 0], [3, 0]], [1, 3, 3, 2], 0, "m0 0q1-1 2 0h1"),
+            ([[0, 0], [0, 0], [1, 1], [2, 0]], [1, 4, 4, 4], 0, "m0 0c0 0 1-1 2 0"),
+            ([[1, 1], [2, 2], [3, 3]], None, 0, "m1-1 1-1 1-1"),
+            ([[0, 0], [1, 0], [0, 0], [9, 9]], [1, 2, 0, 1], 0, "m0 0h1"),
+        ],
+        ids=[
+            "closepoly",
+            "closing-line",
+            "open",
+            "merged-points",
+            "integer-space",
+            "quadratic",
+            "cubic",
+            "no-codes",
+            "stop",
+        ],
+    )
+    def test_commands(
+        self,
+        vertices: list[list[float]],
+        codes: list[int] | None,
+        precision: int,
+        expected: str,
+    ) -> None:
+        assert plt2svg(Path(vertices, codes), precision) == expected
+
+    def test_flip_y(self) -> None:
+        path = Path([[0, 0], [0, 1]], [Path.MOVETO, Path.LINETO])
+        assert plt2svg(path) == "m0 0v-1"
+        assert plt2svg(path, flip_y=False) == "m0 0v1"
+
+    def test_negative_precision(self) -> None:
+        with pytest.raises(ValueError, match="precision"):
+            plt2svg(Path([[0, 0], [1, 1]]), precision=-1)
@@ -0,0 +1,138 @@
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from svg_pltmarker import get_marker_from_svg, probe
+from svg_pltmarker.cli import inspect_svg
+
+
+class TestProbe:
+    @pytest.mark.parametrize(
+        "svgstr",
+        [
+            '<svg><path d="M 1,2 L 3,4 Z"/></svg>',
+            '<svg><path d="m 10,10 c 5,0 5,5 10,5 s 5,5 10,5 q 1,2 3,4 t 5,6 z"/>'
+            "</svg>",
+            '<svg><path d="M 0,0 A 10 20 30 1 0 5,5 a 0 1 0 0 1 2,2 H 1 v 3"/></svg>',
+            '<svg><path d="M 0,0 A 1 1 0 1 1 10,0"/></svg>',
+            '<svg><g><circle cx="5" cy="5" r="3"/></g><rect width="4" height="2"'
+            ' rx="1"/><polygon points="0,0 3,4 5,1"/><polyline points="1,1 2,2"/>'
+            '<line x1="0" y1="0" x2="3" y2="3"/><ellipse rx="2" ry="1"/></svg>',
+        ],
+        ids=["line", "curves", "arcs", "small_radius", "shapes"],
+    )
+    def test_same_as_conversion(self, svgstr: str) -> None:
+        report = probe(svgstr=svgstr)
+        marker = get_marker_from_svg(svgstr=svgstr)
+        assert report.valid and report.errors == []
+        assert report.estimated_vertices == len(marker.vertices)
+        assert report.num_bytes == len(svgstr.encode("utf-8"))
+
+    def test_file(self) -> None:
+        report = probe(filepath="tests/files/test.svg")
+        summary = inspect_svg("tests/files/test.svg")
+        assert report.valid
+        assert report.estimated_vertices == summary["vertices"]
+        assert report.commands == summary["commands"]
+        assert {
+            tag: count for tag, count in report.elements.items() if tag != "g"
+        } == summary["elements"]
+
+    @pytest.mark.parametrize(
+        ("svgstr", "expected"),
+        [
+            ('<svg><path d="M 1,2 L 3,-4 5,0"/></svg>', (1, -4, 5, 2)),
+            ('<svg><path d="M 1,2 l 3,-4 h 1 v 10"/></svg>', (1, -2, 5, 8)),
+            ('<svg><path d="M 0,0 C 0,-2 4,6 4,4"/></svg>', (0, -2, 4, 6)),
+            ('<svg><path d="M -1,0 A 1 1 0 0 1 1,0"/></svg>', (-1, -1, 1, 0)),
+            ('<svg><path d="M 1,0 A 1 1 0 1 1 1,-0.0001"/></svg>', (-1, -1, 1, 1)),
+            ('<svg><polygon points="2,3 -1,5 4,4"/></svg>', (-1, 3, 4, 5)),
+            ('<svg><circle cx="5" cy="5" r="2"/></svg>', (3, 3, 7, 7)),
+            # The origin between elements is included as in the normalization
+            (
+                '<svg><rect x="2" y="2" width="2" height="2"/><rect x="5" y="5"'
+                ' width="1" height="1"/></svg>',
+                (0, 0, 6, 6),
+            ),
+        ],
+        ids=[
+            "line",
+            "relative",
+            "curve",
+            "half_arc",
+            "full_arc",
+            "polygon",
+            "circle",
+            "origin",
+        ],
+    )
+    def test_bounds(self, svgstr: str, expected: tuple[float, ...]) -> None:
+        bounds = probe(svgstr=svgstr).bounds
+        assert bounds is not None
+        np.testing.assert_allclose(bounds, expected, atol=1e-3)
+
+    @pytest.mark.parametrize(
+        ("svgstr", "message"),
+        [
+            ('<svg><path d="L 1,2"/></svg>', "first command must be MoveTo"),
+            ('<svg><path d="M 1,2 L 3"/></svg>', "L needs a multiple of 2"),
+            ('<svg><path d="M 1,2 Z L 3,4"/></svg>', "Z must be followed by M"),
+            ('<svg><path d=""/></svg>', "no command found"),
+            ('<svg><polygon points="1,2 3"/></svg>', "2 or more pairs"),
+            ('<svg><circle cx="1" cy="2" r="x"/></svg>', "invalid attributes"),
+            ("<svg><path d='M 0,0 L 1,1'", "Invalid XML"),
+            ('<html><path d="M 0,0 L 1,1"/></html>', "SVG element not found"),
+            ("<svg><g/></svg>", "No graphic element found"),
+        ],
+        ids=[
+            "not_move",
+            "arguments",
+            "close",
+            "empty",
+            "odd",
+            "attribute",
+            "xml",
+            "no_svg",
+            "no_element",
+        ],
+    )
+    def test_invalid(self, svgstr: str, message: str) -> None:
+        report = probe(svgstr=svgstr)
+        assert not report.valid
+        assert message in report.errors[0]
+
+    def test_invalid_like_conversion(self) -> None:
+        for d in ["M 1,2 L 3", "M 1,2 Z L 3,4", "L 1,2"]:
+            svgstr = f'<svg><path d="{d}"/></svg>'
+            assert not probe(svgstr=svgstr).valid
+            with pytest.raises(AssertionError):
+                get_marker_from_svg(svgstr=svgstr)
+
+    def test_large_points(self) -> None:
+        coordinates = np.arange(100001, dtype=np.float64) % 97
+        points = " ".join(f"{value:g}" for value in coordinates[:-1])
+        report = probe(svgstr=f'<svg><polyline points="{points}"/></svg>')
+        assert report.estimated_vertices == 50000
+        assert report.commands == {"L": 49999, "M": 1}
+        assert report.bounds == (0, 0, 96, 96)
+
+    def test_no_matplotlib(self) -> None:
+        code = (
+            "import sys; from svg_pltmarker import probe; "
+            "probe(svgstr='<svg><path d=\"M 0,0 A 1 1 0 0 1 1,1\"/></svg>'); "
+            "print('matplotlib' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+    def test_file_not_found(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            probe(filepath="tests/files/not_found.svg")
+
+    def test_no_input(self) -> None:
+        with pytest.raises(ValueError):
+            probe()
@@ -0,0 +1,72 @@
+from pathlib import Path
+
+import pytest
+
+from svg_pltmarker import (
+    ConversionProfiler,
+    PathConverter,
+    ProfileReport,
+    SVGPath,
+    get_marker_from_svg,
+)
+
+file_dir = Path(__file__).absolute().parent / "files"
+
+PIPELINE_PHASES = [
+    "fetch",
+    "xml_parse",
+    "model_build",
+    "path_repr",
+    "instance",
+    "tokenize",
+    "convert",
+    "arc",
+    "normalize",
+]
+
+
+class TestConversionProfiler:
+    def test_explicit_profiler(self) -> None:
+        profiler = ConversionProfiler()
+        get_marker_from_svg(filepath=str(file_dir / "test.svg"), profiler=profiler)
+        report = profiler.report()
+        assert list(report.phases.keys()) == PIPELINE_PHASES
+        assert all(timing.count == 1 for timing in report.phases.values())
+        assert report.total_ns == sum(t.total_ns for t in report.phases.values())
+
+    def test_context_manager(self) -> None:
+        with ConversionProfiler() as profiler:
+            get_marker_from_svg(filepath=str(file_dir / "test.svg"))
+        assert list(profiler.report().phases.keys()) == PIPELINE_PHASES
+
+        # Deactivated after the with statement
+        get_marker_from_svg(filepath=str(file_dir / "test.svg"))
+        assert profiler.report().phases["fetch"].count == 1
+
+    @pytest.mark.parametrize(
+        ("use_processes", "expected_phases"),
+        [
+            (
+                False,
+                ["path_repr", "instance", "tokenize", "convert", "arc", "normalize"],
+            ),
+            (True, ["path_repr", "instance", "convert", "normalize"]),
+        ],
+        ids=["threads", "processes"],
+    )
+    def test_parallel(self, use_processes: bool, expected_phases: list[str]) -> None:
+        profiler = ConversionProfiler()
+        svg_paths = ["M 0,0 A 1,1 0 0 1 1,1 Z", "M 1,1 L 2,2", "M 2,2 L 3,4"]
+        PathConverter.elements2plt(
+            [SVGPath(d=svg_path) for svg_path in svg_paths],
+            num_workers=2,
+            use_processes=use_processes,
+            profiler=profiler,
+        )
+        assert sorted(profiler.report().phases.keys()) == sorted(expected_phases)
+
+    def test_reset(self) -> None:
+        profiler = ConversionProfiler()
+        PathConverter.svg2plt("M 0,0 L 1,1", profiler=profiler)
+        profiler.reset()
+        assert profiler.report() == ProfileReport()
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from svg_pltmarker import (
+    CompactMarker,
+    dequantize_vertices,
+    get_marker_from_svg,
+    quantize_vertices,
+)
+
+MARKER = get_marker_from_svg(
+    svgstr='<svg><circle cx="5" cy="5" r="5"/><path d="M 0,0 L 10,3 Z"/></svg>'
+)
+
+
+class TestQuantize:
+    @pytest.mark.parametrize(
+        ("dtype", "atol"),
+        [(np.float64, 0), (np.float32, 1e-7), (np.int16, 0.5 / 65534), ("<i2", 1e-5)],
+        ids=["float64", "float32", "int16", "int16_str"],
+    )
+    def test_roundtrip(self, dtype: type[np.generic] | str, atol: float) -> None:
+        vertices = quantize_vertices(MARKER.vertices, dtype)
+        assert vertices.dtype == np.dtype(dtype)
+        restored = dequantize_vertices(vertices)
+        assert restored.dtype == np.float64
+        np.testing.assert_allclose(restored, MARKER.vertices, rtol=0, atol=atol)
+
+    def test_int16_range(self) -> None:
+        vertices = quantize_vertices(np.array([[-0.5, 0.5], [0.0, 0.25]]), np.int16)
+        np.testing.assert_array_equal(vertices, [[-32767, 32767], [0, 16384]])
+        with pytest.raises(ValueError):
+            quantize_vertices(np.array([[0.0, 1.0]]), np.int16)
+        with pytest.raises(ValueError):
+            quantize_vertices(np.array([[0.0, np.nan]]), np.int16)
+
+    def test_float64_not_copied(self) -> None:
+        assert quantize_vertices(MARKER.vertices, np.float64) is MARKER.vertices
+        assert dequantize_vertices(MARKER.vertices) is MARKER.vertices
+
+    def test_invalid_dtype(self) -> None:
+        with pytest.raises(ValueError):
+            quantize_vertices(MARKER.vertices, np.int32)
+        with pytest.raises(ValueError):
+            dequantize_vertices(np.zeros((1, 2), dtype=np.uint8))
+
+
+class TestCompactMarker:
+    @pytest.mark.parametrize(
+        ("dtype", "ratio"),
+        [(np.float32, 0.5), (np.int16, 0.25)],
+        ids=["float32", "int16"],
+    )
+    def test_from_path(self, dtype: type[np.generic], ratio: float) -> None:
+        compact = CompactMarker.from_path(MARKER, dtype)
+        assert compact.dtype == np.dtype(dtype) and len(compact) == len(MARKER)
+        assert compact.vertices.nbytes == MARKER.vertices.nbytes * ratio
+        assert compact.nbytes == compact.vertices.nbytes + len(MARKER)
+        assert not compact.vertices.flags.writeable
+        path = compact.to_path()
+        assert path.readonly and path.vertices.dtype == np.float64
+        np.testing.assert_allclose(path.vertices, MARKER.vertices, atol=1e-4)
+        np.testing.assert_array_equal(path.codes, MARKER.codes)
+
+    def test_without_codes(self) -> None:
+        compact = CompactMarker.from_path(Path([[0.0, 0.0], [0.5, 0.5]]), np.int16)
+        np.testing.assert_array_equal(compact.codes, [Path.MOVETO, Path.LINETO])
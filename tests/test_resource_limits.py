@@ -0,0 +1,155 @@
+from contextlib import nullcontext as does_not_raise
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from svg_pltmarker import (
+    PathConverter,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    SVGObject,
+    SVGPath,
+    get_marker_from_svg,
+)
+
+file_dir = Path(__file__).absolute().parent / "files"
+
+NESTED_SVG_CONTENT = (
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    + "<g>" * 10
+    + '<path d="M 0,0 L 1,1"/>'
+    + "</g>" * 10
+    + "</svg>"
+)
+
+
+class TestResourceLimits:
+    @pytest.mark.parametrize(
+        ("limits", "expected"),
+        [
+            (ResourceLimits(), does_not_raise()),
+            (
+                ResourceLimits(max_bytes=1000, max_elements=11, max_depth=11),
+                does_not_raise(),
+            ),
+            (
+                ResourceLimits(max_bytes=100),
+                pytest.raises(ResourceLimitExceeded, match="bytes"),
+            ),
+            (
+                ResourceLimits(max_elements=5),
+                pytest.raises(ResourceLimitExceeded, match="elements"),
+            ),
+            (
+                ResourceLimits(max_depth=3),
+                pytest.raises(ResourceLimitExceeded, match="depth"),
+            ),
+        ],
+        ids=["no limit", "within limits", "bytes", "elements", "depth"],
+    )
+    def test_svg_object_limits(self, limits: ResourceLimits, expected: Any) -> None:
+        with expected:
+            SVGObject(svgstr=NESTED_SVG_CONTENT, limits=limits)
+
+    def test_svg_object_limits_while_parsing(self) -> None:
+        # Deeper than the recursion limit of the DOM, so checked while parsing
+        deep_svg = "<svg>" + "<g>" * 5000 + "</g>" * 5000 + "</svg>"
+        with pytest.raises(ResourceLimitExceeded, match="depth"):
+            SVGObject(svgstr=deep_svg, limits=ResourceLimits(max_depth=10))
+        wide_svg = "<svg>" + '<path d="M 0,0 L 1,1"/>' * 100000 + "</svg>"
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            SVGObject(svgstr=wide_svg, limits=ResourceLimits(max_elements=10))
+        assert exc_info.value.value == 11
+
+    def test_svg_object_limits_outside_svg(self) -> None:
+        # The elements around the svg element are counted as well
+        wide_doc = "<doc>" + "<x/>" * 300000 + "<svg/></doc>"
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            SVGObject(svgstr=wide_doc, limits=ResourceLimits(max_elements=10))
+        assert exc_info.value.value == 11
+        deep_doc = "<a>" * 5000 + "<svg/>" + "</a>" * 5000
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            SVGObject(svgstr=deep_doc, limits=ResourceLimits(max_depth=5))
+        assert exc_info.value.value == 6
+
+    def test_svg_object_file_bytes(self) -> None:
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            SVGObject(
+                filepath=str(file_dir / "test.svg"), limits=ResourceLimits(max_bytes=10)
+            )
+        assert exc_info.value.resource == "bytes"
+        assert exc_info.value.limit == 10
+
+    @pytest.mark.parametrize(
+        ("limits", "resource"),
+        [
+            (ResourceLimits(max_tokens=100), "tokens"),
+            (ResourceLimits(max_vertices=100), "vertices"),
+            (ResourceLimits(max_seconds=1e-9), "seconds"),
+        ],
+        ids=["tokens", "vertices", "seconds"],
+    )
+    def test_svg2plt_limits(self, limits: ResourceLimits, resource: str) -> None:
+        svg_path = "M 0,0 " + "L 1,1 " * 1000
+        with pytest.raises(ResourceLimitExceeded) as exc_info:
+            PathConverter.svg2plt(svg_path, limits)
+        assert exc_info.value.resource == resource
+
+    @pytest.mark.parametrize(
+        ("num_workers",),
+        [(None,), (2,)],
+        ids=["serial", "parallel"],
+    )
+    def test_get_marker_from_svg_limits(self, num_workers: int | None) -> None:
+        svg_str = (
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            + '<path d="M 0,0 L 1,1 L 2,0 Z"/>' * 100
+            + "</svg>"
+        )
+        get_marker_from_svg(svgstr=svg_str, num_workers=num_workers)
+        with pytest.raises(ResourceLimitExceeded, match="vertices"):
+            get_marker_from_svg(
+                svgstr=svg_str,
+                num_workers=num_workers,
+                limits=ResourceLimits(max_vertices=300),
+            )
+
+    @pytest.mark.parametrize(
+        ("num_workers", "use_processes", "instancing"),
+        [
+            (None, False, True),
+            (None, False, False),
+            (4, False, True),
+            (4, False, False),
+            (2, True, False),
+        ],
+        ids=[
+            "serial",
+            "serial-no-instancing",
+            "threads",
+            "threads-no-instancing",
+            "processes",
+        ],
+    )
+    def test_elements_token_limit(
+        self, num_workers: int | None, use_processes: bool, instancing: bool
+    ) -> None:
+        # Translated copies of 16 tokens each, far fewer than the limit per element
+        elements = [
+            SVGPath(d=f"M {idx},0 l 1,1 l 1,-1 l 1,1 l 1,-1 z") for idx in range(100)
+        ]
+        kwargs = dict(
+            num_workers=num_workers, use_processes=use_processes, instancing=instancing
+        )
+        PathConverter.elements2plt(
+            elements, limits=ResourceLimits(max_tokens=2000), **kwargs
+        )
+        with pytest.raises(ResourceLimitExceeded, match="tokens"):
+            PathConverter.elements2plt(
+                elements, limits=ResourceLimits(max_tokens=200), **kwargs
+            )
+
+    def test_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            ResourceLimits(max_bytes=0)
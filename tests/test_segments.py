@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from matplotlib.path import Path
+
+from svg_pltmarker import (
+    MarkerSegments,
+    PathConverter,
+    SVGCircle,
+    SVGObject,
+    SVGPath,
+    SVGPolygon,
+    SVGPolyline,
+)
+
+ELEMENTS = [
+    SVGPath(d="M 0,0 L 3,4 Z M 5,5 l 1,1 M 7,7 L 8,9"),
+    SVGCircle(cx=5, cy=5, r=2),
+    SVGPolygon(points=np.array([[1.0, 2.0], [3.0, 5.0], [4.0, 1.0]])),
+    SVGPath(d="M 10,10 h 2 v 2 z"),
+    SVGPath(d="M 20,10 h 2 v 2 z"),  # A translated copy
+    SVGPolyline(points=np.array([[0.0, 1.0], [2.0, 3.0]])),
+]
+
+
+class TestMarkerSegments:
+    @pytest.mark.parametrize(
+        ("num_workers", "instancing"),
+        [(None, True), (None, False), (3, True)],
+        ids=["serial", "no_instancing", "3 threads"],
+    )
+    def test_elements(self, num_workers: int | None, instancing: bool) -> None:
+        segments = PathConverter.elements2segments(
+            ELEMENTS, num_workers=num_workers, instancing=instancing
+        )
+        expected = PathConverter.elements2plt(ELEMENTS, instancing=instancing)
+        np.testing.assert_array_equal(segments.path.vertices, expected.vertices)
+        np.testing.assert_array_equal(segments.path.codes, expected.codes)
+
+        # Each element normalized with the joint bounds
+        element_paths, _ = PathConverter.groups2plt(
+            [[element] for element in ELEMENTS], instancing=instancing
+        )
+        assert segments.num_elements == len(ELEMENTS)
+        for idx, element_path in enumerate(element_paths):
+            path = segments.element(idx)
+            np.testing.assert_allclose(path.vertices, element_path.vertices)
+            np.testing.assert_array_equal(path.codes, element_path.codes)
+            assert np.shares_memory(path.vertices, segments.path.vertices)
+            assert np.shares_memory(path.codes, segments.path.codes)
+            assert path.readonly
+
+    def test_subpaths(self) -> None:
+        segments = PathConverter.elements2segments(ELEMENTS)
+        assert segments.num_subpaths == 3 + 1 + 1 + 1 + 1 + 1
+        np.testing.assert_array_equal(
+            segments.subpath_elements, [0, 0, 0, 1, 2, 3, 4, 5]
+        )
+        subpaths = [segments.subpath(idx) for idx in range(segments.num_subpaths)]
+        assert [len(path) for path in subpaths[:3]] == [3, 2, 2]
+        for path in subpaths:
+            assert path.codes[0] == Path.MOVETO
+            assert np.shares_memory(path.vertices, segments.path.vertices)
+        # The MoveTo codes of arcs do not start subpaths
+        np.testing.assert_array_equal(
+            subpaths[3].vertices, segments.element(1).vertices
+        )
+        # The subpaths cover the elements, and the separators cover the rest
+        assert sum(len(path) for path in subpaths) == len(segments.path) - 5
+
+    def test_svg_object(self) -> None:
+        svg = SVGObject(
+            svgstr='<svg><rect width="2" height="1"/><path d="M 0,0 L 1,1"/></svg>'
+        )
+        segments = PathConverter.elements2segments(svg.graphic_elements)
+        assert isinstance(segments, MarkerSegments)
+        assert segments.element_stops[0] + 1 == segments.element_starts[1]
+        assert segments.element_stops[-1] == len(segments.path)
+
+    def test_index_error(self) -> None:
+        segments = PathConverter.elements2segments(ELEMENTS[:1])
+        with pytest.raises(IndexError):
+            segments.element(1)
+        with pytest.raises(IndexError):
+            segments.subpath(3)
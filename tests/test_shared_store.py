@@ -0,0 +1,67 @@
+import multiprocessing
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from svg_pltmarker import SharedMarkerStore, get_marker_from_svg
+
+MARKERS = {
+    "circle": get_marker_from_svg(svgstr='<svg><circle cx="5" cy="5" r="5"/></svg>'),
+    "triangle": get_marker_from_svg(
+        svgstr='<svg><path d="M 0,0 L 10,0 L 5,10 Z"/></svg>'
+    ),
+}
+
+
+def _vertex_sum(store: SharedMarkerStore) -> float:
+    return float(store["triangle"].vertices.sum())
+
+
+class TestSharedMarkerStore:
+    def test_create_attach(self) -> None:
+        with SharedMarkerStore.create(MARKERS) as store:
+            assert store.is_owner
+            assert list(store) == ["circle", "triangle"] and len(store) == 2
+            attached = SharedMarkerStore.attach(store.name)
+            assert not attached.is_owner
+            marker = attached["circle"]
+            np.testing.assert_array_equal(marker.vertices, MARKERS["circle"].vertices)
+            assert not marker.vertices.flags.writeable
+            with pytest.raises(PermissionError):
+                attached.unlink()
+            attached.close()
+        with pytest.raises(FileNotFoundError):
+            SharedMarkerStore.attach(store.name)
+
+    def test_pickle(self) -> None:
+        with SharedMarkerStore.create(MARKERS) as store:
+            unpickled = pickle.loads(pickle.dumps(store))
+            assert unpickled.name == store.name and not unpickled.is_owner
+            np.testing.assert_array_equal(
+                unpickled["triangle"].codes, MARKERS["triangle"].codes
+            )
+            unpickled.close()
+
+    @pytest.mark.parametrize("method", ["fork", "spawn"], ids=["fork", "spawn"])
+    def test_processes(self, method: str) -> None:
+        expected = float(MARKERS["triangle"].vertices.sum())
+        with SharedMarkerStore.create(MARKERS) as store:
+            context = multiprocessing.get_context(method)
+            with context.Pool(2) as pool:
+                assert pool.map(_vertex_sum, [store] * 4) == [expected] * 4
+            # Workers exiting do not unlink the block
+            assert _vertex_sum(SharedMarkerStore.attach(store.name)) == expected
+
+    def test_unrelated_process(self) -> None:
+        expected = float(MARKERS["triangle"].vertices.sum())
+        with SharedMarkerStore.create(MARKERS) as store:
+            code = (
+                "from svg_pltmarker import SharedMarkerStore; "
+                f"SharedMarkerStore.attach({store.name!r}).close()"
+            )
+            subprocess.run([sys.executable, "-c", code], check=True)
+            # The tracker of the unrelated process does not unlink the block
+            assert _vertex_sum(SharedMarkerStore.attach(store.name)) == expected
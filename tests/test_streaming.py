@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from svg_pltmarker import (
+    PathConverter,
+    ResourceLimitExceeded,
+    ResourceLimits,
+    chunks2plt,
+    iter_path_blocks,
+    metrics_registry,
+)
+
+SVG_PATHS = [
+    "M 10,10 L 20,-5.5 30,.5 H 40 V -7 Z",
+    "m 1,2 3,4 5,6 c 1,1 2,2 3,3 s 4,4 5,5 q 1,2 3,4 t 5,6 z M 1,1 l 100,1",
+    "M 0,0 A 10 20 30 1 0 50,50 a 5,5 0 0 1 10,0 Z m 1.5.5-1-2",
+    "M-1-2L3.25.5.75-1C1,2,3,4,5,6S7,8,9,10",
+]
+
+
+def split(text: str, size: int) -> list[str]:
+    return [text[idx : idx + size] for idx in range(0, len(text), size)]  # noqa: E203
+
+
+class TestStreaming:
+    @pytest.mark.parametrize(
+        "svg_path", SVG_PATHS, ids=["line", "curve", "arc", "dense"]
+    )
+    @pytest.mark.parametrize(
+        ("chunk_size", "block_size"),
+        [(1, 1), (2, 3), (7, 2), (1000, 100)],
+        ids=["char", "tiny", "small", "whole"],
+    )
+    def test_same_as_svg2plt(
+        self, svg_path: str, chunk_size: int, block_size: int
+    ) -> None:
+        expected = PathConverter._parse(svg_path)
+        blocks = list(iter_path_blocks(split(svg_path, chunk_size), block_size))
+        assert all(len(vertices) == block_size for vertices, _ in blocks[:-1])
+        assert 0 < len(blocks[-1][0]) <= block_size
+        np.testing.assert_array_equal(
+            np.concatenate([vertices for vertices, _ in blocks]), expected[0]
+        )
+        np.testing.assert_array_equal(
+            np.concatenate([codes for _, codes in blocks]), expected[1]
+        )
+
+    def test_chunks2plt(self) -> None:
+        svg_path = SVG_PATHS[2]
+        expected = PathConverter.svg2plt(svg_path)
+        path = chunks2plt(split(svg_path, 5), block_size=4)
+        np.testing.assert_array_equal(path.vertices, expected.vertices)
+        np.testing.assert_array_equal(path.codes, expected.codes)
+
+    def test_bytes(self) -> None:
+        svg_path = "M 1,2 L 3,4 　L 5,6"  # A multibyte space split between chunks
+        data = svg_path.encode("utf-8")
+        path = chunks2plt([data[:13], data[13:14], data[14:]])
+        np.testing.assert_array_equal(
+            path.vertices, PathConverter.svg2plt(svg_path).vertices
+        )
+
+    def test_long_command(self) -> None:
+        coordinates = np.arange(20000, dtype=np.float64).reshape(-1, 2) % 97
+        svg_path = "M " + " ".join(f"{value:g}" for value in coordinates.ravel())
+        blocks = iter_path_blocks(split(svg_path, 4096), block_size=1000)
+        vertices = np.concatenate([vertices for vertices, _ in blocks])
+        np.testing.assert_array_equal(vertices, coordinates)
+
+    def test_metrics(self) -> None:
+        metrics_registry.reset()
+        list(iter_path_blocks(split(SVG_PATHS[1], 3), block_size=2))
+        counters = metrics_registry.snapshot()["counters"]
+        assert counters["commands.M"] == 2 and counters["commands.S"] == 1
+        assert counters["vertices"] == len(PathConverter._parse(SVG_PATHS[1])[0])
+
+    @pytest.mark.parametrize(
+        ("svg_path", "message"),
+        [
+            ("", "No command found"),
+            ("L 1,2", "First command must be MoveTo"),
+            ("M 1,2 Z L 3,4", "Z is not followed by M"),
+            ("M 1,2 L 3", None),
+        ],
+        ids=["empty", "not_move", "close", "arguments"],
+    )
+    def test_invalid(self, svg_path: str, message: str | None) -> None:
+        with pytest.raises(AssertionError, match=message):
+            list(iter_path_blocks(split(svg_path, 2)))
+
+    def test_limits(self) -> None:
+        svg_path = "M 0,0 " + "L 1,1 " * 1000
+        with pytest.raises(ResourceLimitExceeded, match="vertices"):
+            list(iter_path_blocks([svg_path], limits=ResourceLimits(max_vertices=100)))
+
+    def test_invalid_block_size(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_path_blocks(["M 0,0"], block_size=0))
@@ -0,0 +1,146 @@
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from svg_pltmarker import MarkerBundle, MarkerWatcher, WatchChanges, get_marker_from_svg
+
+CIRCLE = '<svg><circle cx="5" cy="5" r="5"/></svg>'
+SQUARE = '<svg><rect x="0" y="0" width="10" height="10"/></svg>'
+TRIANGLE = '<svg><path d="M 0,0 L 10,0 L 5,10 Z"/></svg>'
+
+
+def wait_until(condition: Callable[[], bool], timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "Timed out"
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def icon_dir(tmp_path: Path) -> Path:
+    root = tmp_path / "icons"
+    (root / "shapes").mkdir(parents=True)
+    (root / "circle.svg").write_text(CIRCLE)
+    (root / "shapes" / "square.svg").write_text(SQUARE)
+    (root / "notes.txt").write_text("not an icon")
+    return root
+
+
+class TestMarkerWatcher:
+    def test_sync(self, icon_dir: Path) -> None:
+        watcher = MarkerWatcher(icon_dir)
+        changes = watcher.sync()
+        assert sorted(changes.added) == ["circle", "shapes/square"]
+        assert sorted(watcher) == ["circle", "shapes/square"]
+        assert not watcher.sync()
+
+        snapshot = watcher.markers
+        (icon_dir / "circle.svg").write_text(TRIANGLE)
+        (icon_dir / "shapes" / "square.svg").unlink()
+        (icon_dir / "shapes" / "triangle.svg").write_text(TRIANGLE)
+        changes = watcher.sync()
+        assert changes.model_dump() == {
+            "added": ["shapes/triangle"],
+            "updated": ["circle"],
+            "removed": ["shapes/square"],
+            "failed": {},
+        }
+        np.testing.assert_array_equal(
+            watcher["circle"].vertices, get_marker_from_svg(svgstr=TRIANGLE).vertices
+        )
+        assert "shapes/square" in snapshot  # Snapshots are not modified
+
+    def test_sync_unchanged_content(self, icon_dir: Path) -> None:
+        watcher = MarkerWatcher(icon_dir)
+        watcher.sync()
+        marker = watcher["circle"]
+        stat = os.stat(icon_dir / "circle.svg")
+        os.utime(
+            icon_dir / "circle.svg", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9)
+        )
+        assert not watcher.sync()
+        assert watcher["circle"] is marker
+
+    def test_sync_failure(self, icon_dir: Path) -> None:
+        watcher = MarkerWatcher(icon_dir)
+        watcher.sync()
+        marker = watcher["circle"]
+        (icon_dir / "circle.svg").write_text("<svg>")
+        changes = watcher.sync()
+        assert list(changes.failed) == ["circle"]
+        assert watcher["circle"] is marker  # The last good marker is kept
+
+    def test_bundle(self, icon_dir: Path, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "icons.bundle"
+        watcher = MarkerWatcher(icon_dir, bundle_path=bundle_path)
+        watcher.sync()
+        with MarkerBundle(bundle_path) as bundle:
+            assert sorted(bundle) == ["circle", "shapes/square"]
+            (icon_dir / "triangle.svg").write_text(TRIANGLE)
+            watcher.sync()
+            assert len(bundle) == 2  # The open bundle maps the replaced file
+        with MarkerBundle(bundle_path) as bundle:
+            assert sorted(bundle) == ["circle", "shapes/square", "triangle"]
+        assert sorted(os.listdir(tmp_path)) == ["icons", "icons.bundle"]
+
+    def test_bundle_retry(self, icon_dir: Path, tmp_path: Path) -> None:
+        bundle_path = tmp_path / "bundles" / "icons.bundle"
+        watcher = MarkerWatcher(icon_dir, bundle_path=bundle_path)
+        with pytest.raises(OSError):
+            watcher.sync()  # The bundle directory is missing
+        assert len(watcher) == 0
+        bundle_path.parent.mkdir()
+        assert watcher.sync().added == ["circle", "shapes/square"]
+        with MarkerBundle(bundle_path) as bundle:
+            assert sorted(bundle) == ["circle", "shapes/square"]
+
+    @pytest.mark.parametrize("backend", ["inotify", "polling"])
+    def test_watch(self, icon_dir: Path, backend: str) -> None:
+        calls: list[WatchChanges] = []
+        with MarkerWatcher(
+            icon_dir,
+            debounce=0.3,
+            interval=0.05,
+            backend=backend,
+            on_change=calls.append,
+        ) as watcher:
+            assert len(calls) == 1  # The initial sync
+            (icon_dir / "shapes" / "new").mkdir()
+            for cx in range(10):  # A burst of saves
+                (icon_dir / "shapes" / "new" / "dot.svg").write_text(
+                    CIRCLE.replace('cx="5"', f'cx="{cx}"')
+                )
+                time.sleep(0.01)
+            wait_until(lambda: "shapes/new/dot" in watcher)
+            (icon_dir / "circle.svg").unlink()
+            wait_until(lambda: "circle" not in watcher)
+        assert calls[1].added == ["shapes/new/dot"]
+        assert len(calls) == 3
+
+    def test_watch_error(self, icon_dir: Path) -> None:
+        calls: list[WatchChanges] = []
+
+        def on_change(changes: WatchChanges) -> None:
+            calls.append(changes)
+            if len(calls) == 2:
+                raise RuntimeError("Failed to handle the changes")
+
+        with MarkerWatcher(
+            icon_dir, debounce=0.1, interval=0.05, on_change=on_change
+        ) as watcher:
+            (icon_dir / "triangle.svg").write_text(TRIANGLE)
+            wait_until(lambda: watcher.last_error is not None)
+            assert str(watcher.last_error) == "Failed to handle the changes"
+            (icon_dir / "circle.svg").unlink()  # Still watching
+            wait_until(lambda: "circle" not in watcher)
+        assert [changes.removed for changes in calls] == [[], [], ["circle"]]
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            MarkerWatcher(tmp_path / "missing")
+        with pytest.raises(ValueError):
+            MarkerWatcher(tmp_path, backend="unknown")